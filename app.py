@@ -1,37 +1,145 @@
 import os
+import re
+import uuid
+import hashlib
+import queue
+import atexit
+import tempfile
 import logging
-import requests
-from flask import Flask, render_template, request, jsonify
+import threading
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from cachetools import TTLCache
+from concurrent.futures import Future, ThreadPoolExecutor
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 from dotenv import load_dotenv
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from hubspot_client import search_hubspot_contact, create_hubspot_contact, log_hubspot_note, get_contact_deals, search_hubspot_deals, update_hubspot_deal, create_hubspot_deal, create_hubspot_task
+from hubspot_client import search_hubspot_contact, search_hubspot_contacts_multi, get_hubspot_contact_by_id, get_recent_contacts, RECENT_CONTACT_FIELDS, RECENT_CONTACTS_CACHE_TTL_SECONDS, format_contact_name, create_hubspot_contact, log_hubspot_note, get_contact_deals, search_hubspot_deals, update_hubspot_deal, create_hubspot_deal, create_hubspot_task
 from notion_client import (
     search_investor_preferences,
     get_page_properties,
     update_page_properties,
     create_investor_page,
-    create_todo_item
+    create_todo_item,
+    NOTION_MAX_CONCURRENT_TODOS
 )
-from claude_parser import parse_meeting_notes
-from call_preparer import prepare_call_brief, synthesize_brief_with_claude
+from claude_parser import parse_meeting_notes, PARSER_MODEL, PROMPT_VERSION
+from parse_cache import make_parse_cache_key, get_cached_parse, store_parse
+from call_preparer import prepare_call_brief, synthesize_brief_with_claude, stream_brief_with_claude
 from deal_reminder import send_daily_deal_reminders
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
+# Request threads only enqueue records; a background listener formats and writes them
+log_queue = queue.Queue(-1)
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, log_stream_handler, respect_handler_level=True)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',  # Full record layout is applied by the listener's handler
+    handlers=[QueueHandler(log_queue)],
+    force=True  # Replace handlers installed by imported modules
 )
+log_listener.start()
+atexit.register(log_listener.stop)
+_log_listener_pid = os.getpid()
 logger = logging.getLogger(__name__)
 
+
+def ensure_log_listener():
+    """
+    Restart the log listener in a forked process
+
+    Threads don't survive fork, so when gunicorn preloads the app the workers
+    inherit the queue but not the listener thread draining it.
+    """
+    global log_listener, _log_listener_pid
+
+    if _log_listener_pid == os.getpid():
+        return
+
+    log_listener = QueueListener(log_queue, log_stream_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    _log_listener_pid = os.getpid()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+
+    Used by jsonify() for every response. Keys stay sorted like Flask's default,
+    and datetimes/dataclasses etc. fall back to Flask's default serializer.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# In-memory registry of background jobs, kept for an hour so the frontend can
+# poll for results. Jobs live in the worker process that accepted them.
+_jobs = TTLCache(maxsize=1000, ttl=60 * 60)
+_jobs_lock = threading.Lock()
+_job_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='job')
+
+# Responses of confirm-and-execute keyed by the client's Idempotency-Key, so a
+# double-submitted confirmation replays the first response instead of writing
+# everything twice. A key maps to (body hash, response) and the response is
+# None while its first request is running. Keys whose job fails or reports
+# errors are dropped so the confirmation can be retried.
+IDEMPOTENCY_TTL_SECONDS = 5 * 60
+_idempotent_responses = TTLCache(maxsize=4096, ttl=IDEMPOTENCY_TTL_SECONDS)
+_idempotency_lock = threading.Lock()
+
+# prepare-call work in flight, keyed by normalized query. Concurrent identical
+# requests wait on the first one's Future instead of repeating the HubSpot,
+# Serper and Claude calls.
+_inflight_briefs = {}
+_inflight_briefs_lock = threading.Lock()
+
+# Cap request bodies (meeting notes are sent twice in confirm-and-execute)
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024
+
+# Compress JSON and static responses. The SSE stream is left out so tokens
+# are flushed to the browser as they arrive instead of sitting in a buffer.
+app.config['COMPRESS_MIMETYPES'] = [
+    'application/json',
+    'text/html',
+    'text/css',
+    'application/javascript',
+    'text/javascript'
+]
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
 # Environment variables
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 HUBSPOT_API_KEY = os.getenv('HUBSPOT_API_KEY')
@@ -41,6 +149,11 @@ NOTION_INVESTOR_PREFS_DB_ID = os.getenv('NOTION_INVESTOR_PREFS_DB_ID')
 NOTION_TODOS_DB_ID = os.getenv('NOTION_TODOS_DB_ID')
 SERPER_API_KEY = os.getenv('SERPER_API_KEY')  # Optional: For web search functionality
 
+# Contact record links only vary by contact ID, so the portal prefix is built once
+HUBSPOT_CONTACT_URL_BASE = (
+    f"https://app.hubspot.com/contacts/{HUBSPOT_PORTAL_ID}/contact/" if HUBSPOT_PORTAL_ID else None
+)
+
 # Email reminder configuration
 REMINDER_EMAIL_TO = os.getenv('REMINDER_EMAIL_TO')
 REMINDER_EMAIL_FROM = os.getenv('REMINDER_EMAIL_FROM')
@@ -52,6 +165,11 @@ SMTP_PASSWORD = os.getenv('SMTP_PASSWORD')
 REMINDER_ENABLED = os.getenv('REMINDER_ENABLED', 'false').lower() == 'true'
 REMINDER_TIME = os.getenv('REMINDER_TIME', '08:00')  # Default: 8 AM
 
+# Background scheduler for daily reminders (started by start_reminder_scheduler)
+scheduler = None
+SCHEDULER_LOCK_PATH = os.path.join(tempfile.gettempdir(), 'notion-hubspot-reminder-scheduler.lock')
+_scheduler_lock_file = None
+
 
 def run_daily_reminder_job():
     """
@@ -61,7 +179,7 @@ def run_daily_reminder_job():
     start_time = time.time()
     logger.info("=" * 80)
     logger.info("Running scheduled daily deal reminder job")
-    logger.info(f"Start time: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}")
+    logger.info("Start time: %s", time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()))
     logger.info("=" * 80)
 
     try:
@@ -83,7 +201,7 @@ def run_daily_reminder_job():
             logger.warning("No email service configured (neither Resend nor SMTP) - skipping reminder")
             return
 
-        logger.info(f"Config check passed - elapsed: {time.time() - start_time:.2f}s")
+        logger.info("Config check passed - elapsed: %.2fs", time.time() - start_time)
 
         # Send reminders
         logger.info("Calling send_daily_deal_reminders...")
@@ -102,30 +220,292 @@ def run_daily_reminder_job():
         )
 
         elapsed = time.time() - start_time
-        logger.info(f"send_daily_deal_reminders completed - elapsed: {elapsed:.2f}s")
+        logger.info("send_daily_deal_reminders completed - elapsed: %.2fs", elapsed)
 
         if result['success']:
-            logger.info(f"✓ Daily reminder completed: {result['message']}")
-            logger.info(f"  - Deals due: {result.get('deals_found', 0)}")
-            logger.info(f"  - Tasks due: {result.get('tasks_found', 0)}")
-            logger.info(f"  - Todos due: {result.get('todos_found', 0)}")
-            logger.info(f"  - Overdue deals: {result.get('overdue_deals_found', 0)}")
-            logger.info(f"  - Overdue tasks: {result.get('overdue_tasks_found', 0)}")
-            logger.info(f"  - Overdue todos: {result.get('overdue_todos_found', 0)}")
-            logger.info(f"  - Email sent: {result.get('email_sent', False)}")
+            logger.info("✓ Daily reminder completed: %s", result['message'])
+            logger.info("  - Deals due: %s", result.get('deals_found', 0))
+            logger.info("  - Tasks due: %s", result.get('tasks_found', 0))
+            logger.info("  - Todos due: %s", result.get('todos_found', 0))
+            logger.info("  - Overdue deals: %s", result.get('overdue_deals_found', 0))
+            logger.info("  - Overdue tasks: %s", result.get('overdue_tasks_found', 0))
+            logger.info("  - Overdue todos: %s", result.get('overdue_todos_found', 0))
+            logger.info("  - Email sent: %s", result.get('email_sent', False))
         else:
-            logger.error(f"✗ Daily reminder failed: {result.get('error', 'Unknown error')}")
+            logger.error("✗ Daily reminder failed: %s", result.get('error', 'Unknown error'))
 
         logger.info("=" * 80)
-        logger.info(f"Total execution time: {elapsed:.2f}s")
+        logger.info("Total execution time: %.2fs", elapsed)
         logger.info("=" * 80)
 
     except Exception as e:
         elapsed = time.time() - start_time
-        logger.error(f"✗ Error in daily reminder job after {elapsed:.2f}s: {str(e)}", exc_info=True)
+        logger.exception("✗ Error in daily reminder job after %.2fs: %s", elapsed, e)
         logger.error("=" * 80)
 
 
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+NAME_WORD_PATTERN = re.compile(r'\w{2,}')
+
+
+def _looks_like_email(value):
+    """Cheap syntactic check that a parsed email is worth searching for"""
+    return bool(value) and EMAIL_PATTERN.match(value) is not None
+
+
+def _looks_like_name(value):
+    """Cheap check that a parsed person/company name contains at least one real word"""
+    return bool(value) and NAME_WORD_PATTERN.search(value) is not None
+
+
+def _normalize_contact(contact):
+    """Strip whitespace from the string fields of a parsed contact"""
+    return {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in (contact or {}).items()
+    }
+
+
+def _contact_identifiers(contact_info):
+    """
+    Pick the HubSpot search identifiers from a normalized contact
+
+    Identifiers that can't match anything (blank, malformed email, no real
+    word in a name) are treated as missing so they never reach HubSpot.
+
+    Args:
+        contact_info (dict): Contact fields from the parsed notes
+
+    Returns:
+        tuple: (email, person_name, company_query), each None when unusable
+    """
+    email = contact_info.get('email')
+    email = email if _looks_like_email(email) else None
+    person_name = contact_info.get('person_name')
+    person_name = person_name if _looks_like_name(person_name) else None
+    # Only search by company name if no person name was provided at all
+    company_query = contact_info.get('company_name') if not person_name else None
+    company_query = company_query if _looks_like_name(company_query) else None
+    return email, person_name, company_query
+
+
+def _contact_search_queries(email, person_name, company_query):
+    """Return the identifiers worth searching, in precedence order"""
+    return [q for q in (email, person_name, company_query) if q]
+
+
+def _get_json():
+    """
+    Parse the JSON request body with orjson
+
+    Reads the raw body without caching it on the request object, which
+    is faster than request.get_json() for large meeting notes.
+
+    Returns:
+        dict or list: Parsed body, or None if the body is empty or not valid JSON
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+
+
+# Required non-blank string fields per endpoint: (field, error if missing,
+# error if blank). Shared by _validate_required_text so checks can't drift.
+PROCESS_NOTES_FIELDS = (('notes', 'No notes provided', 'Notes cannot be empty'),)
+CREATE_CONTACT_FIELDS = tuple(
+    (field, 'Missing required fields: email, firstname, lastname', 'Missing required fields: email, firstname, lastname')
+    for field in ('email', 'firstname', 'lastname')
+)
+SEARCH_QUERY_FIELDS = (('query', 'No query provided', 'Query cannot be empty'),)
+PREPARE_CALL_FIELDS = (('query', 'Query parameter is required', 'Query parameter is required'),)
+SEARCH_INVESTOR_FIELDS = (('company_name', 'No company_name provided', 'Company name cannot be empty'),)
+CREATE_DEAL_FIELDS = (
+    ('deal_name', 'Deal name is required', 'Deal name is required'),
+    ('stage', 'Deal stage is required', 'Deal stage is required'),
+    ('next_step', 'Next step is required', 'Next step is required'),
+)
+# Optional string fields: may be absent, null or blank, but not another type
+CREATE_DEAL_OPTIONAL_FIELDS = ('next_step_date', 'contact_id')
+
+# Structured fields that may be absent or null but must otherwise have the
+# given JSON type: (field, Python type, type name for the error message).
+# Checked by _validate_field_types.
+PROCESS_NOTES_TYPES = (('actions', dict, 'an object'),)
+CONFIRM_TYPES = (
+    ('hubspot', dict, 'an object'),
+    ('notion', dict, 'an object'),
+    ('summary', list, 'a list'),
+    ('preferences', dict, 'an object'),
+    ('todos', list, 'a list'),
+)
+CONFIRM_HUBSPOT_TYPES = (
+    ('summary', list, 'a list'),
+    ('deals', list, 'a list'),
+    ('future_task', dict, 'an object'),
+)
+CONFIRM_NOTION_TYPES = (
+    ('preferences', dict, 'an object'),
+    ('todos', list, 'a list'),
+)
+
+
+def _validate_required_text(data, fields):
+    """
+    Check a JSON body against an endpoint's required text fields
+
+    Args:
+        data: Parsed request body (None if empty or invalid)
+        fields (tuple): (field, missing error, blank error) entries
+
+    Returns:
+        str: Error message for a 400 response, or None if the body is valid
+    """
+    if not isinstance(data, dict):
+        data = {}
+
+    for field, missing_error, blank_error in fields:
+        value = data.get(field)
+        if value is None:
+            return missing_error
+        if not isinstance(value, str):
+            return f'{field} must be a string'
+        if not value.strip():
+            return blank_error
+
+    return None
+
+
+def _validate_field_types(data, fields, prefix=''):
+    """
+    Check that a JSON body is an object and its structured fields have the right types
+
+    Args:
+        data: Parsed request body or nested object (None if empty or invalid)
+        fields (tuple): (field, type, type name) entries
+        prefix (str): Path of a nested object, used in error messages
+
+    Returns:
+        str: Error message for a 400 response, or None if the types are valid
+    """
+    if not isinstance(data, dict):
+        return f'{prefix.rstrip(".")} must be an object' if prefix else 'Request body must be a JSON object'
+
+    for field, expected_type, type_name in fields:
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected_type):
+            return f'{prefix}{field} must be {type_name}'
+
+    return None
+
+
+def _validate_optional_text(data, fields):
+    """
+    Check that an endpoint's optional text fields are strings when present
+
+    Args:
+        data (dict): Parsed request body (already checked to be a dict)
+        fields (tuple): Optional field names
+
+    Returns:
+        str: Error message for a 400 response, or None if the fields are valid
+    """
+    for field in fields:
+        value = data.get(field)
+        if value is not None and not isinstance(value, str):
+            return f'{field} must be a string'
+
+    return None
+
+
+@app.before_request
+def reject_oversized_body():
+    """Reject bodies over MAX_CONTENT_LENGTH before the route's error handling sees them"""
+    max_length = app.config['MAX_CONTENT_LENGTH']
+    if request.content_length is not None and request.content_length > max_length:
+        return jsonify({'error': f'Request body too large (limit {max_length // (1024 * 1024)} MB)'}), 413
+
+
+def _acquire_scheduler_lock():
+    """
+    Take a host-wide lock so only one server process runs the reminder scheduler
+
+    Gunicorn starts one copy of the app per worker; without this each worker
+    would send its own copy of the daily email. The lock is held until the
+    process exits, at which point a replacement worker can take it over.
+
+    Returns:
+        bool: True if this process should run the scheduler
+    """
+    global _scheduler_lock_file
+
+    if fcntl is None:
+        return True  # No flock on this platform (local development only)
+
+    lock_file = open(SCHEDULER_LOCK_PATH, 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+
+    _scheduler_lock_file = lock_file
+    return True
+
+
+def start_reminder_scheduler():
+    """
+    Set up the scheduled job for daily deal reminders
+
+    Called from __main__ for the development server and from the gunicorn
+    post_worker_init hook in production.
+    """
+    global scheduler
+
+    if scheduler is not None:
+        return
+
+    if REMINDER_ENABLED:
+        logger.info("Setting up daily deal reminder scheduler")
+
+        # Parse reminder time (format: HH:MM)
+        try:
+            hour, minute = map(int, REMINDER_TIME.split(':'))
+            logger.info("Daily reminders scheduled for %02d:%02d UTC", hour, minute)
+
+            if not _acquire_scheduler_lock():
+                logger.info("Reminder scheduler already running in another worker process")
+                return
+
+            scheduler = BackgroundScheduler()
+
+            # Schedule the job to run daily at the specified time (UTC)
+            scheduler.add_job(
+                func=run_daily_reminder_job,
+                trigger=CronTrigger(hour=hour, minute=minute),
+                id='daily_deal_reminder',
+                name='Send daily deal reminders',
+                replace_existing=True
+            )
+
+            scheduler.start()
+            logger.info("Daily deal reminder scheduler started successfully")
+
+            # Optional: Run once on startup for testing (comment out in production)
+            # logger.info("Running initial reminder check on startup")
+            # run_daily_reminder_job()
+
+        except ValueError:
+            logger.error("Invalid REMINDER_TIME format: %s. Expected HH:MM", REMINDER_TIME)
+        except Exception as e:
+            logger.exception("Failed to start reminder scheduler: %s", e)
+    else:
+        logger.info("Daily deal reminders are disabled (REMINDER_ENABLED=false)")
+
+
 @app.route('/')
 def home():
     """Serve the main frontend page"""
@@ -180,7 +560,7 @@ def trigger_reminder():
 
     except Exception as e:
         elapsed = time.time() - start_time
-        logger.error(f"Error in manual reminder trigger: {str(e)}", exc_info=True)
+        logger.exception("Error in manual reminder trigger: %s", e)
         return jsonify({
             'success': False,
             'error': str(e),
@@ -200,115 +580,169 @@ def process_notes():
     4. Return to frontend for user approval
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
-        if not data or 'notes' not in data:
-            return jsonify({'error': 'No notes provided'}), 400
+        error = (_validate_required_text(data, PROCESS_NOTES_FIELDS)
+                 or _validate_field_types(data, PROCESS_NOTES_TYPES))
+        if error:
+            return jsonify({'error': error}), 400
 
-        notes = data.get('notes', '').strip()
-
-        if not notes:
-            return jsonify({'error': 'Notes cannot be empty'}), 400
+        notes = data['notes'].strip()
 
         # Get action flags from frontend
-        actions = data.get('actions', {})
-        enable_hubspot_note = actions.get('enable_hubspot_note', True)
-        enable_investor_prefs = actions.get('enable_investor_prefs', True)
-        enable_todos = actions.get('enable_todos', True)
-
-        logger.info(f"Processing notes with length: {len(notes)}")
-        logger.info(f"Actions enabled - HubSpot: {enable_hubspot_note}, Investor Prefs: {enable_investor_prefs}, TODOs: {enable_todos}")
-
-        # STEP 1: Parse notes with Claude
-        parse_result = parse_meeting_notes(
-            notes,
-            ANTHROPIC_API_KEY,
-            parse_preferences=enable_investor_prefs,
-            parse_todos=enable_todos
-        )
-
-        if not parse_result['success']:
-            return jsonify({'error': f'Failed to parse notes: {parse_result["error"]}'}), 500
-
-        parsed_data = parse_result['data']
-        contact_info = parsed_data.get('contact', {})
-        deal_info = parsed_data.get('deal', {})
-        summary = parsed_data.get('summary', [])
-        preferences = parsed_data.get('preferences', {})
-        todos = parsed_data.get('todos', [])
-
-        logger.info(f"Parsed data - Contact: {contact_info.get('company_name')}, "
-                   f"Deal: {deal_info.get('deal_name', 'None')}, "
-                   f"Summary: {len(summary)} bullets, TODOs: {len(todos)}")
+        actions = data.get('actions') or {}
+        # Flags are truthiness checks; coerce so they hash as parser/cache keys
+        enable_hubspot_note = bool(actions.get('enable_hubspot_note', True))
+        enable_investor_prefs = bool(actions.get('enable_investor_prefs', True))
+        enable_todos = bool(actions.get('enable_todos', True))
+
+        logger.info("Processing notes with length: %s", len(notes))
+        logger.info("Actions enabled - HubSpot: %s, Investor Prefs: %s, TODOs: %s", enable_hubspot_note, enable_investor_prefs, enable_todos)
+
+        # HubSpot/Notion searches share one executor; the contact search may be
+        # started while Claude is still streaming the rest of the parse
+        executor = ThreadPoolExecutor(max_workers=3)
+        early_contact_search = {}
+
+        def start_contact_search(streamed_contact):
+            """Kick off the HubSpot contact search as soon as the contact block is parsed"""
+            queries = _contact_search_queries(*_contact_identifiers(_normalize_contact(streamed_contact)))
+            if queries:
+                logger.info("Starting HubSpot contact search while parsing continues")
+                early_contact_search['queries'] = queries
+                early_contact_search['future'] = executor.submit(search_hubspot_contacts_multi, queries, HUBSPOT_API_KEY)
 
-        # STEP 2: Search HubSpot for contact
-        hubspot_contacts = []
-        contact_search_status = 'not_found'
+        try:
+            # STEP 1: Parse notes with Claude (resubmitted notes reuse the cached parse
+            # unless ?no_cache=1 forces a fresh one)
+            cache_key = make_parse_cache_key(notes, enable_investor_prefs, enable_todos, PROMPT_VERSION, PARSER_MODEL)
+            parse_result = None
+            if request.args.get('no_cache') != '1':
+                parse_result = get_cached_parse(cache_key)
+                if parse_result:
+                    logger.info("Using cached parse result")
+
+            if parse_result is None:
+                parse_result = parse_meeting_notes(
+                    notes,
+                    ANTHROPIC_API_KEY,
+                    parse_preferences=enable_investor_prefs,
+                    parse_todos=enable_todos,
+                    on_contact=start_contact_search
+                )
+                if parse_result['success']:
+                    store_parse(cache_key, parse_result)
+
+            if not parse_result['success']:
+                return jsonify({'error': f'Failed to parse notes: {parse_result["error"]}'}), 500
+
+            parsed_data = parse_result['data']
+            # Normalize parsed contact fields once so every check below sees trimmed values
+            contact_info = _normalize_contact(parsed_data.get('contact'))
+            deal_info = parsed_data.get('deal', {})
+            summary = parsed_data.get('summary', [])
+            preferences = parsed_data.get('preferences', {})
+            todos = parsed_data.get('todos', [])
+
+            logger.info("Parsed data - Contact: %s, Deal: %s, Summary: %s bullets, TODOs: %s",
+                        contact_info.get('company_name'), deal_info.get('deal_name', 'None'),
+                        len(summary), len(todos))
+
+            # STEP 2: Search HubSpot for contact (deal and investor searches run alongside)
+            hubspot_contacts = []
+            contact_search_status = 'not_found'
+
+            # Look up every applicable identifier in one batched search, then apply
+            # the precedence email > person name > company to the per-query results
+            email, person_name, company_query = _contact_identifiers(contact_info)
+            search_queries = _contact_search_queries(email, person_name, company_query)
+
+            # Deal and investor lookups only depend on the parsed notes, so all three
+            # searches are issued concurrently and their results consumed below
+            deal_search_term = None
+            if deal_info:
+                deal_search_term = deal_info.get('deal_name') or deal_info.get('search_keywords')
+
+            # Search for investor if we have a company name and preferences were parsed
+            investor_company = contact_info.get('company_name') if preferences else None
+
+            contacts_future = deals_future = investor_future = None
+            if search_queries:
+                # Reuse the search started mid-stream when the final contact agrees with it
+                if early_contact_search.get('queries') == search_queries:
+                    contacts_future = early_contact_search['future']
+                else:
+                    contacts_future = executor.submit(search_hubspot_contacts_multi, search_queries, HUBSPOT_API_KEY)
+            if deal_search_term:
+                logger.info("Searching for deal: %s", deal_search_term)
+                deals_future = executor.submit(search_hubspot_deals, deal_search_term, HUBSPOT_API_KEY)
+            if investor_company:
+                logger.info("Searching Notion for investor: %s", investor_company)
+                investor_future = executor.submit(
+                    search_investor_preferences,
+                    investor_company,
+                    NOTION_INVESTOR_PREFS_DB_ID,
+                    NOTION_API_KEY
+                )
+        finally:
+            # Submitted searches finish in the background; results are read below
+            executor.shutdown(wait=False)
+
+        matches = {}
+        if contacts_future:
+            multi_result = contacts_future.result()
+            if multi_result['success']:
+                matches = multi_result['data']
+            for failed_query, search_error in multi_result.get('errors', {}).items():
+                logger.warning("HubSpot contact search failed for '%s': %s", failed_query, search_error)
 
         # Try by email first (most reliable)
-        if contact_info.get('email'):
-            email_result = search_hubspot_contact(contact_info['email'], HUBSPOT_API_KEY)
-            if email_result['success'] and email_result['data']:
-                hubspot_contacts = email_result['data']
-                contact_search_status = 'found_by_email'
-                logger.info(f"Found {len(hubspot_contacts)} contact(s) by email")
+        if email and matches.get(email):
+            hubspot_contacts = matches[email]
+            contact_search_status = 'found_by_email'
+            logger.info("Found %s contact(s) by email", len(hubspot_contacts))
 
         # If no email match, try by person name (firstname + lastname)
-        if not hubspot_contacts and contact_info.get('person_name'):
-            person_result = search_hubspot_contact(contact_info['person_name'], HUBSPOT_API_KEY)
-            if person_result['success'] and person_result['data']:
-                hubspot_contacts = person_result['data']
+        if not hubspot_contacts and person_name:
+            if matches.get(person_name):
+                hubspot_contacts = matches[person_name]
                 contact_search_status = 'found_by_person_name'
-                logger.info(f"Found {len(hubspot_contacts)} contact(s) by person name")
+                logger.info("Found %s contact(s) by person name", len(hubspot_contacts))
             else:
                 # Person name was provided but not found - don't fallback to company search
                 # This prevents showing wrong contacts from the same company
-                logger.info(f"Person '{contact_info.get('person_name')}' not found in HubSpot - will need to create new contact")
+                logger.info("Person '%s' not found in HubSpot - will need to create new contact", person_name)
                 contact_search_status = 'person_not_found'
 
-        # Only search by company name if no person name was provided at all
+        # Company results are only used if no person name was provided at all
         # (Don't use company search as a fallback when a specific person wasn't found)
-        if not hubspot_contacts and not contact_info.get('person_name') and contact_info.get('company_name'):
-            company_result = search_hubspot_contact(contact_info['company_name'], HUBSPOT_API_KEY)
-            if company_result['success'] and company_result['data']:
-                hubspot_contacts = company_result['data']
-                contact_search_status = 'found_by_company'
-                logger.info(f"Found {len(hubspot_contacts)} contact(s) by company name")
+        if not hubspot_contacts and company_query and matches.get(company_query):
+            hubspot_contacts = matches[company_query]
+            contact_search_status = 'found_by_company'
+            logger.info("Found %s contact(s) by company name", len(hubspot_contacts))
 
         # STEP 2.5: Search HubSpot for deal if mentioned in notes
         hubspot_deals = []
         deal_search_status = 'not_searched'
 
-        # Check if deal information was extracted
-        if deal_info and (deal_info.get('deal_name') or deal_info.get('search_keywords')):
-            # Use deal_name or search_keywords to search
-            search_term = deal_info.get('deal_name') or deal_info.get('search_keywords')
-
-            if search_term:
-                logger.info(f"Searching for deal: {search_term}")
-                hubspot_deals = search_hubspot_deals(search_term, HUBSPOT_API_KEY)
+        # Check if deal information was extracted (deal_name or search_keywords)
+        if deals_future:
+            hubspot_deals = deals_future.result()
 
-                if hubspot_deals:
-                    deal_search_status = 'found'
-                    logger.info(f"Found {len(hubspot_deals)} deal(s) matching '{search_term}'")
-                else:
-                    deal_search_status = 'not_found'
-                    logger.info(f"No deals found for '{search_term}'")
+            if hubspot_deals:
+                deal_search_status = 'found'
+                logger.info("Found %s deal(s) matching '%s'", len(hubspot_deals), deal_search_term)
+            else:
+                deal_search_status = 'not_found'
+                logger.info("No deals found for '%s'", deal_search_term)
 
         # STEP 2.75: Search Notion for investor if company name was parsed
         notion_investor = None
         investor_search_status = 'not_searched'
 
-        # Search for investor if we have a company name and preferences were parsed
-        if contact_info.get('company_name') and preferences:
-            company_name = contact_info['company_name']
-            logger.info(f"Searching Notion for investor: {company_name}")
-
-            investor_result = search_investor_preferences(
-                company_name,
-                NOTION_INVESTOR_PREFS_DB_ID,
-                NOTION_API_KEY
-            )
+        if investor_future:
+            company_name = investor_company
+            investor_result = investor_future.result()
 
             if investor_result['success'] and investor_result['data']:
                 investors = investor_result['data']
@@ -326,7 +760,7 @@ def process_notes():
                         'name': investor_name or company_name
                     }
                     investor_search_status = 'found_single'
-                    logger.info(f"Found investor in Notion: {investor_name}")
+                    logger.info("Found investor in Notion: %s", investor_name)
                 elif len(investors) > 1:
                     # Extract names for all investors
                     investors_with_names = []
@@ -345,11 +779,11 @@ def process_notes():
                         'investors': investors_with_names
                     }
                     investor_search_status = 'found_multiple'
-                    logger.info(f"Found {len(investors)} investors matching '{company_name}'")
+                    logger.info("Found %s investors matching '%s'", len(investors), company_name)
             else:
                 notion_investor = {'status': 'not_found'}
                 investor_search_status = 'not_found'
-                logger.info(f"No investor found in Notion for: {company_name}")
+                logger.info("No investor found in Notion for: %s", company_name)
 
         # STEP 3: Build preview response
         preview_data = {
@@ -378,7 +812,7 @@ def process_notes():
         return jsonify(response), 200
 
     except Exception as e:
-        logger.error(f"Error processing notes: {str(e)}", exc_info=True)
+        logger.exception("Error processing notes: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -394,20 +828,21 @@ def create_contact():
     - company
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        email = data.get('email', '')
-        firstname = data.get('firstname', '')
-        lastname = data.get('lastname', '')
-        company = data.get('company', '')
+        error = _validate_required_text(data, CREATE_CONTACT_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
 
-        if not email or not firstname or not lastname:
-            return jsonify({'error': 'Missing required fields: email, firstname, lastname'}), 400
+        email = data['email']
+        firstname = data['firstname']
+        lastname = data['lastname']
+        company = data.get('company', '')
 
-        logger.info(f"Creating new HubSpot contact: {email}")
+        logger.info("Creating new HubSpot contact: %s", email)
 
         result = create_hubspot_contact(email, firstname, lastname, company, HUBSPOT_API_KEY)
 
@@ -419,13 +854,13 @@ def create_contact():
             }), 200
         elif result.get('already_exists') and result.get('existing_id'):
             # Contact already exists - fetch the existing contact details
-            logger.info(f"Contact exists, fetching details for ID: {result['existing_id']}")
+            logger.info("Contact exists, fetching details for ID: %s", result['existing_id'])
 
-            # Search by email to get full contact details
-            search_result = search_hubspot_contact(email, HUBSPOT_API_KEY)
+            # Fetch the existing contact directly by ID (no search index lookup)
+            contact_result = get_hubspot_contact_by_id(result['existing_id'], HUBSPOT_API_KEY)
 
-            if search_result['success'] and search_result['data']:
-                existing_contact = search_result['data'][0]
+            if contact_result['success']:
+                existing_contact = contact_result['data']
                 return jsonify({
                     'success': True,
                     'already_exists': True,
@@ -445,7 +880,7 @@ def create_contact():
             return jsonify({'error': result['error']}), 500
 
     except Exception as e:
-        logger.error(f"Error creating contact: {str(e)}", exc_info=True)
+        logger.exception("Error creating contact: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -458,14 +893,18 @@ def select_contact():
     - contact_id: The HubSpot contact ID selected by the user
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
-        if not data or 'contact_id' not in data:
+        error = _validate_field_types(data, ())
+        if error:
+            return jsonify({'error': error}), 400
+
+        if 'contact_id' not in data:
             return jsonify({'error': 'No contact_id provided'}), 400
 
         contact_id = data.get('contact_id')
 
-        logger.info(f"User selected contact ID: {contact_id}")
+        logger.info("User selected contact ID: %s", contact_id)
 
         # Simply return success - the contact_id will be used in confirm-and-execute
         return jsonify({
@@ -475,7 +914,7 @@ def select_contact():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error selecting contact: {str(e)}", exc_info=True)
+        logger.exception("Error selecting contact: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -488,17 +927,15 @@ def search_contact():
     - query: Email or name to search for
     """
     try:
-        data = request.get_json()
-
-        if not data or 'query' not in data:
-            return jsonify({'error': 'No query provided'}), 400
+        data = _get_json()
 
-        query = data.get('query', '').strip()
+        error = _validate_required_text(data, SEARCH_QUERY_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
 
-        if not query:
-            return jsonify({'error': 'Query cannot be empty'}), 400
+        query = data['query'].strip()
 
-        logger.info(f"Re-searching HubSpot for: {query}")
+        logger.info("Re-searching HubSpot for: %s", query)
 
         # Search by query (email or name)
         result = search_hubspot_contact(query, HUBSPOT_API_KEY)
@@ -514,7 +951,7 @@ def search_contact():
             return jsonify({'error': result['error']}), 500
 
     except Exception as e:
-        logger.error(f"Error searching contact: {str(e)}", exc_info=True)
+        logger.exception("Error searching contact: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -527,17 +964,15 @@ def search_investor():
     - company_name: Company name to search for
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
-        if not data or 'company_name' not in data:
-            return jsonify({'error': 'No company_name provided'}), 400
+        error = _validate_required_text(data, SEARCH_INVESTOR_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
 
-        company_name = data.get('company_name', '').strip()
+        company_name = data['company_name'].strip()
 
-        if not company_name:
-            return jsonify({'error': 'Company name cannot be empty'}), 400
-
-        logger.info(f"Re-searching Notion for investor: {company_name}")
+        logger.info("Re-searching Notion for investor: %s", company_name)
 
         # Search in Notion
         result = search_investor_preferences(
@@ -557,7 +992,7 @@ def search_investor():
             return jsonify({'error': result['error']}), 500
 
     except Exception as e:
-        logger.error(f"Error searching investor: {str(e)}", exc_info=True)
+        logger.exception("Error searching investor: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -575,7 +1010,7 @@ def get_deals():
         if not contact_id:
             return jsonify({'error': 'No contact_id provided'}), 400
 
-        logger.info(f"Fetching deals for contact ID: {contact_id}")
+        logger.info("Fetching deals for contact ID: %s", contact_id)
 
         # Fetch deals from HubSpot
         deals = get_contact_deals(contact_id, HUBSPOT_API_KEY)
@@ -586,7 +1021,7 @@ def get_deals():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching deals: {str(e)}", exc_info=True)
+        logger.exception("Error fetching deals: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -599,17 +1034,15 @@ def search_deals():
     - query: Search term (deal name or company)
     """
     try:
-        data = request.get_json()
-
-        if not data or 'query' not in data:
-            return jsonify({'error': 'No query provided'}), 400
+        data = _get_json()
 
-        query = data.get('query', '').strip()
+        error = _validate_required_text(data, SEARCH_QUERY_FIELDS)
+        if error:
+            return jsonify({'error': error}), 400
 
-        if not query:
-            return jsonify({'error': 'Query cannot be empty'}), 400
+        query = data['query'].strip()
 
-        logger.info(f"Searching deals for query: {query}")
+        logger.info("Searching deals for query: %s", query)
 
         # Search deals in HubSpot
         deals = search_hubspot_deals(query, HUBSPOT_API_KEY)
@@ -621,7 +1054,7 @@ def search_deals():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error searching deals: {str(e)}", exc_info=True)
+        logger.exception("Error searching deals: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -638,27 +1071,23 @@ def create_deal():
     - contact_id: HubSpot contact ID to associate with (optional)
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        deal_name = data.get('deal_name', '').strip()
-        stage = data.get('stage', '').strip()
-        next_step = data.get('next_step', '').strip()
-        next_step_date = data.get('next_step_date', '').strip()
-        contact_id = data.get('contact_id', '').strip()
+        error = (_validate_required_text(data, CREATE_DEAL_FIELDS)
+                 or _validate_optional_text(data, CREATE_DEAL_OPTIONAL_FIELDS))
+        if error:
+            return jsonify({'error': error}), 400
 
-        if not deal_name:
-            return jsonify({'error': 'Deal name is required'}), 400
+        deal_name = data['deal_name'].strip()
+        stage = data['stage'].strip()
+        next_step = data['next_step'].strip()
+        next_step_date = (data.get('next_step_date') or '').strip()
+        contact_id = (data.get('contact_id') or '').strip()
 
-        if not stage:
-            return jsonify({'error': 'Deal stage is required'}), 400
-
-        if not next_step:
-            return jsonify({'error': 'Next step is required'}), 400
-
-        logger.info(f"Creating new deal: {deal_name}, stage: {stage}, contact: {contact_id}")
+        logger.info("Creating new deal: %s, stage: %s, contact: %s", deal_name, stage, contact_id)
 
         result = create_hubspot_deal(
             deal_name=deal_name,
@@ -680,7 +1109,7 @@ def create_deal():
             return jsonify({'error': result['error']}), 500
 
     except Exception as e:
-        logger.error(f"Error creating deal: {str(e)}", exc_info=True)
+        logger.exception("Error creating deal: %s", e)
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
@@ -705,6 +1134,7 @@ def confirm_and_execute():
             "update_investor_prefs": true/false,
             "create_todos": true/false,
             "company_name": "Acme Corp",
+            "investor_page_id": "abc123" (optional; skips the investor search),
             "preferences": {...},
             "todos": [...]
         },
@@ -723,27 +1153,96 @@ def confirm_and_execute():
         "skip_investor_prefs": false,
         "deal_id": "456"
     }
+
+    Clients may send an Idempotency-Key header; repeating a request with the
+    same key and body within five minutes replays the first response (409
+    while the first is still running, 422 if the body differs).
+    """
+    idempotency_key = request.headers.get('Idempotency-Key')
+    if not idempotency_key:
+        return _confirm_and_execute()
+
+    # get_data() caches the body, so _get_json() can still read it below
+    body_hash = hashlib.sha256(request.get_data()).hexdigest()
+
+    with _idempotency_lock:
+        stored = _idempotent_responses.get(idempotency_key)
+        if stored is None:
+            _idempotent_responses[idempotency_key] = (body_hash, None)
+
+    if stored is not None:
+        stored_hash, stored_response = stored
+        if stored_hash != body_hash:
+            return jsonify({'error': 'Idempotency-Key was already used with a different request body'}), 422
+        if stored_response is None:
+            return jsonify({'error': 'This request is already being executed'}), 409
+        logger.info("Replaying confirm-and-execute response for Idempotency-Key %s", idempotency_key)
+        body, status = stored_response
+        return app.response_class(body, status=status, mimetype='application/json')
+
+    def forget_unsuccessful_job(job):
+        """Drop the key once its background job fails or ends with errors"""
+        if job['status'] == 'failed' or not job['result'].get('success'):
+            _forget_idempotency_key(idempotency_key, body_hash)
+
+    response, status = _confirm_and_execute(on_job_finish=forget_unsuccessful_job)
+
+    # Only accepted or fully successful executions are replayed; errors can be
+    # retried. A job that already failed has removed the placeholder.
+    with _idempotency_lock:
+        if _idempotent_responses.get(idempotency_key) == (body_hash, None):
+            if status == 202 or (status == 200 and response.get_json().get('success')):
+                _idempotent_responses[idempotency_key] = (body_hash, (response.get_data(), status))
+            else:
+                _idempotent_responses.pop(idempotency_key, None)
+
+    return response, status
+
+
+def _forget_idempotency_key(idempotency_key, body_hash):
+    """Remove a stored confirm-and-execute response if it still belongs to body_hash"""
+    with _idempotency_lock:
+        stored = _idempotent_responses.get(idempotency_key)
+        if stored is not None and stored[0] == body_hash:
+            del _idempotent_responses[idempotency_key]
+            logger.info("Dropped Idempotency-Key %s after an unsuccessful job", idempotency_key)
+
+
+def _confirm_and_execute(on_job_finish=None):
+    """
+    Validate a confirm-and-execute payload and run (or start) the updates
+
+    Args:
+        on_job_finish (callable): Optional; called with the job record when a
+            background job started by this request finishes
     """
     try:
-        data = request.get_json()
+        data = _get_json()
 
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
+        error = _validate_field_types(data, CONFIRM_TYPES)
+        if not error and data.get('hubspot') is not None:
+            error = _validate_field_types(data['hubspot'], CONFIRM_HUBSPOT_TYPES, 'hubspot.')
+        if not error and data.get('notion') is not None:
+            error = _validate_field_types(data['notion'], CONFIRM_NOTION_TYPES, 'notion.')
+        if error:
+            return jsonify({'error': error}), 400
+
         # Check if new format or old format
         is_new_format = 'hubspot' in data or 'notion' in data
 
         # Extract data based on format
         if is_new_format:
             # New structured format
-            hubspot_data = data.get('hubspot', {})
-            notion_data = data.get('notion', {})
+            hubspot_data = data.get('hubspot') or {}
+            notion_data = data.get('notion') or {}
 
             hubspot_action = hubspot_data.get('action', 'skip')
             contact_id = hubspot_data.get('contact_id')
             contact_name = hubspot_data.get('contact_name', data.get('contact_name', ''))
             deal_id = hubspot_data.get('deal_id')
-            deal_updates = hubspot_data.get('deal_updates', {})  # New: deal property updates
             summary = hubspot_data.get('summary', [])
             raw_notes = hubspot_data.get('raw_notes', '')
 
@@ -751,6 +1250,7 @@ def confirm_and_execute():
             create_todos = notion_data.get('create_todos', False)
             company_name = notion_data.get('company_name', '')
             preferences = notion_data.get('preferences', {})
+            investor_page_id = notion_data.get('investor_page_id')  # Page picked in the preview, if any
             todos = notion_data.get('todos', []) if create_todos else []
 
             skip_hubspot = (hubspot_action == 'skip')
@@ -762,6 +1262,7 @@ def confirm_and_execute():
             raw_notes = data.get('raw_notes', '')
             summary = data.get('summary', [])
             preferences = data.get('preferences', {})
+            investor_page_id = None
             todos = data.get('todos', [])
             company_name = data.get('company_name', '')
             skip_hubspot = data.get('skip_hubspot', False)
@@ -778,173 +1279,374 @@ def confirm_and_execute():
 
         # Construct HubSpot contact URL if we have portal ID and contact ID
         hubspot_contact_url = None
-        if contact_id and HUBSPOT_PORTAL_ID:
-            hubspot_contact_url = f"https://app.hubspot.com/contacts/{HUBSPOT_PORTAL_ID}/contact/{contact_id}"
-            logger.info(f"Constructed HubSpot URL: {hubspot_contact_url}")
+        if contact_id and HUBSPOT_CONTACT_URL_BASE:
+            hubspot_contact_url = f"{HUBSPOT_CONTACT_URL_BASE}{contact_id}"
+            logger.info("Constructed HubSpot URL: %s", hubspot_contact_url)
         else:
-            logger.warning(f"Cannot construct HubSpot URL - contact_id: {contact_id}, HUBSPOT_PORTAL_ID: {HUBSPOT_PORTAL_ID}")
+            logger.warning("Cannot construct HubSpot URL - contact_id: %s, HUBSPOT_PORTAL_ID: %s", contact_id, HUBSPOT_PORTAL_ID)
 
         # Validate that we have at least contact_id or deal_id if HubSpot is not skipped
         if not skip_hubspot and not contact_id and not deal_id:
             return jsonify({'error': 'Either contact_id or deal_id must be provided'}), 400
 
-        logger.info(f"Executing updates - HubSpot Action: {hubspot_action}, Investor Prefs: {not skip_investor_prefs}, Create TODOs: {len(todos) > 0}")
-
-        # Track results with detailed structure
-        results = {
-            'hubspot': {
-                'action_taken': None,
-                'note_id': None,
-                'contact_id': contact_id,
-                'contact_name': contact_name,
-                'deal_id': None,
-                'deal_name': None,
-                'error': None
-            },
-            'notion': {
-                'investor_updated': False,
-                'investor_id': None,
-                'investor_action': None,
-                'investor_error': None,
-                'todos_created': 0,
-                'todos': [],
-                'todos_errors': []
-            },
-            'errors': []
-        }
+        logger.info("Executing updates - HubSpot Action: %s, Investor Prefs: %s, Create TODOs: %s", hubspot_action, not skip_investor_prefs, len(todos) > 0)
+
+        future_task_data = hubspot_data.get('future_task', {}) if is_new_format else {}
+        deals_list = hubspot_data.get('deals', []) if is_new_format else []
+        job_args = (
+            hubspot_action, contact_id, contact_name, summary, raw_notes,
+            deals_list, future_task_data, skip_investor_prefs, company_name,
+            preferences, hubspot_contact_url, todos, investor_page_id
+        )
+
+        # Synchronous mode for callers that need the full result in this response
+        if request.args.get('wait', '').lower() == 'true':
+            return jsonify(_run_confirm_and_execute(*job_args)), 200
+
+        job_id = _submit_job(_run_confirm_and_execute, *job_args, on_finish=on_job_finish)
+
+        return jsonify({
+            'accepted': True,
+            'job_id': job_id,
+            'status_url': f'/api/job/{job_id}'
+        }), 202
+
+    except Exception as e:
+        logger.exception("Error in confirm-and-execute: %s", e)
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
+@app.route('/api/job/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Poll a background job started by an endpoint that returned 202
+
+    Response includes status ('running', 'done' or 'failed'), plus the
+    endpoint's normal response body as 'result' once done.
+    """
+    with _jobs_lock:
+        job = _jobs.get(job_id)
 
-        # STEP 1: Execute HubSpot action based on user selection
-        if hubspot_action == 'skip':
-            results['hubspot']['action_taken'] = 'skipped'
-            logger.info("Skipping HubSpot note creation per user selection")
-        elif hubspot_action in ['log_only', 'log_with_deal']:
-            try:
-                # Format summary for note
-                summary_text = '\n'.join([f'• {bullet}' for bullet in summary])
-
-                # Handle multiple deals
-                deals_list = hubspot_data.get('deals', [])
-                results['hubspot']['deals'] = []  # Track all deal operations
-
-                if len(deals_list) > 0:
-                    # Log notes to multiple deals
-                    logger.info(f"Logging notes to {len(deals_list)} deal(s)")
-
-                    for deal_data in deals_list:
-                        deal_id = deal_data.get('deal_id')
-                        deal_name = deal_data.get('deal_name', 'Unknown Deal')
-                        deal_updates = deal_data.get('updates', {})
-
-                        deal_result = {
-                            'deal_id': deal_id,
-                            'deal_name': deal_name,
-                            'note_created': False,
-                            'note_id': None,
-                            'updated': False,
-                            'error': None
-                        }
-
-                        try:
-                            # Log note to this deal
-                            note_result = log_hubspot_note(
-                                contact_id,  # Can be None if only logging to deal
-                                summary_text,
-                                raw_notes,
-                                HUBSPOT_API_KEY,
-                                deal_id=deal_id
-                            )
-
-                            if note_result['success']:
-                                deal_result['note_created'] = True
-                                deal_result['note_id'] = note_result['data']['id']
-                                logger.info(f"Created note for deal '{deal_name}' (ID: {deal_id})")
-
-                                # Update deal properties if provided
-                                if deal_updates:
-                                    properties_to_update = {k: v for k, v in deal_updates.items() if v}
-
-                                    if properties_to_update:
-                                        logger.info(f"Updating deal {deal_id} with properties: {properties_to_update}")
-                                        deal_update_result = update_hubspot_deal(deal_id, properties_to_update, HUBSPOT_API_KEY)
-
-                                        if deal_update_result['success']:
-                                            deal_result['updated'] = True
-                                            logger.info(f"Successfully updated deal {deal_id}")
-                                        else:
-                                            deal_result['error'] = f"Update failed: {deal_update_result['error']}"
-                                            logger.warning(f"Failed to update deal {deal_id}: {deal_update_result['error']}")
-                            else:
-                                deal_result['error'] = f"Note creation failed: {note_result['error']}"
-                                logger.error(f"Failed to create note for deal {deal_id}: {note_result['error']}")
-
-                        except Exception as deal_error:
-                            deal_result['error'] = str(deal_error)
-                            logger.error(f"Error processing deal {deal_id}: {str(deal_error)}", exc_info=True)
-
-                        results['hubspot']['deals'].append(deal_result)
-
-                    # Set overall status
-                    successful_deals = sum(1 for d in results['hubspot']['deals'] if d['note_created'])
-                    if successful_deals > 0:
-                        results['hubspot']['action_taken'] = f"logged_to_{successful_deals}_deals"
-                        logger.info(f"Successfully logged notes to {successful_deals}/{len(deals_list)} deal(s)")
-                    else:
-                        results['hubspot']['error'] = "Failed to log notes to any deals"
-                        results['errors'].append("Failed to log notes to any deals")
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
 
+    return jsonify({'job_id': job_id, **job}), 200
+
+
+def _submit_job(func, *args, on_finish=None):
+    """
+    Run func(*args) on the background job executor
+
+    Args:
+        func (callable): Work to run; its return value becomes the job result
+        *args: Positional arguments for func
+        on_finish (callable): Optional; called with the finished job record
+
+    Returns:
+        str: Job ID to poll via /api/job/<job_id>
+    """
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _jobs[job_id] = {'status': 'running'}
+
+    _job_executor.submit(_run_job, job_id, func, args, on_finish)
+    logger.info("Started background job %s", job_id)
+    return job_id
+
+
+def _run_job(job_id, func, args, on_finish=None):
+    """Execute a submitted job and record its outcome in the registry"""
+    try:
+        job = {'status': 'done', 'result': func(*args)}
+    except Exception as e:
+        logger.exception("Background job %s failed: %s", job_id, e)
+        job = {'status': 'failed', 'error': f'Server error: {str(e)}'}
+
+    with _jobs_lock:
+        _jobs[job_id] = job
+
+    if on_finish is not None:
+        on_finish(job)
+
+
+def _run_confirm_and_execute(hubspot_action, contact_id, contact_name, summary, raw_notes,
+                             deals_list, future_task_data, skip_investor_prefs, company_name,
+                             preferences, hubspot_contact_url, todos, investor_page_id=None):
+    """
+    Execute the confirmed HubSpot and Notion updates
+
+    Runs either inline (?wait=true) or as a background job for
+    /api/confirm-and-execute.
+
+    Returns:
+        dict: Response body with success flags, detailed results and summary
+    """
+    # Track results with detailed structure
+    results = {
+        'hubspot': {
+            'action_taken': None,
+            'note_id': None,
+            'contact_id': contact_id,
+            'contact_name': contact_name,
+            'deal_id': None,
+            'deal_name': None,
+            'error': None
+        },
+        'notion': {
+            'investor_updated': False,
+            'investor_id': None,
+            'investor_action': None,
+            'investor_error': None,
+            'todos_created': 0,
+            'todos': [],
+            'todos_errors': []
+        },
+        'errors': []
+    }
+
+    # STEPS 1-3 touch disjoint services and share no data, so run them
+    # concurrently. Each todo is its own task in the same pool rather than
+    # a nested pool. Each step collects its own errors; they are merged in
+    # step order once everything has finished.
+    hubspot_errors, investor_errors, todos_errors = [], [], []
+    valid_todos = [todo for todo in todos if todo.get('task_name', '')]
+
+    with ThreadPoolExecutor(max_workers=2 + min(NOTION_MAX_CONCURRENT_TODOS, len(valid_todos))) as executor:
+        steps = [
+            # STEP 1: Execute HubSpot action based on user selection (+ follow-up task)
+            executor.submit(
+                _execute_hubspot_step, results['hubspot'], hubspot_errors,
+                hubspot_action, contact_id, contact_name, summary, raw_notes,
+                deals_list, future_task_data
+            ),
+            # STEP 2: Update or create Notion investor preferences (conditionally)
+            executor.submit(
+                _execute_investor_step, results['notion'], investor_errors,
+                skip_investor_prefs, company_name, preferences, contact_name,
+                hubspot_contact_url, investor_page_id
+            )
+        ]
+
+        # STEP 3: Create to-do items (conditionally based on user selection)
+        if len(todos) > 0:
+            logger.info("Creating %s to-do items", len(todos))
+        else:
+            logger.info("No to-dos to create (skipped by user or none provided)")
+        todo_futures = [
+            (todo, executor.submit(
+                create_todo_item,
+                todo.get('task_name', ''),
+                todo.get('due_date', ''),
+                todo.get('next_step', ''),
+                NOTION_TODOS_DB_ID,
+                NOTION_API_KEY
+            ))
+            for todo in valid_todos
+        ]
+
+    for step in steps:
+        step.result()
+
+    _collect_todo_results(results['notion'], todos_errors, todo_futures)
+
+    for step_errors in (hubspot_errors, investor_errors, todos_errors):
+        results['errors'].extend(step_errors)
+
+    # Build response with detailed execution summary
+    # Determine overall success status
+    hubspot_success = (
+        results['hubspot']['note_id'] or
+        (results['hubspot'].get('deals') and any(d.get('note_created') for d in results['hubspot']['deals']))
+    )
+    has_any_success = (
+        hubspot_success or
+        results['notion']['investor_updated'] or
+        results['notion']['todos_created'] > 0
+    )
+    success = len(results['errors']) == 0 and has_any_success
+    partial_success = has_any_success and len(results['errors']) > 0
+
+    response = {
+        'success': success,
+        'partial_success': partial_success,
+        'results': results,
+        'summary': build_execution_summary(results)
+    }
+
+    return response
+
+
+def _execute_hubspot_step(hubspot_results, errors, hubspot_action, contact_id, contact_name,
+                          summary, raw_notes, deals_list, future_task_data):
+    """
+    Log the call note in HubSpot (contact and/or deals) and create the follow-up task
+
+    Args:
+        hubspot_results (dict): results['hubspot'] slice, updated in place
+        errors (list): Error messages for this step, appended in place
+        hubspot_action (str): 'log_only', 'log_with_deal' or 'skip'
+        contact_id (str): HubSpot contact ID (optional when logging to deals)
+        contact_name (str): Contact name used for the default task title
+        summary (list): Summary bullets
+        raw_notes (str): Full meeting notes
+        deals_list (list): Deals to log the note to, with their property updates
+        future_task_data (dict): Follow-up task settings from the frontend
+    """
+    if hubspot_action == 'skip':
+        hubspot_results['action_taken'] = 'skipped'
+        logger.info("Skipping HubSpot note creation per user selection")
+    elif hubspot_action in ['log_only', 'log_with_deal']:
+        try:
+            # Format summary for note (one join, no per-bullet string building)
+            summary_text = '• ' + '\n• '.join(summary) if summary else ''
+
+            # Handle multiple deals
+            hubspot_results['deals'] = []  # Track all deal operations
+
+            if len(deals_list) > 0:
+                # Log notes to multiple deals
+                logger.info("Logging notes to %s deal(s)", len(deals_list))
+
+                for deal_data in deals_list:
+                    deal_id = deal_data.get('deal_id')
+                    deal_name = deal_data.get('deal_name', 'Unknown Deal')
+                    deal_updates = deal_data.get('updates', {})
+
+                    deal_result = {
+                        'deal_id': deal_id,
+                        'deal_name': deal_name,
+                        'note_created': False,
+                        'note_id': None,
+                        'updated': False,
+                        'error': None
+                    }
+
+                    try:
+                        # Log note to this deal
+                        note_result = log_hubspot_note(
+                            contact_id,  # Can be None if only logging to deal
+                            summary_text,
+                            raw_notes,
+                            HUBSPOT_API_KEY,
+                            deal_id=deal_id
+                        )
+
+                        if note_result['success']:
+                            deal_result['note_created'] = True
+                            deal_result['note_id'] = note_result['data']['id']
+                            logger.info("Created note for deal '%s' (ID: %s)", deal_name, deal_id)
+
+                            # Update deal properties if provided
+                            if deal_updates:
+                                properties_to_update = {k: v for k, v in deal_updates.items() if v}
+
+                                if properties_to_update:
+                                    logger.info("Updating deal %s with properties: %s", deal_id, properties_to_update)
+                                    deal_update_result = update_hubspot_deal(deal_id, properties_to_update, HUBSPOT_API_KEY)
+
+                                    if deal_update_result['success']:
+                                        deal_result['updated'] = True
+                                        logger.info("Successfully updated deal %s", deal_id)
+                                    else:
+                                        deal_result['error'] = f"Update failed: {deal_update_result['error']}"
+                                        logger.warning("Failed to update deal %s: %s", deal_id, deal_update_result['error'])
+                        else:
+                            deal_result['error'] = f"Note creation failed: {note_result['error']}"
+                            logger.error("Failed to create note for deal %s: %s", deal_id, note_result['error'])
+
+                    except Exception as deal_error:
+                        deal_result['error'] = str(deal_error)
+                        logger.exception("Error processing deal %s: %s", deal_id, deal_error)
+
+                    hubspot_results['deals'].append(deal_result)
+
+                # Set overall status
+                successful_deals = sum(1 for d in hubspot_results['deals'] if d['note_created'])
+                if successful_deals > 0:
+                    hubspot_results['action_taken'] = f"logged_to_{successful_deals}_deals"
+                    logger.info("Successfully logged notes to %s/%s deal(s)", successful_deals, len(deals_list))
                 else:
-                    # No deals, just log to contact
-                    note_result = log_hubspot_note(
-                        contact_id,
-                        summary_text,
-                        raw_notes,
-                        HUBSPOT_API_KEY,
-                        deal_id=None
-                    )
-
-                    if note_result['success']:
-                        results['hubspot']['note_id'] = note_result['data']['id']
-                        results['hubspot']['action_taken'] = 'log_only'
-                        logger.info(f"Created HubSpot note (contact only): {results['hubspot']['note_id']}")
-                    else:
-                        results['hubspot']['error'] = note_result['error']
-                        results['errors'].append(f"HubSpot note failed: {note_result['error']}")
-                        logger.error(f"Failed to create HubSpot note: {note_result['error']}")
-
-            except Exception as e:
-                results['hubspot']['error'] = str(e)
-                results['errors'].append(f"HubSpot note error: {str(e)}")
-                logger.error(f"Error creating HubSpot note: {str(e)}", exc_info=True)
-
-        # STEP 1.5: Create future task if requested
-        future_task_data = hubspot_data.get('future_task', {}) if is_new_format else {}
-        if future_task_data.get('create_task', False) and contact_id:
-            try:
-                task_title = future_task_data.get('task_title', f'Check in with {contact_name}')
-                due_days = future_task_data.get('due_days', 90)
-
-                logger.info(f"Creating future task: {task_title}, due in {due_days} days")
-                task_result = create_hubspot_task(
-                    task_title=task_title,
-                    contact_id=contact_id,
-                    due_days=due_days,
-                    api_key=HUBSPOT_API_KEY
+                    hubspot_results['error'] = "Failed to log notes to any deals"
+                    errors.append("Failed to log notes to any deals")
+
+            else:
+                # No deals, just log to contact
+                note_result = log_hubspot_note(
+                    contact_id,
+                    summary_text,
+                    raw_notes,
+                    HUBSPOT_API_KEY,
+                    deal_id=None
                 )
 
-                if task_result['success']:
-                    results['hubspot']['task_id'] = task_result['data']['id']
-                    results['hubspot']['task_created'] = True
-                    logger.info(f"Successfully created task: {task_result['data']['id']}")
+                if note_result['success']:
+                    hubspot_results['note_id'] = note_result['data']['id']
+                    hubspot_results['action_taken'] = 'log_only'
+                    logger.info("Created HubSpot note (contact only): %s", hubspot_results['note_id'])
                 else:
-                    results['hubspot']['task_error'] = task_result['error']
-                    logger.warning(f"Failed to create task: {task_result['error']}")
-            except Exception as task_error:
-                logger.error(f"Error creating task: {str(task_error)}", exc_info=True)
-                results['hubspot']['task_error'] = str(task_error)
-
-        # STEP 2: Update or create Notion investor preferences (conditionally)
-        if not skip_investor_prefs and company_name and preferences:
-            try:
+                    hubspot_results['error'] = note_result['error']
+                    errors.append(f"HubSpot note failed: {note_result['error']}")
+                    logger.error("Failed to create HubSpot note: %s", note_result['error'])
+
+        except Exception as e:
+            hubspot_results['error'] = str(e)
+            errors.append(f"HubSpot note error: {str(e)}")
+            logger.exception("Error creating HubSpot note: %s", e)
+
+    # STEP 1.5: Create future task if requested
+    if future_task_data.get('create_task', False) and contact_id:
+        try:
+            task_title = future_task_data.get('task_title', f'Check in with {contact_name}')
+            due_days = future_task_data.get('due_days', 90)
+
+            logger.info("Creating future task: %s, due in %s days", task_title, due_days)
+            task_result = create_hubspot_task(
+                task_title=task_title,
+                contact_id=contact_id,
+                due_days=due_days,
+                api_key=HUBSPOT_API_KEY
+            )
+
+            if task_result['success']:
+                hubspot_results['task_id'] = task_result['data']['id']
+                hubspot_results['task_created'] = True
+                logger.info("Successfully created task: %s", task_result['data']['id'])
+            else:
+                hubspot_results['task_error'] = task_result['error']
+                logger.warning("Failed to create task: %s", task_result['error'])
+        except Exception as task_error:
+            logger.exception("Error creating task: %s", task_error)
+            hubspot_results['task_error'] = str(task_error)
+
+
+def _execute_investor_step(notion_results, errors, skip_investor_prefs, company_name,
+                           preferences, contact_name, hubspot_contact_url, investor_page_id=None):
+    """
+    Update the investor's Notion page with the new preferences, or create it
+
+    Args:
+        notion_results (dict): results['notion'] slice, updated in place
+        errors (list): Error messages for this step, appended in place
+        skip_investor_prefs (bool): Whether the user skipped this step
+        company_name (str): Investor/company name
+        preferences (dict): Preferences from parser
+        contact_name (str): Name of the HubSpot contact
+        hubspot_contact_url (str): URL to the HubSpot contact (optional)
+        investor_page_id (str): Investor page selected in the preview (optional);
+            when given it is updated directly instead of searching by company name
+    """
+    if not skip_investor_prefs and company_name and preferences:
+        try:
+            # Convert preferences to Notion format (same properties for update or create)
+            notion_properties = convert_preferences_to_notion_format(
+                preferences,
+                contact_name=contact_name,
+                hubspot_url=hubspot_contact_url
+            )
+
+            if investor_page_id:
+                logger.info("Using investor page selected in preview: %s", investor_page_id)
+            else:
                 # Search for existing investor
                 search_result = search_investor_preferences(
                     company_name,
@@ -953,139 +1655,130 @@ def confirm_and_execute():
                 )
 
                 if search_result['success'] and search_result['data']:
-                    # Investor exists - update with append-only logic
-                    existing_investor = search_result['data'][0]
-                    investor_page_id = existing_investor['id']
-
-                    logger.info(f"Found existing investor page: {investor_page_id}")
-
-                    # Convert preferences to Notion format
-                    notion_properties = convert_preferences_to_notion_format(
-                        preferences,
-                        contact_name=contact_name,
-                        hubspot_url=hubspot_contact_url
-                    )
-
-                    update_result = update_page_properties(
-                        investor_page_id,
-                        notion_properties,
-                        NOTION_API_KEY
-                    )
-
-                    if update_result['success']:
-                        results['notion']['investor_updated'] = True
-                        results['notion']['investor_id'] = investor_page_id
-                        results['notion']['investor_action'] = 'updated'
-                        logger.info(f"Updated investor preferences for {company_name}")
-                    else:
-                        results['notion']['investor_error'] = update_result['error']
-                        results['errors'].append(f"Notion update failed: {update_result['error']}")
+                    investor_page_id = search_result['data'][0]['id']
+                    logger.info("Found existing investor page: %s", investor_page_id)
+
+            if investor_page_id:
+                # Investor exists - update with append-only logic
+                update_result = update_page_properties(
+                    investor_page_id,
+                    notion_properties,
+                    NOTION_API_KEY
+                )
 
+                if update_result['success']:
+                    notion_results['investor_updated'] = True
+                    notion_results['investor_id'] = investor_page_id
+                    notion_results['investor_action'] = 'updated'
+                    logger.info("Updated investor preferences for %s", company_name)
                 else:
-                    # Investor doesn't exist - create new page
-                    logger.info(f"Creating new investor page for: {company_name}")
-
-                    # Convert preferences to Notion format
-                    notion_properties = convert_preferences_to_notion_format(
-                        preferences,
-                        contact_name=contact_name,
-                        hubspot_url=hubspot_contact_url
-                    )
-
-                    logger.info(f"Creating investor with properties: Primary Contact={contact_name}, Hubspot Link={hubspot_contact_url}")
-                    logger.debug(f"Full notion_properties: {notion_properties}")
-
-                    create_result = create_investor_page(
-                        company_name,
-                        notion_properties,
-                        NOTION_INVESTOR_PREFS_DB_ID,
-                        NOTION_API_KEY
-                    )
-
-                    if create_result['success']:
-                        results['notion']['investor_updated'] = True
-                        results['notion']['investor_id'] = create_result['data']['id']
-                        results['notion']['investor_action'] = 'created'
-                        logger.info(f"Created new investor page: {results['notion']['investor_id']}")
-                    else:
-                        results['notion']['investor_error'] = create_result['error']
-                        results['errors'].append(f"Notion create failed: {create_result['error']}")
-
-            except Exception as e:
-                results['notion']['investor_error'] = str(e)
-                results['errors'].append(f"Notion investor error: {str(e)}")
-                logger.error(f"Error with Notion investor: {str(e)}", exc_info=True)
-        else:
-            if skip_investor_prefs:
-                logger.info("Skipping investor preferences update per user selection")
+                    notion_results['investor_error'] = update_result['error']
+                    errors.append(f"Notion update failed: {update_result['error']}")
 
-        # STEP 3: Create to-do items (conditionally based on user selection)
-        if len(todos) > 0:
-            logger.info(f"Creating {len(todos)} to-do items")
-            for todo in todos:
-                try:
-                    task_name = todo.get('task_name', '')
-                    due_date = todo.get('due_date', '')
-                    next_step = todo.get('next_step', '')
-
-                    if not task_name:
-                        continue
-
-                    todo_result = create_todo_item(
-                        task_name,
-                        due_date,
-                        next_step,
-                        NOTION_TODOS_DB_ID,
-                        NOTION_API_KEY
-                    )
-
-                    if todo_result['success']:
-                        results['notion']['todos'].append({
-                            'id': todo_result['data']['id'],
-                            'task_name': task_name,
-                            'due_date': due_date
-                        })
-                        results['notion']['todos_created'] += 1
-                        logger.info(f"Created todo: {task_name}")
-                    else:
-                        error_msg = f"Failed to create todo '{task_name}': {todo_result['error']}"
-                        results['notion']['todos_errors'].append(error_msg)
-                        results['errors'].append(error_msg)
-
-                except Exception as e:
-                    error_msg = f"Todo error for '{task_name}': {str(e)}"
-                    results['notion']['todos_errors'].append(error_msg)
-                    results['errors'].append(error_msg)
-                    logger.error(f"Error creating todo: {str(e)}", exc_info=True)
-        else:
-            logger.info("No to-dos to create (skipped by user or none provided)")
+            else:
+                # Investor doesn't exist - create new page
+                logger.info("Creating new investor page for: %s", company_name)
 
-        # Build response with detailed execution summary
-        # Determine overall success status
-        hubspot_success = (
-            results['hubspot']['note_id'] or
-            (results['hubspot'].get('deals') and any(d.get('note_created') for d in results['hubspot']['deals']))
-        )
-        has_any_success = (
-            hubspot_success or
-            results['notion']['investor_updated'] or
-            results['notion']['todos_created'] > 0
-        )
-        success = len(results['errors']) == 0 and has_any_success
-        partial_success = has_any_success and len(results['errors']) > 0
+                logger.info("Creating investor with properties: Primary Contact=%s, Hubspot Link=%s", contact_name, hubspot_contact_url)
+                logger.debug("Full notion_properties: %s", notion_properties)
 
-        response = {
-            'success': success,
-            'partial_success': partial_success,
-            'results': results,
-            'summary': build_execution_summary(results)
-        }
+                create_result = create_investor_page(
+                    company_name,
+                    notion_properties,
+                    NOTION_INVESTOR_PREFS_DB_ID,
+                    NOTION_API_KEY
+                )
 
-        return jsonify(response), 200
+                if create_result['success']:
+                    notion_results['investor_updated'] = True
+                    notion_results['investor_id'] = create_result['data']['id']
+                    notion_results['investor_action'] = 'created'
+                    logger.info("Created new investor page: %s", notion_results['investor_id'])
+                else:
+                    notion_results['investor_error'] = create_result['error']
+                    errors.append(f"Notion create failed: {create_result['error']}")
 
-    except Exception as e:
-        logger.error(f"Error in confirm-and-execute: {str(e)}", exc_info=True)
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+        except Exception as e:
+            notion_results['investor_error'] = str(e)
+            errors.append(f"Notion investor error: {str(e)}")
+            logger.exception("Error with Notion investor: %s", e)
+    else:
+        if skip_investor_prefs:
+            logger.info("Skipping investor preferences update per user selection")
+
+
+def _collect_todo_results(notion_results, errors, todo_futures):
+    """
+    Record the outcome of each submitted to-do creation
+
+    Args:
+        notion_results (dict): results['notion'] slice, updated in place
+        errors (list): Error messages for this step, appended in place
+        todo_futures (list): (todo, future) pairs in submission order
+    """
+    for todo, future in todo_futures:
+        task_name = todo.get('task_name', '')
+        due_date = todo.get('due_date', '')
+
+        try:
+            todo_result = future.result()
+
+            if todo_result['success']:
+                notion_results['todos'].append({
+                    'id': todo_result['data']['id'],
+                    'task_name': task_name,
+                    'due_date': due_date
+                })
+                notion_results['todos_created'] += 1
+                logger.info("Created todo: %s", task_name)
+            else:
+                error_msg = f"Failed to create todo '{task_name}': {todo_result['error']}"
+                notion_results['todos_errors'].append(error_msg)
+                errors.append(error_msg)
+
+        except Exception as e:
+            error_msg = f"Todo error for '{task_name}': {str(e)}"
+            notion_results['todos_errors'].append(error_msg)
+            errors.append(error_msg)
+            logger.exception("Error creating todo: %s", e)
+
+
+def _rich_text_property(content):
+    """Build a Notion rich_text property holding a single text run"""
+    return {
+        'rich_text': [
+            {
+                'type': 'text',
+                'text': {'content': content}
+            }
+        ]
+    }
+
+
+def _as_rich_text(value):
+    """Preference value as a rich_text property, or None if empty"""
+    return _rich_text_property(value) if value else None
+
+
+def _as_single_select(value):
+    """Preference value as a single select (first entry of a list), or None if empty"""
+    if not value or not isinstance(value, (list, str)):
+        return None
+    return {'select': {'name': value[0] if isinstance(value, list) else value}}
+
+
+def _as_multi_select(value):
+    """Preference value as a multi_select property, or None if not a non-empty list"""
+    if not value or not isinstance(value, list):
+        return None
+    return {'multi_select': [{'name': v} for v in value]}
+
+
+# Notion property type per preference field; every other field is multi-select
+PREFERENCE_FIELD_HANDLERS = {
+    'Preference Notes': _as_rich_text,
+    'When to Call': _as_single_select,
+}
 
 
 def convert_preferences_to_notion_format(preferences, contact_name=None, hubspot_url=None):
@@ -1100,49 +1793,20 @@ def convert_preferences_to_notion_format(preferences, contact_name=None, hubspot
     Returns:
         dict: Notion-formatted properties
     """
-    notion_properties = {}
+    if not preferences and not contact_name and not hubspot_url:
+        return {}
 
-    # Define which fields are single-select vs multi-select
-    SINGLE_SELECT_FIELDS = ['When to Call']
+    preferences = preferences or {}
 
+    notion_properties = {}
     for key, value in preferences.items():
-        if key == 'Preference Notes':
-            # Rich text property
-            if value:
-                notion_properties[key] = {
-                    'rich_text': [
-                        {
-                            'type': 'text',
-                            'text': {'content': value}
-                        }
-                    ]
-                }
-        elif key in SINGLE_SELECT_FIELDS:
-            # Single-select property - take first value from list
-            if isinstance(value, list) and value:
-                notion_properties[key] = {
-                    'select': {'name': value[0]}
-                }
-            elif isinstance(value, str) and value:
-                notion_properties[key] = {
-                    'select': {'name': value}
-                }
-        elif isinstance(value, list) and value:
-            # Multi-select property
-            notion_properties[key] = {
-                'multi_select': [{'name': v} for v in value]
-            }
+        notion_property = PREFERENCE_FIELD_HANDLERS.get(key, _as_multi_select)(value)
+        if notion_property is not None:
+            notion_properties[key] = notion_property
 
     # Add primary contact if provided
     if contact_name:
-        notion_properties['Primary Contact'] = {
-            'rich_text': [
-                {
-                    'type': 'text',
-                    'text': {'content': contact_name}
-                }
-            ]
-        }
+        notion_properties['Primary Contact'] = _rich_text_property(contact_name)
 
     # Add Hubspot link if provided
     if hubspot_url:
@@ -1153,6 +1817,12 @@ def convert_preferences_to_notion_format(preferences, contact_name=None, hubspot
     return notion_properties
 
 
+# Status lines shared by the success message and the execution summary
+MSG_HUBSPOT_SKIPPED = "⊘ HubSpot note skipped"
+MSG_HUBSPOT_CREATED = "✓ HubSpot note created"
+MSG_INVESTOR_SKIPPED = "⊘ Investor preferences skipped"
+
+
 def build_success_message(results):
     """
     Build a human-readable success message
@@ -1165,27 +1835,29 @@ def build_success_message(results):
     """
     messages = []
     skipped = results.get('skipped', {})
+    investor = results['notion_investor']
+    todos = results['notion_todos']
+    errors = results['errors']
 
     # HubSpot status
     if skipped.get('hubspot'):
-        messages.append(f"⊘ HubSpot note skipped")
+        messages.append(MSG_HUBSPOT_SKIPPED)
     elif results['hubspot_note']:
-        messages.append(f"✓ HubSpot note created")
+        messages.append(MSG_HUBSPOT_CREATED)
 
     # Investor preferences status
     if skipped.get('investor_prefs'):
-        messages.append(f"⊘ Investor preferences skipped")
-    elif results['notion_investor']:
-        action = results['notion_investor']['action']
-        messages.append(f"✓ Investor preferences {action}")
+        messages.append(MSG_INVESTOR_SKIPPED)
+    elif investor:
+        messages.append(f"✓ Investor preferences {investor['action']}")
 
     # TODOs
-    if results['notion_todos']:
-        messages.append(f"✓ {len(results['notion_todos'])} todo(s) created")
+    if todos:
+        messages.append(f"✓ {len(todos)} todo(s) created")
 
     # Errors
-    if results['errors']:
-        messages.append(f"⚠ {len(results['errors'])} error(s) occurred")
+    if errors:
+        messages.append(f"⚠ {len(errors)} error(s) occurred")
 
     if not messages:
         return "No actions completed"
@@ -1203,73 +1875,82 @@ def build_execution_summary(results):
     Returns:
         dict: Execution summary with detailed breakdown
     """
-    summary = {
-        'hubspot': {},
-        'notion': {},
-        'messages': []
-    }
+    hubspot_summary = {}
+    notion_summary = {}
+    messages = []
 
     # HubSpot summary
     hubspot = results.get('hubspot', {})
-    if hubspot.get('action_taken') == 'skipped':
-        summary['hubspot']['status'] = 'skipped'
-        summary['hubspot']['message'] = 'HubSpot note was not created'
-        summary['messages'].append('⊘ HubSpot note skipped')
-    elif hubspot.get('note_id'):
-        summary['hubspot']['status'] = 'success'
-        summary['hubspot']['note_id'] = hubspot['note_id']
-        summary['hubspot']['contact_name'] = hubspot.get('contact_name', 'Unknown')
-
-        if hubspot.get('action_taken') == 'log_with_deal' and hubspot.get('deal_id'):
-            summary['hubspot']['message'] = f"Note created for {hubspot.get('contact_name')} and associated with deal"
-            summary['hubspot']['deal_id'] = hubspot['deal_id']
-            summary['messages'].append(f"✓ HubSpot note created and associated with deal")
+    action_taken = hubspot.get('action_taken')
+    note_id = hubspot.get('note_id')
+    if action_taken == 'skipped':
+        hubspot_summary['status'] = 'skipped'
+        hubspot_summary['message'] = 'HubSpot note was not created'
+        messages.append(MSG_HUBSPOT_SKIPPED)
+    elif note_id:
+        contact_name = hubspot.get('contact_name', 'Unknown')
+        deal_id = hubspot.get('deal_id')
+        hubspot_summary['status'] = 'success'
+        hubspot_summary['note_id'] = note_id
+        hubspot_summary['contact_name'] = contact_name
+
+        if action_taken == 'log_with_deal' and deal_id:
+            hubspot_summary['message'] = f"Note created for {contact_name} and associated with deal"
+            hubspot_summary['deal_id'] = deal_id
+            messages.append("✓ HubSpot note created and associated with deal")
         else:
-            summary['hubspot']['message'] = f"Note created for {hubspot.get('contact_name')}"
-            summary['messages'].append(f"✓ HubSpot note created")
+            hubspot_summary['message'] = f"Note created for {contact_name}"
+            messages.append(MSG_HUBSPOT_CREATED)
     elif hubspot.get('error'):
-        summary['hubspot']['status'] = 'error'
-        summary['hubspot']['error'] = hubspot['error']
-        summary['messages'].append(f"✗ HubSpot note failed")
+        hubspot_summary['status'] = 'error'
+        hubspot_summary['error'] = hubspot['error']
+        messages.append("✗ HubSpot note failed")
 
     # HubSpot Task summary
     if hubspot.get('task_created'):
-        summary['hubspot']['task_created'] = True
-        summary['hubspot']['task_id'] = hubspot.get('task_id')
-        summary['messages'].append(f"✓ Follow-up task created")
+        hubspot_summary['task_created'] = True
+        hubspot_summary['task_id'] = hubspot.get('task_id')
+        messages.append("✓ Follow-up task created")
     elif hubspot.get('task_error'):
-        summary['messages'].append(f"⚠ Follow-up task failed: {hubspot['task_error']}")
+        messages.append(f"⚠ Follow-up task failed: {hubspot['task_error']}")
 
     # Notion Investor summary
     notion = results.get('notion', {})
     if notion.get('investor_updated'):
-        summary['notion']['investor_status'] = 'success'
-        summary['notion']['investor_action'] = notion.get('investor_action', 'updated')
-        summary['notion']['investor_id'] = notion.get('investor_id')
-        action_text = notion.get('investor_action', 'updated')
-        summary['messages'].append(f"✓ Investor preferences {action_text}")
+        investor_action = notion.get('investor_action', 'updated')
+        notion_summary['investor_status'] = 'success'
+        notion_summary['investor_action'] = investor_action
+        notion_summary['investor_id'] = notion.get('investor_id')
+        messages.append(f"✓ Investor preferences {investor_action}")
     elif notion.get('investor_error'):
-        summary['notion']['investor_status'] = 'error'
-        summary['notion']['investor_error'] = notion['investor_error']
-        summary['messages'].append(f"✗ Investor preferences failed")
+        notion_summary['investor_status'] = 'error'
+        notion_summary['investor_error'] = notion['investor_error']
+        messages.append("✗ Investor preferences failed")
     else:
-        summary['notion']['investor_status'] = 'skipped'
-        summary['messages'].append('⊘ Investor preferences skipped')
+        notion_summary['investor_status'] = 'skipped'
+        messages.append(MSG_INVESTOR_SKIPPED)
 
     # Notion TODOs summary
     todos_created = notion.get('todos_created', 0)
+    error_count = len(notion.get('todos_errors', ()))
     if todos_created > 0:
-        summary['notion']['todos_status'] = 'success'
-        summary['notion']['todos_created'] = todos_created
-        summary['messages'].append(f"✓ Created {todos_created} to-do item{'s' if todos_created > 1 else ''}")
-    elif len(notion.get('todos_errors', [])) > 0:
-        summary['notion']['todos_status'] = 'partial'
-        summary['notion']['todos_created'] = todos_created
-        summary['notion']['todos_errors'] = len(notion['todos_errors'])
-        summary['messages'].append(f"⚠ Created {todos_created} to-do(s) with {len(notion['todos_errors'])} error(s)")
+        notion_summary['todos_status'] = 'success'
+        notion_summary['todos_created'] = todos_created
+        messages.append(f"✓ Created {todos_created} to-do item{'s' if todos_created > 1 else ''}")
+    elif error_count > 0:
+        notion_summary['todos_status'] = 'partial'
+        notion_summary['todos_created'] = todos_created
+        notion_summary['todos_errors'] = error_count
+        messages.append(f"⚠ Created {todos_created} to-do(s) with {error_count} error(s)")
     else:
-        summary['notion']['todos_status'] = 'skipped'
-        summary['messages'].append('⊘ No to-do items created')
+        notion_summary['todos_status'] = 'skipped'
+        messages.append('⊘ No to-do items created')
+
+    summary = {
+        'hubspot': hubspot_summary,
+        'notion': notion_summary,
+        'messages': messages
+    }
 
     # Overall errors
     if results.get('errors'):
@@ -1280,6 +1961,89 @@ def build_execution_summary(results):
     return summary
 
 
+def _prepare_call_result(query):
+    """
+    Find the contact, gather sources and synthesize the call brief
+
+    Args:
+        query (str): Contact name or email
+
+    Returns:
+        dict: prepare-call response payload
+    """
+    # Step 1: Search HubSpot for contact
+    contact_data = _find_call_contact(query)
+
+    if contact_data is None:
+        return {
+            'success': False,
+            'error': f'Contact not found for: {query}'
+        }
+
+    contact_id = contact_data['id']
+
+    # Step 2: Gather all information
+    logger.info("Gathering information from multiple sources...")
+    brief_data = prepare_call_brief(
+        contact_id=contact_id,
+        contact_data=contact_data,
+        hubspot_api_key=HUBSPOT_API_KEY,
+        serper_api_key=SERPER_API_KEY
+    )
+
+    # Step 3: Synthesize with Claude
+    logger.info("Synthesizing brief with Claude...")
+    synthesized_brief = synthesize_brief_with_claude(
+        data=brief_data,
+        anthropic_api_key=ANTHROPIC_API_KEY
+    )
+
+    logger.info("Successfully prepared call brief")
+
+    return {
+        'success': True,
+        'brief': synthesized_brief
+    }
+
+
+def _prepare_call_single_flight(query):
+    """
+    Run _prepare_call_result() once per query across concurrent requests
+
+    The first request for a query does the work; identical requests arriving
+    while it runs wait for and share its result (or exception).
+
+    Args:
+        query (str): Contact name or email
+
+    Returns:
+        dict: prepare-call response payload
+    """
+    key = query.lower()
+
+    with _inflight_briefs_lock:
+        future = _inflight_briefs.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight_briefs[key] = future
+
+    if not is_leader:
+        logger.info("Joining in-flight call brief for '%s'", query)
+        return future.result()
+
+    try:
+        result = _prepare_call_result(query)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_briefs_lock:
+            _inflight_briefs.pop(key, None)
+
+
 @app.route('/api/prepare-call', methods=['POST'])
 def prepare_call():
     """
@@ -1293,199 +2057,206 @@ def prepare_call():
     try:
         logger.info("=== Prepare Call API called ===")
 
-        # Get request data
-        data = request.get_json()
-        query = data.get('query', '').strip()
-
-        # Validate query
-        if not query:
-            logger.warning("Empty query provided")
+        # Get and validate request data
+        data = _get_json()
+        error = _validate_required_text(data, PREPARE_CALL_FIELDS)
+        if error:
+            logger.warning("Invalid prepare-call request: %s", error)
             return jsonify({
                 'success': False,
-                'error': 'Query parameter is required'
-            }), 200
+                'error': error
+            }), 400
 
-        logger.info(f"Searching for contact: {query}")
+        result = _prepare_call_single_flight(data['query'].strip())
 
-        # Step 1: Search HubSpot for contact
-        search_result = search_hubspot_contact(query, HUBSPOT_API_KEY)
+        # The only unsuccessful result is a contact that could not be found
+        return jsonify(result), 200 if result['success'] else 404
 
-        if not search_result.get('success') or not search_result.get('data'):
-            logger.warning(f"Contact not found for query: {query}")
-            return jsonify({
-                'success': False,
-                'error': f'Contact not found for: {query}'
-            }), 200
+    except Exception as e:
+        logger.exception("Error preparing call brief: %s", e)
+        return jsonify({
+            'success': False,
+            'error': f'Failed to prepare call brief: {str(e)}'
+        }), 500
 
-        # Get the first contact from the data array
-        contact_results = search_result['data']
-        contact = contact_results[0]
-        contact_id = contact.get('id')
-
-        # Extract contact data (flat structure from search_hubspot_contact)
-        contact_data = {
-            'id': contact_id,
-            'name': f"{contact.get('firstname', '')} {contact.get('lastname', '')}".strip(),
-            'email': contact.get('email', ''),
-            'company': contact.get('company', ''),
-            'jobtitle': contact.get('jobtitle', '')
-        }
 
-        logger.info(f"Found contact: {contact_data['name']} (ID: {contact_id})")
+@app.route('/api/prepare-call/stream', methods=['POST'])
+def prepare_call_stream():
+    """
+    Streaming variant of /api/prepare-call using Server-Sent Events
 
-        # Step 2: Gather all information
-        logger.info("Gathering information from multiple sources...")
-        brief_data = prepare_call_brief(
-            contact_id=contact_id,
-            contact_data=contact_data,
-            hubspot_api_key=HUBSPOT_API_KEY,
-            serper_api_key=SERPER_API_KEY
-        )
+    Request body: {"query": "name or email"}
 
-        # Step 3: Synthesize with Claude
-        logger.info("Synthesizing brief with Claude...")
-        synthesized_brief = synthesize_brief_with_claude(
-            data=brief_data,
-            anthropic_api_key=ANTHROPIC_API_KEY
-        )
+    Events:
+        progress: {"stage": "contact_found", "contact": {...}} and {"stage": "sources_gathered"}
+        token: {"text": "..."} for each fragment of the brief as Claude writes it
+        complete: {"success": true, "brief": {...}} (same brief as /api/prepare-call)
+        error: {"success": false, "error": "..."}
+    """
+    data = _get_json()
+    error = _validate_required_text(data, PREPARE_CALL_FIELDS)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
 
-        logger.info("Successfully prepared call brief")
+    query = data['query'].strip()
 
-        return jsonify({
-            'success': True,
-            'brief': synthesized_brief
-        }), 200
+    def generate():
+        try:
+            contact_data = _find_call_contact(query)
+            if contact_data is None:
+                yield _sse_event('error', {'success': False, 'error': f'Contact not found for: {query}'})
+                return
+
+            yield _sse_event('progress', {'stage': 'contact_found', 'contact': contact_data})
+
+            brief_data = prepare_call_brief(
+                contact_id=contact_data['id'],
+                contact_data=contact_data,
+                hubspot_api_key=HUBSPOT_API_KEY,
+                serper_api_key=SERPER_API_KEY
+            )
+            yield _sse_event('progress', {'stage': 'sources_gathered'})
 
-    except Exception as e:
-        logger.error(f"Error preparing call brief: {str(e)}", exc_info=True)
-        return jsonify({
-            'success': False,
-            'error': f'Failed to prepare call brief: {str(e)}'
-        }), 200
+            for event in stream_brief_with_claude(brief_data, ANTHROPIC_API_KEY):
+                if event['type'] == 'token':
+                    yield _sse_event('token', {'text': event['text']})
+                else:
+                    yield _sse_event('complete', {'success': True, 'brief': event['brief']})
 
+        except Exception as e:
+            logger.exception("Error streaming call brief: %s", e)
+            yield _sse_event('error', {'success': False, 'error': f'Failed to prepare call brief: {str(e)}'})
 
-@app.route('/api/recent-contacts', methods=['GET'])
-def recent_contacts():
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}  # Don't let proxies buffer the stream
+    )
+
+
+def _find_call_contact(query):
     """
-    Get recently modified contacts from HubSpot.
+    Look up the contact a call brief is prepared for
+
+    Args:
+        query (str): Name or email to search for
 
     Returns:
-        JSON with list of recent contacts
+        dict: Contact data (id, name, email, company, jobtitle) for the first
+              match, or None if nothing matched
     """
-    try:
-        logger.info("=== Recent Contacts API called ===")
+    logger.info("Searching for contact: %s", query)
+    search_result = search_hubspot_contact(query, HUBSPOT_API_KEY)
+
+    if not search_result.get('success') or not search_result.get('data'):
+        logger.warning("Contact not found for query: %s", query)
+        return None
+
+    # Use the first match (flat structure from search_hubspot_contact)
+    contact = search_result['data'][0]
+    contact_data = {
+        'id': contact.get('id'),
+        'name': format_contact_name(contact.get('firstname'), contact.get('lastname'), default=''),
+        'email': contact.get('email', ''),
+        'company': contact.get('company', ''),
+        'jobtitle': contact.get('jobtitle', '')
+    }
 
-        # Call HubSpot API to get recent contacts
-        url = "https://api.hubapi.com/crm/v3/objects/contacts"
+    logger.info("Found contact: %s (ID: %s)", contact_data['name'], contact_data['id'])
+    return contact_data
 
-        headers = {
-            "Authorization": f"Bearer {HUBSPOT_API_KEY}",
-            "Content-Type": "application/json"
-        }
 
-        params = {
-            "limit": 5,
-            "properties": "firstname,lastname,email,company",
-            "sorts": "hs_lastmodifieddate",
-            "archived": "false"
-        }
+def _sse_event(event, payload):
+    """Format one Server-Sent Events frame with a JSON payload"""
+    return f"event: {event}\ndata: {app.json.dumps(payload)}\n\n"
 
-        response = requests.get(url, headers=headers, params=params, timeout=10)
 
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("results", [])
+@app.route('/api/recent-contacts', methods=['GET'])
+def recent_contacts():
+    """
+    Get recently modified contacts from HubSpot.
+
+    Query parameters:
+        limit: Number of contacts (default 5, capped at 100)
+        fields: Comma-separated subset of name,company,email (default: all)
 
-            # Format contacts
-            contacts = []
-            for result in results:
-                properties = result.get("properties", {})
-                contact_id = result.get("id")
+    Returns:
+        JSON with list of recent contacts
+    """
+    try:
+        logger.info("=== Recent Contacts API called ===")
 
-                firstname = properties.get("firstname", "")
-                lastname = properties.get("lastname", "")
-                name = f"{firstname} {lastname}".strip() or "Unknown"
+        try:
+            limit = int(request.args.get('limit', 5))
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return jsonify({
+                'success': False,
+                'error': 'limit must be a positive integer',
+                'contacts': []
+            }), 400
 
-                contacts.append({
-                    "id": contact_id,
-                    "name": name,
-                    "company": properties.get("company", ""),
-                    "email": properties.get("email", "")
-                })
+        fields = request.args.get('fields')
+        if fields:
+            fields = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+            unknown = [field for field in fields if field not in RECENT_CONTACT_FIELDS]
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unknown fields: {', '.join(unknown)}",
+                    'contacts': []
+                }), 400
 
-            logger.info(f"Retrieved {len(contacts)} recent contacts")
+        result = get_recent_contacts(HUBSPOT_API_KEY, limit=limit, fields=fields)
 
-            return jsonify({
+        if result['success']:
+            # ETag lets a polling client revalidate with a 304 instead of a full body
+            response = jsonify({
                 'success': True,
-                'contacts': contacts
-            }), 200
+                'contacts': result['data']
+            })
+            # Let the browser reuse the list as long as the server-side cache
+            # does; private because this is CRM data, not for shared caches
+            response.headers['Cache-Control'] = f'private, max-age={RECENT_CONTACTS_CACHE_TTL_SECONDS}'
+            response.add_etag()
+            return response.make_conditional(request)
 
-        else:
-            logger.warning(f"HubSpot API error: {response.status_code}")
-            return jsonify({
-                'success': False,
-                'error': f'HubSpot API error: {response.status_code}',
-                'contacts': []
-            }), 200
+        return jsonify({
+            'success': False,
+            'error': result['error'],
+            'contacts': []
+        }), 500
 
     except Exception as e:
-        logger.error(f"Error fetching recent contacts: {str(e)}", exc_info=True)
+        logger.exception("Error fetching recent contacts: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to fetch recent contacts: {str(e)}',
             'contacts': []
-        }), 200
+        }), 500
 
 
 if __name__ == '__main__':
     # Verify environment variables are set
-    required_vars = [
-        'ANTHROPIC_API_KEY',
-        'HUBSPOT_API_KEY',
-        'NOTION_API_KEY',
-        'NOTION_INVESTOR_PREFS_DB_ID',
-        'NOTION_TODOS_DB_ID'
-    ]
+    required_vars = {
+        'ANTHROPIC_API_KEY': ANTHROPIC_API_KEY,
+        'HUBSPOT_API_KEY': HUBSPOT_API_KEY,
+        'NOTION_API_KEY': NOTION_API_KEY,
+        'NOTION_INVESTOR_PREFS_DB_ID': NOTION_INVESTOR_PREFS_DB_ID,
+        'NOTION_TODOS_DB_ID': NOTION_TODOS_DB_ID
+    }
 
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [var for var, value in required_vars.items() if not value]
 
     if missing_vars:
-        logger.warning(f"Missing environment variables: {', '.join(missing_vars)}")
+        logger.warning("Missing environment variables: %s", ', '.join(missing_vars))
         logger.warning("Please copy .env.example to .env and fill in your API keys")
 
-    # Set up scheduled job for daily deal reminders
-    if REMINDER_ENABLED:
-        logger.info("Setting up daily deal reminder scheduler")
-
-        # Parse reminder time (format: HH:MM)
-        try:
-            hour, minute = map(int, REMINDER_TIME.split(':'))
-            logger.info(f"Daily reminders scheduled for {hour:02d}:{minute:02d} UTC")
-
-            scheduler = BackgroundScheduler()
+    start_reminder_scheduler()
 
-            # Schedule the job to run daily at the specified time (UTC)
-            scheduler.add_job(
-                func=run_daily_reminder_job,
-                trigger=CronTrigger(hour=hour, minute=minute),
-                id='daily_deal_reminder',
-                name='Send daily deal reminders',
-                replace_existing=True
-            )
-
-            scheduler.start()
-            logger.info("Daily deal reminder scheduler started successfully")
-
-            # Optional: Run once on startup for testing (comment out in production)
-            # logger.info("Running initial reminder check on startup")
-            # run_daily_reminder_job()
-
-        except ValueError:
-            logger.error(f"Invalid REMINDER_TIME format: {REMINDER_TIME}. Expected HH:MM")
-        except Exception as e:
-            logger.error(f"Failed to start reminder scheduler: {str(e)}", exc_info=True)
-    else:
-        logger.info("Daily deal reminders are disabled (REMINDER_ENABLED=false)")
+    # Local development only; production is served by gunicorn (see gunicorn.conf.py)
+    logger.warning("Starting the Werkzeug development server; serve production traffic with `gunicorn app:app`")
 
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
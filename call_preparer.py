@@ -8,19 +8,69 @@ for preparing a call brief with a contact, including:
 - Web search results (LinkedIn and recent activity)
 """
 
-import requests
+import re
+import heapq
 import logging
-from datetime import datetime
-from typing import Dict, List, Any
+import threading
+import orjson
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Dict, List, Any, Iterator, Tuple
+
+from claude_parser import iter_stream_text
+from http_session import create_session
+from hubspot_client import get_contact_deals, hubspot_request
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+
+# Position in a LinkedIn result title ("Name - Title at Company | LinkedIn"):
+# the text after the first " - ", up to the next " - " or "|"
+LINKEDIN_POSITION_RE = re.compile(r' - ((?:(?! - )[^|])*)')
+
+# Pooled session so the brief's many calls reuse TCP+TLS connections. HubSpot
+# calls go through hubspot_request(), so they share hubspot_client's rate
+# limiter with the parse/confirm paths.
+_session = create_session()
+
+# CRM v3 engagement object types searched for the brief, with the properties
+# each needs mapped onto the legacy engagement metadata keys
+ENGAGEMENT_OBJECT_PROPERTIES = {
+    'notes': {'hs_note_body': 'body'},
+    'calls': {'hs_call_body': 'body', 'hs_call_disposition': 'disposition'},
+    'meetings': {'hs_meeting_title': 'title', 'hs_internal_meeting_notes': 'internalMeetingNotes'},
+    'emails': {'hs_email_subject': 'subject', 'hs_email_direction': 'direction'}
+}
+ENGAGEMENT_TYPE_NAMES = {
+    'notes': 'Note',
+    'calls': 'Call',
+    'meetings': 'Meeting',
+    'emails': 'Email'
+}
+
+# Internal IDs of the closed stages in the default sales pipeline
+CLOSED_DEAL_STAGES = frozenset({"closedwon", "closedlost"})
+
+# Longest activity body kept for the brief (HTML notes can run to 100KB+)
+MAX_ACTIVITY_BODY_CHARS = 8000
+
+# Repeated briefs for the same contact reuse recent results: activities for a
+# minute (a note logged in the meantime shows up soon after), web search for
+# half an hour (LinkedIn titles and news change slowly). Only non-empty
+# results are cached, so a failed fetch is retried on the next brief.
+ACTIVITIES_CACHE_TTL_SECONDS = 60
+WEB_SEARCH_CACHE_TTL_SECONDS = 30 * 60
+_activities_cache = TTLCache(maxsize=256, ttl=ACTIVITIES_CACHE_TTL_SECONDS)
+_web_search_cache = TTLCache(maxsize=256, ttl=WEB_SEARCH_CACHE_TTL_SECONDS)
+_cache_lock = threading.Lock()
+
 
 def get_contact_recent_notes(contact_id: str, api_key: str, limit: int = 10) -> List[Dict[str, str]]:
     """
-    Fetch recent activities from HubSpot contact timeline using the associations API.
+    Fetch recent activities (notes, calls, meetings, emails) for a HubSpot contact.
 
     Args:
         contact_id: HubSpot contact ID
@@ -31,113 +81,193 @@ def get_contact_recent_notes(contact_id: str, api_key: str, limit: int = 10) ->
         List of dicts with structure: [{"date": "YYYY-MM-DD", "type": "activity_type", "summary": "..."}]
         Returns empty list on failure
     """
+    cache_key = (contact_id, limit)
+    with _cache_lock:
+        cached = _activities_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached activities for contact %s", contact_id)
+        return cached
+
     try:
-        logger.info(f"Fetching recent activities for contact {contact_id} via associations")
+        logger.info("Fetching recent activities for contact %s", contact_id)
 
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
 
-        all_activities = []
-
-        # First, try to get associated engagements using the associations API
-        # This gets all engagements (notes, calls, meetings, emails) associated with the contact
-        associations_url = f"https://api.hubapi.com/crm/v4/objects/contacts/{contact_id}/associations/engagements"
-
-        try:
-            assoc_response = requests.get(associations_url, headers=headers, timeout=10)
-
-            if assoc_response.status_code == 200:
-                assoc_data = assoc_response.json()
-                engagement_ids = [result.get('toObjectId') for result in assoc_data.get('results', [])]
-
-                logger.info(f"Found {len(engagement_ids)} associated engagements")
-
-                # For each engagement ID, fetch the details
-                for eng_id in engagement_ids[:limit * 2]:  # Get more than limit to filter later
-                    try:
-                        # Get engagement details
-                        eng_url = f"https://api.hubapi.com/engagements/v1/engagements/{eng_id}"
-                        eng_response = requests.get(eng_url, headers=headers, timeout=10)
-
-                        if eng_response.status_code == 200:
-                            eng_data = eng_response.json()
-                            engagement = eng_data.get('engagement', {})
-                            metadata = eng_data.get('metadata', {})
-
-                            # Get engagement type
-                            eng_type = engagement.get('type', 'ACTIVITY').title()
-
-                            # Get timestamp
-                            timestamp = engagement.get('createdAt')
-                            if timestamp:
-                                try:
-                                    date_obj = datetime.fromtimestamp(int(timestamp) / 1000)
-                                    date_str = date_obj.strftime("%Y-%m-%d")
-                                except (ValueError, TypeError):
-                                    date_str = "Unknown date"
-                            else:
-                                date_str = "Unknown date"
-
-                            # Get body/summary based on type
-                            summary = ""
-                            if eng_type == 'Note':
-                                summary = metadata.get('body', '')
-                            elif eng_type == 'Call':
-                                summary = metadata.get('body', '')
-                                disposition = metadata.get('disposition', '')
-                                if disposition:
-                                    summary = f"{disposition}: {summary}" if summary else disposition
-                            elif eng_type == 'Meeting':
-                                # For meetings, ONLY use title and internal notes, NOT the full body/HTML
-                                title = metadata.get('title', '')
-                                internal_notes = metadata.get('internalMeetingNotes', '')
-                                if internal_notes:
-                                    summary = f"{title}: {internal_notes}" if title else internal_notes
-                                else:
-                                    summary = title if title else "Meeting (no details)"
-                            elif eng_type == 'Email' or eng_type == 'Incoming_Email':
-                                # For emails, ONLY use subject, NOT the body
-                                subject = metadata.get('subject', '')
-                                summary = f"Subject: {subject}" if subject else "Email (no subject)"
-
-                            # Store full summary without truncation for raw output
-                            full_summary = summary if summary else f"{eng_type} (no details recorded)"
-
-                            # Create truncated version for summary section
-                            truncated_summary = summary[:200] + "..." if (summary and len(summary) > 200) else summary
-                            if not truncated_summary:
-                                truncated_summary = f"{eng_type} (no details recorded)"
-
-                            all_activities.append({
-                                "date": date_str,
-                                "type": eng_type,
-                                "summary": truncated_summary,
-                                "full_body": full_summary
-                            })
-
-                    except Exception as e:
-                        logger.warning(f"Error fetching engagement {eng_id}: {str(e)}")
-                        continue
-
-        except Exception as e:
-            logger.warning(f"Error fetching associations: {str(e)}")
-
-        # Sort all activities by date (most recent first)
-        all_activities.sort(key=lambda x: x['date'], reverse=True)
-
-        # Take only the top 'limit' activities
-        all_activities = all_activities[:limit]
-
-        logger.info(f"Successfully retrieved {len(all_activities)} activities for contact {contact_id}")
+        # Search each engagement type (notes, calls, meetings, emails) for the
+        # contact's newest 'limit' records; the searches are independent
+        with ThreadPoolExecutor(max_workers=len(ENGAGEMENT_OBJECT_PROPERTIES)) as executor:
+            results = executor.map(
+                lambda object_type: _search_engagements(object_type, contact_id, limit, headers),
+                ENGAGEMENT_OBJECT_PROPERTIES
+            )
+            engagements = [engagement for result in results for engagement in result]
+
+        # The 'limit' most recent, newest first: createdAt is fixed-width UTC
+        # ISO 8601, so it orders chronologically (to the millisecond) as a
+        # string; missing ones come last. Only these are formatted.
+        all_activities = [
+            _format_engagement(eng_type, created_at, metadata)
+            for created_at, eng_type, metadata in heapq.nlargest(limit, engagements, key=itemgetter(0))
+        ]
+
+        logger.info("Successfully retrieved %s activities for contact %s", len(all_activities), contact_id)
+        if all_activities:
+            with _cache_lock:
+                _activities_cache[cache_key] = all_activities
         return all_activities
 
     except Exception as e:
-        logger.error(f"Error fetching activities for contact {contact_id}: {str(e)}")
+        logger.error("Error fetching activities for contact %s: %s", contact_id, e)
+        return []
+
+
+def _search_engagements(object_type: str, contact_id: str, limit: int, headers: Dict[str, str]) -> List[Tuple[str, str, Dict[str, str]]]:
+    """
+    Search the newest engagements of one CRM object type associated with a contact.
+
+    Args:
+        object_type: CRM object type (a key of ENGAGEMENT_OBJECT_PROPERTIES)
+        contact_id: HubSpot contact ID
+        limit: Maximum number of engagements to return
+        headers: HubSpot request headers
+
+    Returns:
+        List of (createdAt, engagement type, metadata) tuples, newest first (empty on failure)
+    """
+    properties = ENGAGEMENT_OBJECT_PROPERTIES[object_type]
+
+    try:
+        response = hubspot_request(
+            'POST',
+            f"/crm/v3/objects/{object_type}/search",
+            headers=headers,
+            json={
+                "filterGroups": [{
+                    "filters": [{
+                        "propertyName": "associations.contact",
+                        "operator": "EQ",
+                        "value": str(contact_id)
+                    }]
+                }],
+                "sorts": [{"propertyName": "hs_createdate", "direction": "DESCENDING"}],
+                "properties": list(properties),
+                "limit": limit
+            },
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            logger.warning("Error searching %s: HubSpot API error %s", object_type, response.status_code)
+            return []
+
+        engagements = []
+        for result in orjson.loads(response.content).get('results', []):
+            props = result.get('properties') or {}
+            # Same metadata keys as the legacy engagements API
+            metadata = {key: props.get(prop) or '' for prop, key in properties.items()}
+
+            eng_type = ENGAGEMENT_TYPE_NAMES[object_type]
+            if metadata.get('direction') == 'INCOMING_EMAIL':
+                eng_type = 'Incoming_Email'
+
+            engagements.append((result.get('createdAt') or '', eng_type, metadata))
+
+        return engagements
+
+    except Exception as e:
+        logger.warning("Error searching %s: %s", object_type, e)
         return []
 
 
+def _summarize_note(metadata: Dict[str, str]) -> str:
+    return metadata.get('body', '')
+
+
+def _summarize_call(metadata: Dict[str, str]) -> str:
+    summary = metadata.get('body', '')
+    disposition = metadata.get('disposition', '')
+    if disposition:
+        summary = f"{disposition}: {summary}" if summary else disposition
+    return summary
+
+
+def _summarize_meeting(metadata: Dict[str, str]) -> str:
+    # For meetings, ONLY use title and internal notes, NOT the full body/HTML
+    title = metadata.get('title', '')
+    internal_notes = metadata.get('internalMeetingNotes', '')
+    if internal_notes:
+        return f"{title}: {internal_notes}" if title else internal_notes
+    return title if title else "Meeting (no details)"
+
+
+def _summarize_email(metadata: Dict[str, str]) -> str:
+    # For emails, ONLY use subject, NOT the body
+    subject = metadata.get('subject', '')
+    return f"Subject: {subject}" if subject else "Email (no subject)"
+
+
+# Summary builder per engagement type
+ENGAGEMENT_SUMMARIZERS = {
+    'Note': _summarize_note,
+    'Call': _summarize_call,
+    'Meeting': _summarize_meeting,
+    'Email': _summarize_email,
+    'Incoming_Email': _summarize_email
+}
+
+
+def _format_engagement(eng_type: str, created_at: str, metadata: Dict[str, str]) -> Dict[str, str]:
+    """
+    Turn one engagement into an activity entry.
+
+    Args:
+        eng_type: Engagement type (Note, Call, Meeting, Email, Incoming_Email)
+        created_at: ISO 8601 creation time from HubSpot
+        metadata: Engagement fields (body, disposition, title, internalMeetingNotes, subject)
+
+    Returns:
+        Dict with date, type, summary and full_body
+    """
+    # Get timestamp (HubSpot sends UTC; shown as a local date)
+    try:
+        date_obj = datetime.strptime(created_at[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        date_str = date_obj.astimezone().strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        date_str = "Unknown date"
+
+    # Get body/summary based on type
+    summarize = ENGAGEMENT_SUMMARIZERS.get(eng_type)
+    summary = summarize(metadata) if summarize else ""
+
+    if not summary:
+        no_details = f"{eng_type} (no details recorded)"
+        return {
+            "date": date_str,
+            "type": eng_type,
+            "summary": no_details,
+            "full_body": no_details
+        }
+
+    # Full body for the raw output and the prompt, capped so a huge HTML note
+    # doesn't stay in memory (the cache) or blow up the prompt; plus a short
+    # version for the summary section
+    if len(summary) > MAX_ACTIVITY_BODY_CHARS:
+        full_summary = summary[:MAX_ACTIVITY_BODY_CHARS] + "..."
+    else:
+        full_summary = summary
+    truncated_summary = summary[:200] + "..." if len(summary) > 200 else summary
+
+    return {
+        "date": date_str,
+        "type": eng_type,
+        "summary": truncated_summary,
+        "full_body": full_summary
+    }
+
+
 def web_search_contact(name: str, company: str, serper_api_key: str = None) -> Dict[str, Any]:
     """
     Search for contact's LinkedIn profile and recent web activity.
@@ -157,7 +287,7 @@ def web_search_contact(name: str, company: str, serper_api_key: str = None) -> D
             "recent_activity": [str]
         }
     """
-    logger.info(f"Searching web for {name} at {company}")
+    logger.info("Searching web for %s at %s", name, company)
 
     result = {
         "linkedin": {},
@@ -167,81 +297,29 @@ def web_search_contact(name: str, company: str, serper_api_key: str = None) -> D
     try:
         # If Serper API key is provided, use it for better results
         if serper_api_key:
+            cache_key = (name.strip().lower(), company.strip().lower())
+            with _cache_lock:
+                cached = _web_search_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached web search for %s at %s", name, company)
+                return cached
+
             headers = {
                 'X-API-KEY': serper_api_key,
                 'Content-Type': 'application/json'
             }
 
-            # Search for LinkedIn profile
-            linkedin_query = f"{name} {company} LinkedIn"
-            linkedin_payload = {
-                'q': linkedin_query,
-                'num': 5
-            }
+            # The LinkedIn and recent-activity searches are independent
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                linkedin_future = executor.submit(_search_linkedin, name, company, headers)
+                activity_future = executor.submit(_search_recent_activity, name, company, headers)
 
-            try:
-                linkedin_response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers=headers,
-                    json=linkedin_payload,
-                    timeout=10
-                )
-
-                if linkedin_response.status_code == 200:
-                    linkedin_data = linkedin_response.json()
-                    organic_results = linkedin_data.get('organic', [])
-
-                    # Find LinkedIn profile URL
-                    for item in organic_results:
-                        link = item.get('link', '')
-                        if 'linkedin.com/in/' in link:
-                            result['linkedin']['profile_url'] = link
-                            # Extract info from snippet and title
-                            snippet = item.get('snippet', '')
-                            title = item.get('title', '')
-
-                            # Title usually has format: "Name - Title at Company | LinkedIn"
-                            if ' - ' in title and '|' in title:
-                                position_part = title.split(' - ')[1].split('|')[0].strip()
-                                result['linkedin']['current_position'] = position_part
-                            else:
-                                result['linkedin']['current_position'] = title.split(' - ')[0] if ' - ' in title else title
-
-                            # Try to extract more info from snippet
-                            result['linkedin']['snippet'] = snippet
-                            break
-
-            except Exception as e:
-                logger.warning(f"Error searching LinkedIn via Serper: {str(e)}")
-
-            # Search for recent activity/posts
-            activity_query = f'"{name}" {company} (post OR article OR news) 2024..2025'
-            activity_payload = {
-                'q': activity_query,
-                'num': 5
-            }
-
-            try:
-                activity_response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers=headers,
-                    json=activity_payload,
-                    timeout=10
-                )
-
-                if activity_response.status_code == 200:
-                    activity_data = activity_response.json()
-                    organic_results = activity_data.get('organic', [])
+            result['linkedin'] = linkedin_future.result()
+            result['recent_activity'] = activity_future.result()
 
-                    for item in organic_results[:3]:
-                        title = item.get('title', '')
-                        snippet = item.get('snippet', '')
-                        if title or snippet:
-                            # Don't truncate - include full snippet
-                            result['recent_activity'].append(f"{title}: {snippet}")
-
-            except Exception as e:
-                logger.warning(f"Error searching recent activity via Serper: {str(e)}")
+            if result['linkedin'] or result['recent_activity']:
+                with _cache_lock:
+                    _web_search_cache[cache_key] = result
 
         else:
             # No API key - return basic message
@@ -249,11 +327,94 @@ def web_search_contact(name: str, company: str, serper_api_key: str = None) -> D
             result['recent_activity'].append("Web search not configured - add SERPER_API_KEY to enable")
 
     except Exception as e:
-        logger.error(f"Error in web search: {str(e)}")
+        logger.error("Error in web search: %s", e)
 
     return result
 
 
+def _search_linkedin(name: str, company: str, headers: Dict[str, str]) -> Dict[str, str]:
+    """Find the contact's LinkedIn profile via Serper, or return {} if none was found"""
+    linkedin = {}
+
+    # Search for LinkedIn profile
+    linkedin_query = f"{name} {company} LinkedIn"
+    linkedin_payload = {
+        'q': linkedin_query,
+        'num': 5
+    }
+
+    try:
+        linkedin_response = _session.post(
+            SERPER_SEARCH_URL,
+            headers=headers,
+            json=linkedin_payload,
+            timeout=10
+        )
+
+        if linkedin_response.status_code == 200:
+            linkedin_data = orjson.loads(linkedin_response.content)
+            organic_results = linkedin_data.get('organic', [])
+
+            # Find LinkedIn profile URL
+            for item in organic_results:
+                link = item.get('link', '')
+                if 'linkedin.com/in/' in link:
+                    linkedin['profile_url'] = link
+                    # Extract info from snippet and title
+                    snippet = item.get('snippet', '')
+                    title = item.get('title', '')
+
+                    # Title usually has format: "Name - Title at Company | LinkedIn"
+                    match = LINKEDIN_POSITION_RE.search(title) if '|' in title else None
+                    if match:
+                        linkedin['current_position'] = match.group(1).strip()
+                    else:
+                        linkedin['current_position'] = title.split(' - ', 1)[0]
+
+                    # Try to extract more info from snippet
+                    linkedin['snippet'] = snippet
+                    break
+
+    except Exception as e:
+        logger.warning("Error searching LinkedIn via Serper: %s", e)
+
+    return linkedin
+
+
+def _search_recent_activity(name: str, company: str, headers: Dict[str, str]) -> List[str]:
+    """Find the contact's recent posts/articles/news via Serper"""
+    recent_activity = []
+
+    # Search for recent activity/posts
+    activity_query = f'"{name}" {company} (post OR article OR news) 2024..2025'
+    activity_payload = {
+        'q': activity_query,
+        'num': 5
+    }
+
+    try:
+        activity_response = _session.post(
+            SERPER_SEARCH_URL,
+            headers=headers,
+            json=activity_payload,
+            timeout=10
+        )
+
+        if activity_response.status_code == 200:
+            activity_data = orjson.loads(activity_response.content)
+            organic_results = activity_data.get('organic', [])
+
+            for item in organic_results[:3]:
+                title = item.get('title', '')
+                snippet = item.get('snippet', '')
+                if title or snippet:
+                    # Don't truncate - include full snippet
+                    recent_activity.append(f"{title}: {snippet}")
+
+    except Exception as e:
+        logger.warning("Error searching recent activity via Serper: %s", e)
+
+    return recent_activity
 
 
 def prepare_call_brief(
@@ -283,7 +444,7 @@ def prepare_call_brief(
         - web_findings: Web search results (LinkedIn, recent posts)
     """
     try:
-        logger.info(f"Preparing call brief for contact {contact_id}")
+        logger.info("Preparing call brief for contact %s", contact_id)
 
         # Initialize result structure
         brief = {
@@ -296,43 +457,38 @@ def prepare_call_brief(
             }
         }
 
-        # 1. Get recent activities from HubSpot
-        try:
-            brief["recent_activities"] = get_contact_recent_notes(
-                contact_id=contact_id,
-                api_key=hubspot_api_key,
-                limit=10
-            )
-        except Exception as e:
-            logger.error(f"Failed to get recent activities: {str(e)}")
-            # Continue with empty activities
-
-        # 2. Get live deals from HubSpot
-        try:
-            from hubspot_client import get_contact_deals
-            deals = get_contact_deals(contact_id, hubspot_api_key)
-            # Filter for open deals only
-            brief["live_deals"] = [d for d in deals if d.get("dealstage") not in ["closedwon", "closedlost"]]
-        except Exception as e:
-            logger.error(f"Failed to get deals: {str(e)}")
-            # Continue with empty deals
-
-        # 3. Perform web search for LinkedIn and recent activity
-        try:
-            name = contact_data.get("name", "")
-            company = contact_data.get("company", "")
+        # The three sources are independent, so they are fetched concurrently
+        name = contact_data.get("name", "")
+        company = contact_data.get("company", "")
 
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            activities_future = executor.submit(_fetch_recent_activities, contact_id, hubspot_api_key)
+            deals_future = executor.submit(_fetch_live_deals, contact_id, hubspot_api_key)
+            web_future = None
             if name and company:
-                brief["web_findings"] = web_search_contact(name, company, serper_api_key)
-        except Exception as e:
-            logger.error(f"Failed to perform web search: {str(e)}")
-            # Continue with empty web findings
+                web_future = executor.submit(_fetch_web_findings, name, company, serper_api_key)
+
+        # 1. Recent activities from HubSpot
+        activities = activities_future.result()
+        if activities is not None:
+            brief["recent_activities"] = activities
+
+        # 2. Live deals from HubSpot
+        live_deals = deals_future.result()
+        if live_deals is not None:
+            brief["live_deals"] = live_deals
+
+        # 3. Web search for LinkedIn and recent activity
+        if web_future:
+            web_findings = web_future.result()
+            if web_findings is not None:
+                brief["web_findings"] = web_findings
 
-        logger.info(f"Successfully prepared call brief for contact {contact_id}")
+        logger.info("Successfully prepared call brief for contact %s", contact_id)
         return brief
 
     except Exception as e:
-        logger.error(f"Critical error preparing call brief: {str(e)}")
+        logger.error("Critical error preparing call brief: %s", e)
         # Return partial data rather than failing completely
         return {
             "contact": contact_data,
@@ -343,6 +499,58 @@ def prepare_call_brief(
         }
 
 
+def _fetch_recent_activities(contact_id: str, hubspot_api_key: str) -> List[Dict[str, str]]:
+    """Get recent HubSpot activities for the brief, or None if the fetch failed"""
+    try:
+        return get_contact_recent_notes(
+            contact_id=contact_id,
+            api_key=hubspot_api_key,
+            limit=10
+        )
+    except Exception as e:
+        logger.error("Failed to get recent activities: %s", e)
+        # Continue with empty activities
+        return None
+
+
+def _fetch_live_deals(contact_id: str, hubspot_api_key: str) -> List[Dict[str, Any]]:
+    """Get the contact's open HubSpot deals for the brief, or None if the fetch failed"""
+    try:
+        deals = get_contact_deals(contact_id, hubspot_api_key)
+        # Filter for open deals only
+        return [d for d in deals if d.get("dealstage") not in CLOSED_DEAL_STAGES]
+    except Exception as e:
+        logger.error("Failed to get deals: %s", e)
+        # Continue with empty deals
+        return None
+
+
+def _fetch_web_findings(name: str, company: str, serper_api_key: str = None) -> Dict[str, Any]:
+    """Run the web search for the brief, or return None if it failed"""
+    try:
+        return web_search_contact(name, company, serper_api_key)
+    except Exception as e:
+        logger.error("Failed to perform web search: %s", e)
+        # Continue with empty web findings
+        return None
+
+
+# Fallback brief for a contact with no activities, deals or web findings
+EMPTY_FALLBACK_BRIEF = "\n".join([
+    "## Engagement Summary",
+    "",
+    "No recent activity recorded.",
+    "",
+    "## Active Deals Summary",
+    "",
+    "No active deals.",
+    "",
+    "## Professional Updates",
+    "",
+    "No recent web activity found."
+])
+
+
 def _generate_fallback_brief(data: Dict[str, Any]) -> str:
     """
     Generate a fallback brief when Claude API is unavailable.
@@ -356,6 +564,11 @@ def _generate_fallback_brief(data: Dict[str, Any]) -> str:
     recent_activities = data.get("recent_activities", [])
     live_deals = data.get("live_deals", [])
     web_findings = data.get("web_findings", {})
+    linkedin_info = web_findings.get("linkedin", {})
+    recent_activity = web_findings.get("recent_activity", [])
+
+    if not (recent_activities or live_deals or linkedin_info or recent_activity):
+        return EMPTY_FALLBACK_BRIEF
 
     # Build fallback brief
     brief_parts = []
@@ -367,7 +580,7 @@ def _generate_fallback_brief(data: Dict[str, Any]) -> str:
     if recent_activities:
         # Summary
         activity_count = len(recent_activities)
-        types = list(set([a.get("type", "Activity") for a in recent_activities]))
+        types = list(dict.fromkeys(a.get("type", "Activity") for a in recent_activities))
         brief_parts.append(f"Found {activity_count} recent interactions including {', '.join(types)}.")
         brief_parts.append("")
 
@@ -411,9 +624,6 @@ def _generate_fallback_brief(data: Dict[str, Any]) -> str:
     brief_parts.append("## Professional Updates")
     brief_parts.append("")
 
-    linkedin_info = web_findings.get("linkedin", {})
-    recent_activity = web_findings.get("recent_activity", [])
-
     if linkedin_info:
         current_position = linkedin_info.get("current_position", "")
         if current_position:
@@ -434,6 +644,160 @@ def _generate_fallback_brief(data: Dict[str, Any]) -> str:
     return "\n".join(brief_parts)
 
 
+# Fixed opening and closing of the call brief prompt; only the sections in
+# between depend on the contact
+BRIEF_PROMPT_HEADER = "\n".join([
+    "You are an expert executive assistant preparing a concise call brief for an upcoming investor meeting.",
+    "",
+    "Based on the following information, create a brief that is scannable, actionable, and focuses on what's useful for the call.",
+    ""
+])
+
+BRIEF_PROMPT_INSTRUCTIONS = "\n".join([
+    "---",
+    "",
+    "Create a call brief with EXACTLY these 3 sections and NO other sections:",
+    "",
+    "## Engagement Summary",
+    "",
+    "Write a comprehensive summary paragraph (4-6 sentences) that captures:",
+    "- The history and context of the relationship",
+    "- Key developments and transitions mentioned",
+    "- Current status and any scheduled meetings",
+    "- Overall relationship trajectory",
+    "",
+    "Then list ALL activities with their FULL content (do not truncate or clean up):",
+    "",
+    "[Date] Type:",
+    "Complete body content exactly as provided",
+    "",
+    "## Active Deals Summary",
+    "",
+    "List each deal exactly as shown above with all fields:",
+    "- Deal name | Stage | Amount | Next steps",
+    "",
+    "If no deals, write: No active deals.",
+    "",
+    "## Professional Updates",
+    "",
+    "List any LinkedIn/web information as bullet points:",
+    "- Current position and when joined",
+    "- Recent posts or activity",
+    "",
+    "If no information, write: No recent web activity found.",
+    "",
+    "CRITICAL RULES:",
+    "- Use ONLY markdown headers (##) for the 3 section titles",
+    "- Do NOT add any other sections besides these 3",
+    "- Do NOT clean up, format, or truncate the activity bodies - copy them EXACTLY",
+    "- Do NOT strip out email disclaimers, signatures, or HTML - include everything",
+    "- Write a detailed, comprehensive summary paragraph that tells the full story",
+    "- Keep all deal fields (name, stage, amount, next steps)"
+])
+
+
+def _build_brief_prompt(data: Dict[str, Any]) -> str:
+    """
+    Build the Claude prompt for a call brief from the gathered data.
+
+    Args:
+        data: Brief data from prepare_call_brief()
+
+    Returns:
+        The prompt text
+    """
+    contact = data.get("contact", {})
+    recent_activities = data.get("recent_activities", [])
+    live_deals = data.get("live_deals", [])
+    web_findings = data.get("web_findings", {})
+
+    sections = [BRIEF_PROMPT_HEADER]
+
+    # Add contact information
+    sections.append(
+        "**CONTACT INFORMATION:**\n"
+        f"- Name: {contact.get('name', 'Unknown')}\n"
+        f"- Company: {contact.get('company', 'Unknown')}\n"
+        f"- Title: {contact.get('jobtitle', 'Not specified')}\n"
+        f"- Email: {contact.get('email', 'Not specified')}\n"
+    )
+
+    # Add recent activities with FULL bodies
+    if recent_activities:
+        activity_blocks = "".join(
+            f"\n[{activity.get('date', 'Unknown date')}] {activity.get('type', 'Activity')}:\n"
+            f"{activity.get('full_body', activity.get('summary', ''))}\n"
+            for activity in recent_activities
+        )
+        sections.append(f"**RECENT INTERACTIONS (Notes, Meetings, Emails):**\n{activity_blocks}")
+    else:
+        sections.append("**RECENT INTERACTIONS:** None recorded\n")
+
+    # Add live deals
+    if live_deals:
+        deal_lines = "".join(f"{_format_deal_line(deal)}\n" for deal in live_deals)
+        sections.append(f"**LIVE DEALS:**\n{deal_lines}")
+    else:
+        sections.append("**LIVE DEALS:** None\n")
+
+    # Add web findings if available
+    linkedin_info = web_findings.get("linkedin", {})
+    recent_activity = web_findings.get("recent_activity", [])
+
+    if linkedin_info or recent_activity:
+        web_lines = ["**LINKEDIN & WEB ACTIVITY:**"]
+        if linkedin_info:
+            current_position = linkedin_info.get("current_position", "")
+            if current_position:
+                web_lines.append(f"- Current Position: {current_position}")
+            joined_date = linkedin_info.get("joined_date", "")
+            if joined_date:
+                web_lines.append(f"- Joined: {joined_date}")
+
+        if recent_activity:
+            web_lines.append("- Recent Posts/Activity:")
+            web_lines.extend(f"  - {activity}" for activity in recent_activity[:3])
+        web_lines.append("")
+        sections.append("\n".join(web_lines))
+
+    # Add instructions
+    sections.append(BRIEF_PROMPT_INSTRUCTIONS)
+
+    return "\n".join(sections)
+
+
+def _format_deal_line(deal: Dict[str, Any]) -> str:
+    """Format one live deal as a prompt bullet"""
+    deal_line = f"- {deal.get('name', 'Unnamed Deal')} | Stage: {deal.get('stage', 'Unknown stage')}"
+    amount = deal.get("amount", "")
+    if amount:
+        deal_line += f" | Amount: ${amount}"
+    next_step = deal.get("next_step", "")
+    if next_step:
+        deal_line += f" | Next: {next_step}"
+    next_step_date = deal.get("next_step_date", "")
+    if next_step_date:
+        deal_line += f" by {next_step_date}"
+    return deal_line
+
+
+def _brief_payload(prompt: str, stream: bool = False) -> Dict[str, Any]:
+    """Build the Messages API request body for a call brief"""
+    payload = {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 3000,
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    }
+    if stream:
+        payload["stream"] = True
+    return payload
+
+
 def synthesize_brief_with_claude(
     data: Dict[str, Any],
     anthropic_api_key: str
@@ -462,127 +826,7 @@ def synthesize_brief_with_claude(
         logger.info("Synthesizing call brief with Claude")
 
         contact = data.get("contact", {})
-        recent_activities = data.get("recent_activities", [])
-        live_deals = data.get("live_deals", [])
-        web_findings = data.get("web_findings", {})
-
-        # Build the prompt for Claude
-        prompt_parts = []
-
-        prompt_parts.append("You are an expert executive assistant preparing a concise call brief for an upcoming investor meeting.")
-        prompt_parts.append("")
-        prompt_parts.append("Based on the following information, create a brief that is scannable, actionable, and focuses on what's useful for the call.")
-        prompt_parts.append("")
-
-        # Add contact information
-        prompt_parts.append("**CONTACT INFORMATION:**")
-        prompt_parts.append(f"- Name: {contact.get('name', 'Unknown')}")
-        prompt_parts.append(f"- Company: {contact.get('company', 'Unknown')}")
-        prompt_parts.append(f"- Title: {contact.get('jobtitle', 'Not specified')}")
-        prompt_parts.append(f"- Email: {contact.get('email', 'Not specified')}")
-        prompt_parts.append("")
-
-        # Add recent activities with FULL bodies
-        if recent_activities:
-            prompt_parts.append("**RECENT INTERACTIONS (Notes, Meetings, Emails):**")
-            prompt_parts.append("")
-            for activity in recent_activities:
-                date = activity.get("date", "Unknown date")
-                activity_type = activity.get("type", "Activity")
-                full_body = activity.get("full_body", activity.get("summary", ""))
-                prompt_parts.append(f"[{date}] {activity_type}:")
-                prompt_parts.append(f"{full_body}")
-                prompt_parts.append("")
-        else:
-            prompt_parts.append("**RECENT INTERACTIONS:** None recorded")
-            prompt_parts.append("")
-
-        # Add live deals
-        if live_deals:
-            prompt_parts.append("**LIVE DEALS:**")
-            for deal in live_deals:
-                deal_name = deal.get("name", "Unnamed Deal")
-                deal_stage = deal.get("stage", "Unknown stage")
-                amount = deal.get("amount", "")
-                next_step = deal.get("next_step", "")
-                next_step_date = deal.get("next_step_date", "")
-
-                deal_line = f"- {deal_name} | Stage: {deal_stage}"
-                if amount:
-                    deal_line += f" | Amount: ${amount}"
-                if next_step:
-                    deal_line += f" | Next: {next_step}"
-                if next_step_date:
-                    deal_line += f" by {next_step_date}"
-
-                prompt_parts.append(deal_line)
-            prompt_parts.append("")
-        else:
-            prompt_parts.append("**LIVE DEALS:** None")
-            prompt_parts.append("")
-
-        # Add web findings if available
-        linkedin_info = web_findings.get("linkedin", {})
-        recent_activity = web_findings.get("recent_activity", [])
-
-        if linkedin_info or recent_activity:
-            prompt_parts.append("**LINKEDIN & WEB ACTIVITY:**")
-            if linkedin_info:
-                current_position = linkedin_info.get("current_position", "")
-                if current_position:
-                    prompt_parts.append(f"- Current Position: {current_position}")
-                joined_date = linkedin_info.get("joined_date", "")
-                if joined_date:
-                    prompt_parts.append(f"- Joined: {joined_date}")
-
-            if recent_activity:
-                prompt_parts.append("- Recent Posts/Activity:")
-                for activity in recent_activity[:3]:
-                    prompt_parts.append(f"  - {activity}")
-            prompt_parts.append("")
-
-        # Add instructions
-        prompt_parts.append("---")
-        prompt_parts.append("")
-        prompt_parts.append("Create a call brief with EXACTLY these 3 sections and NO other sections:")
-        prompt_parts.append("")
-        prompt_parts.append("## Engagement Summary")
-        prompt_parts.append("")
-        prompt_parts.append("Write a comprehensive summary paragraph (4-6 sentences) that captures:")
-        prompt_parts.append("- The history and context of the relationship")
-        prompt_parts.append("- Key developments and transitions mentioned")
-        prompt_parts.append("- Current status and any scheduled meetings")
-        prompt_parts.append("- Overall relationship trajectory")
-        prompt_parts.append("")
-        prompt_parts.append("Then list ALL activities with their FULL content (do not truncate or clean up):")
-        prompt_parts.append("")
-        prompt_parts.append("[Date] Type:")
-        prompt_parts.append("Complete body content exactly as provided")
-        prompt_parts.append("")
-        prompt_parts.append("## Active Deals Summary")
-        prompt_parts.append("")
-        prompt_parts.append("List each deal exactly as shown above with all fields:")
-        prompt_parts.append("- Deal name | Stage | Amount | Next steps")
-        prompt_parts.append("")
-        prompt_parts.append("If no deals, write: No active deals.")
-        prompt_parts.append("")
-        prompt_parts.append("## Professional Updates")
-        prompt_parts.append("")
-        prompt_parts.append("List any LinkedIn/web information as bullet points:")
-        prompt_parts.append("- Current position and when joined")
-        prompt_parts.append("- Recent posts or activity")
-        prompt_parts.append("")
-        prompt_parts.append("If no information, write: No recent web activity found.")
-        prompt_parts.append("")
-        prompt_parts.append("CRITICAL RULES:")
-        prompt_parts.append("- Use ONLY markdown headers (##) for the 3 section titles")
-        prompt_parts.append("- Do NOT add any other sections besides these 3")
-        prompt_parts.append("- Do NOT clean up, format, or truncate the activity bodies - copy them EXACTLY")
-        prompt_parts.append("- Do NOT strip out email disclaimers, signatures, or HTML - include everything")
-        prompt_parts.append("- Write a detailed, comprehensive summary paragraph that tells the full story")
-        prompt_parts.append("- Keep all deal fields (name, stage, amount, next steps)")
-
-        prompt = "\n".join(prompt_parts)
+        prompt = _build_brief_prompt(data)
 
         # Call Claude API
         headers = {
@@ -591,18 +835,9 @@ def synthesize_brief_with_claude(
             "content-type": "application/json"
         }
 
-        payload = {
-            "model": "claude-sonnet-4-20250514",
-            "max_tokens": 3000,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        }
+        payload = _brief_payload(prompt)
 
-        response = requests.post(
+        response = _session.post(
             "https://api.anthropic.com/v1/messages",
             headers=headers,
             json=payload,
@@ -610,7 +845,7 @@ def synthesize_brief_with_claude(
         )
 
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             brief_text = response_data.get("content", [{}])[0].get("text", "")
 
             logger.info("Successfully synthesized brief with Claude")
@@ -621,11 +856,11 @@ def synthesize_brief_with_claude(
                 "raw_data": data
             }
         else:
-            logger.warning(f"Claude API returned status {response.status_code}: {response.text}")
+            logger.warning("Claude API returned status %s: %s", response.status_code, response.text)
             raise Exception(f"Claude API error: {response.status_code}")
 
     except Exception as e:
-        logger.error(f"Error synthesizing brief with Claude: {str(e)}")
+        logger.error("Error synthesizing brief with Claude: %s", e)
 
         # Generate fallback brief
         fallback_brief = _generate_fallback_brief(data)
@@ -636,3 +871,74 @@ def synthesize_brief_with_claude(
             "raw_data": data,
             "error": f"Claude API unavailable, generated fallback brief: {str(e)}"
         }
+
+
+def stream_brief_with_claude(
+    data: Dict[str, Any],
+    anthropic_api_key: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of synthesize_brief_with_claude.
+
+    Args:
+        data: Brief data from prepare_call_brief()
+        anthropic_api_key: Anthropic API key for Claude
+
+    Yields:
+        {"type": "token", "text": "..."} for each fragment as Claude writes it,
+        then one {"type": "complete", "brief": {...}} with the same structure
+        synthesize_brief_with_claude returns (including the fallback brief and
+        "error" if the API failed part-way)
+    """
+    contact = data.get("contact", {})
+
+    try:
+        logger.info("Streaming call brief synthesis from Claude")
+
+        headers = {
+            "x-api-key": anthropic_api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        }
+
+        response = _session.post(
+            "https://api.anthropic.com/v1/messages",
+            headers=headers,
+            json=_brief_payload(_build_brief_prompt(data), stream=True),
+            timeout=30,
+            stream=True
+        )
+
+        with response:
+            if response.status_code != 200:
+                logger.warning("Claude API returned status %s: %s", response.status_code, response.text)
+                raise Exception(f"Claude API error: {response.status_code}")
+
+            text_parts = []
+            for text in iter_stream_text(response):
+                text_parts.append(text)
+                yield {"type": "token", "text": text}
+
+        logger.info("Successfully streamed brief from Claude")
+
+        yield {
+            "type": "complete",
+            "brief": {
+                "brief_text": "".join(text_parts),
+                "contact": contact,
+                "raw_data": data
+            }
+        }
+
+    except Exception as e:
+        logger.error("Error streaming brief from Claude: %s", e)
+
+        yield {
+            "type": "complete",
+            "brief": {
+                "brief_text": _generate_fallback_brief(data),
+                "contact": contact,
+                "raw_data": data,
+                "error": f"Claude API unavailable, generated fallback brief: {str(e)}"
+            }
+        }
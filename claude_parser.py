@@ -3,13 +3,92 @@ Claude API Parser
 Uses Anthropic's Claude to parse and structure meeting notes
 """
 
-import json
+import re
+import time
 import logging
+import orjson
 from datetime import datetime, timedelta
-import requests
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
+ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_BATCHES_URL = "https://api.anthropic.com/v1/messages/batches"
+PARSER_MODEL = "claude-sonnet-4-5-20250929"
+
+# Shared pooled session so repeated calls reuse TCP+TLS connections
+_session = create_session()
+
+# (connect, read) timeouts in seconds; the read timeout bounds the wait between
+# bytes, so long streamed responses are fine but a stalled socket is not
+ANTHROPIC_TIMEOUT = (5, 120)
+
+# Output token budget per parse: the base covers contact, deal and summary,
+# each optional section adds its share. A response cut off by the cap is
+# retried once with MAX_PARSE_TOKENS.
+PARSE_BASE_MAX_TOKENS = 1200
+PARSE_PREFERENCES_MAX_TOKENS = 900
+PARSE_TODOS_MAX_TOKENS = 1200
+MAX_PARSE_TOKENS = 4096
+
+# Concurrent parse requests in parse_meeting_notes_many()
+MAX_PARSE_WORKERS = 8
+
+# Message Batches polling for parse_meeting_notes_batch()
+BATCH_POLL_INTERVAL_SECONDS = 10
+BATCH_MAX_WAIT_SECONDS = 60 * 60
+
+# Optional markdown code fence (with any language tag) around the JSON response
+CODE_FENCE_RE = re.compile(r'^\s*(?:```[A-Za-z]*)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+
+# Bump when the prompt changes so cached parses made with the old prompt are not reused
+PROMPT_VERSION = "2"
+
+# Static prompt sections, built once at import. They form the system prompt,
+# which Anthropic caches between calls; the due date and the notes themselves
+# go in the user turn.
+CORE_PROMPT_SECTION = """You are a structured CRM assistant. Parse these investor call notes and extract:
+
+1. CONTACT INFORMATION:
+   - Investor/Company name (use the FULL company name as mentioned - e.g., "Waypoint Capital Partners" not just "Waypoint", "Sequoia Capital" not just "Sequoia")
+   - Contact person name
+   - Email (if mentioned)
+
+2. DEAL INFORMATION (if mentioned):
+   - Deal name or company name (e.g., "Acme Corp Acquisition", "TechCo Series A")
+   - Any keywords that would help identify the deal in a search
+   - Intelligently suggest a next step based on the call notes context (e.g., "Send pitch deck", "Schedule follow-up call", "Send financial projections")
+   - Suggest an appropriate deal stage based on the conversation (use one of: appointmentscheduled, qualifiedtobuy, presentationscheduled, decisionmakerboughtin, contractsent, 1110891580, closedwon, closedlost, 1173780286)
+
+3. CALL SUMMARY:
+   - Create bullet points (3-7 bullets) summarizing key discussion points
+   - Mark any action items inline with [TO-DO] prefix"""
+
+PREFERENCES_PROMPT_SECTION = """
+
+4. INVESTOR PREFERENCES (only extract if explicitly mentioned):
+   Extract ONLY from these allowed values:
+   - Check Size: $50M+, $25M - $50M, $10M - $25M, $5M - $10M, $2M - $5M, $1M - $2M, $500 - $1M, <$500k
+   - Deal Structure: Flexible, Structured Equity, Debt, Non-Control Equity, Control Equity
+   - Style: Board Seat, Passive, Active, Anchor / Lead
+   - Industry: Software, Healthcare, Industrials, Business Services, Energy, Real Estate
+   - Company Stage: Special Situations, Buyout / Mature, Growth, Venture / Startup
+   - Key Investment Criteria: Low Leverage, Cash Burn OK, High Growth, Low EBITDA Multiple, Cash Flow Positive
+   - Capital Type: GP Sponsor, LP Sponsor, Fund of Funds, HNW Individual, Family Office
+   - When to Call: Post-LOI Signed, Pre-LOI OK, Pre-IOI / Early, Any time
+
+   Also extract free-form preference notes for any preferences that don't fit the dropdowns."""
+
+TODOS_PROMPT_SECTION = """
+
+5. TO-DO ITEMS:
+   For each action item, create:
+   - Task Name: ≤25 words, clear and specific
+   - Due Date: the default due date given with the notes (YYYY-MM-DD format)
+   - Next Step: detailed description of what needs to be done"""
+
 # Allowed dropdown values (same as in notion_client.py)
 ALLOWED_VALUES = {
     'Check Size': [
@@ -45,6 +124,9 @@ ALLOWED_VALUES = {
     ]
 }
 
+# Frozen copies of ALLOWED_VALUES for constant-time membership checks
+ALLOWED_VALUE_SETS = {category: frozenset(values) for category, values in ALLOWED_VALUES.items()}
+
 
 def validate_preference_values(preferences):
     """
@@ -65,7 +147,8 @@ def validate_preference_values(preferences):
             validated[category] = values
             continue
 
-        if category not in ALLOWED_VALUES:
+        allowed = ALLOWED_VALUE_SETS.get(category)
+        if allowed is None:
             # Unknown category, skip
             continue
 
@@ -76,7 +159,7 @@ def validate_preference_values(preferences):
         # Filter valid values
         valid_values = []
         for value in values:
-            if value in ALLOWED_VALUES[category]:
+            if isinstance(value, str) and value in allowed:
                 valid_values.append(value)
             else:
                 logger.warning(f"Invalid value '{value}' for category '{category}', skipping")
@@ -91,7 +174,364 @@ def validate_preference_values(preferences):
     return validated
 
 
-def parse_meeting_notes(notes_text, api_key, parse_preferences=True, parse_todos=True):
+@lru_cache(maxsize=4)
+def _json_structure_text(parse_preferences, parse_todos):
+    """
+    Render the expected JSON response structure for the requested sections
+
+    Args:
+        parse_preferences (bool): Whether investor preferences are parsed
+        parse_todos (bool): Whether to-do items are parsed
+
+    Returns:
+        str: Indented JSON example to embed in the prompt
+    """
+    json_structure = {
+        "contact": {"company_name": "", "person_name": "", "email": ""},
+        "deal": {
+            "deal_name": "",
+            "search_keywords": "",
+            "suggested_next_step": "",
+            "suggested_stage": ""
+        },
+        "summary": ["bullet 1", "bullet 2"]
+    }
+
+    if parse_preferences:
+        json_structure["preferences"] = {
+            "Check Size": [],
+            "Deal Structure": [],
+            "Industry": [],
+            "Preference Notes": ""
+        }
+
+    if parse_todos:
+        json_structure["todos"] = [
+            {"task_name": "", "due_date": "YYYY-MM-DD", "next_step": ""}
+        ]
+
+    return orjson.dumps(json_structure, option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache(maxsize=4)
+def _system_prompt(parse_preferences, parse_todos):
+    """
+    Build the static instructions for the requested sections
+
+    Args:
+        parse_preferences (bool): Whether investor preferences are parsed
+        parse_todos (bool): Whether to-do items are parsed
+
+    Returns:
+        str: System prompt text (identical across calls, so it can be cached)
+    """
+    prompt_sections = [CORE_PROMPT_SECTION]
+
+    # Only add investor preferences section if requested
+    if parse_preferences:
+        prompt_sections.append(PREFERENCES_PROMPT_SECTION)
+
+    # Only add to-do items section if requested
+    if parse_todos:
+        prompt_sections.append(TODOS_PROMPT_SECTION)
+
+    prompt_sections.append(f"""
+
+Return ONLY valid JSON with this structure:
+{_json_structure_text(parse_preferences, parse_todos)}""")
+
+    return ''.join(prompt_sections)
+
+
+def _extract_contact_block(partial_text):
+    """
+    Pull the "contact" object out of a partially streamed JSON response
+
+    Args:
+        partial_text (str): Response text received so far
+
+    Returns:
+        dict: The contact object once its closing brace has arrived, else None
+    """
+    key_index = partial_text.find('"contact"')
+    if key_index == -1:
+        return None
+
+    start = partial_text.find('{', key_index)
+    if start == -1:
+        return None
+
+    # Brace-count from the opening brace, ignoring braces inside strings
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(partial_text)):
+        char = partial_text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                try:
+                    contact = orjson.loads(partial_text[start:index + 1])
+                except orjson.JSONDecodeError:
+                    return None
+                return contact if isinstance(contact, dict) else None
+
+    return None
+
+
+def iter_stream_text(response, message_info=None):
+    """
+    Yield the text deltas of a streamed (server-sent events) Messages response
+
+    Args:
+        response (requests.Response): Streaming response from the Messages API
+        message_info (dict): Optional dict that receives the message's
+            'stop_reason' once the stream reports it
+
+    Yields:
+        str: Each text fragment in order
+
+    Raises:
+        ValueError: If the stream reports an error event
+    """
+    response.encoding = 'utf-8'
+
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith('data:'):
+            continue
+
+        event = orjson.loads(line[5:])
+        event_type = event.get('type')
+
+        if event_type == 'error':
+            raise ValueError(f"Anthropic stream error: {event.get('error', {}).get('message', event)}")
+
+        if event_type == 'content_block_delta':
+            yield event.get('delta', {}).get('text', '')
+        elif event_type == 'message_delta' and message_info is not None:
+            message_info['stop_reason'] = event.get('delta', {}).get('stop_reason')
+
+
+def _read_streamed_text(response, on_contact):
+    """
+    Accumulate the text of a streamed Messages response
+
+    Args:
+        response (requests.Response): Streaming response from the Messages API
+        on_contact (callable): Called once with the contact dict as soon as it is complete
+
+    Returns:
+        tuple: (full response text, stop_reason)
+    """
+    response_text = ''
+    contact_sent = False
+    message_info = {}
+
+    for text in iter_stream_text(response, message_info):
+        response_text += text
+
+        if not contact_sent:
+            contact = _extract_contact_block(response_text)
+            if contact is not None:
+                contact_sent = True
+                try:
+                    on_contact(contact)
+                except Exception as e:
+                    # The callback is only an early start; parsing continues regardless
+                    logger.warning(f"Contact callback failed: {str(e)}")
+
+    return response_text, message_info.get('stop_reason')
+
+
+def _anthropic_headers(api_key):
+    """Request headers for the Anthropic Messages API"""
+    return {
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01",
+        "content-type": "application/json"
+    }
+
+
+def _parse_max_tokens(parse_preferences, parse_todos):
+    """Output token cap sized to the sections Claude is asked to return"""
+    max_tokens = PARSE_BASE_MAX_TOKENS
+    if parse_preferences:
+        max_tokens += PARSE_PREFERENCES_MAX_TOKENS
+    if parse_todos:
+        max_tokens += PARSE_TODOS_MAX_TOKENS
+    return max_tokens
+
+
+def _build_parse_params(notes_text, parse_preferences, parse_todos, tomorrow, max_tokens=None):
+    """
+    Build the Messages API request body for one set of notes
+
+    Args:
+        notes_text (str): Raw meeting notes text
+        parse_preferences (bool): Whether investor preferences are parsed
+        parse_todos (bool): Whether to-do items are parsed
+        tomorrow (str): Default due date (YYYY-MM-DD) for to-do items
+        max_tokens (int): Output token cap (default: sized to the requested sections)
+
+    Returns:
+        dict: Messages API parameters
+    """
+    # Only the notes (and the default due date) vary per call
+    user_prompt = f"MEETING NOTES:\n{notes_text}"
+    if parse_todos:
+        user_prompt = f"Default due date for to-do items: {tomorrow}\n\n{user_prompt}"
+
+    return {
+        "model": PARSER_MODEL,
+        "max_tokens": max_tokens or _parse_max_tokens(parse_preferences, parse_todos),
+        "system": [
+            {
+                "type": "text",
+                "text": _system_prompt(parse_preferences, parse_todos),
+                "cache_control": {"type": "ephemeral"}
+            }
+        ],
+        "messages": [
+            {
+                "role": "user",
+                "content": user_prompt
+            }
+        ]
+    }
+
+
+def _structure_response_text(response_text, tomorrow):
+    """
+    Turn the text of a Claude parse response into the structured result
+
+    Args:
+        response_text (str): Text content of the Messages response
+        tomorrow (str): Default due date (YYYY-MM-DD) for to-dos without one
+
+    Returns:
+        dict: {
+            'success': bool,
+            'data': dict containing parsed data (contact, summary, preferences, todos)
+            'error': str (if success is False)
+        }
+    """
+    # Claude might wrap the JSON in a markdown code block; take what is inside
+    json_text = CODE_FENCE_RE.match(response_text).group(1)
+
+    # Parse JSON
+    try:
+        parsed_data = orjson.loads(json_text)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON from Claude response: {e}")
+        logger.error(f"Response text: {response_text}")
+        return {
+            'success': False,
+            'error': f'Failed to parse JSON response: {str(e)}'
+        }
+
+    # Validate and structure the data; to-dos need a task name, and a missing
+    # due date defaults to tomorrow
+    structured_data = {
+        'contact': parsed_data.get('contact', {}),
+        'deal': parsed_data.get('deal', {}),
+        'summary': parsed_data.get('summary', []),
+        'preferences': validate_preference_values(parsed_data.get('preferences', {})),
+        'todos': [
+            {
+                'task_name': todo['task_name'],
+                'due_date': todo.get('due_date') or tomorrow,
+                'next_step': todo.get('next_step', '')
+            }
+            for todo in parsed_data.get('todos', [])
+            if todo.get('task_name')
+        ]
+    }
+
+    logger.info("Successfully parsed meeting notes")
+    logger.info(f"Extracted: {len(structured_data['summary'])} summary points, "
+               f"{len(structured_data['todos'])} todos")
+
+    return {
+        'success': True,
+        'data': structured_data
+    }
+
+
+def _send_parse_request(payload, headers, on_contact=None):
+    """
+    Send a parse request to the Messages API and collect the response text
+
+    Args:
+        payload (dict): Messages API parameters from _build_parse_params()
+        headers (dict): Request headers from _anthropic_headers()
+        on_contact (callable): Optional; streams the response and calls this
+            with the contact dict as soon as it is complete
+
+    Returns:
+        dict: {
+            'success': bool,
+            'text': str (response text),
+            'stop_reason': str (why Claude stopped, e.g. 'end_turn' or 'max_tokens'),
+            'error': str (if success is False)
+        }
+    """
+    if on_contact is not None:
+        payload = dict(payload, stream=True)
+
+    response = _session.post(
+        ANTHROPIC_API_URL,
+        data=orjson.dumps(payload),
+        headers=headers,
+        stream=on_contact is not None,
+        timeout=ANTHROPIC_TIMEOUT
+    )
+
+    if response.status_code != 200:
+        error_msg = f"Anthropic API error: {response.status_code} - {response.text}"
+        logger.error(error_msg)
+        return {
+            'success': False,
+            'error': error_msg
+        }
+
+    if on_contact is not None:
+        # Streamed: the contact callback fires mid-response, the rest of the
+        # text is parsed exactly like a buffered response
+        with response:
+            response_text, stop_reason = _read_streamed_text(response, on_contact)
+    else:
+        response_data = orjson.loads(response.content)
+        stop_reason = response_data.get('stop_reason')
+
+        # Extract the text content from Claude's response
+        content_blocks = response_data.get('content', [])
+        response_text = content_blocks[0].get('text', '') if content_blocks else ''
+
+    if not response_text:
+        return {
+            'success': False,
+            'error': 'No content in Claude response'
+        }
+
+    return {
+        'success': True,
+        'text': response_text,
+        'stop_reason': stop_reason
+    }
+
+
+def parse_meeting_notes(notes_text, api_key, parse_preferences=True, parse_todos=True, on_contact=None):
     """
     Parse meeting notes using Claude API to extract structured data
 
@@ -100,6 +540,9 @@ def parse_meeting_notes(notes_text, api_key, parse_preferences=True, parse_todos
         api_key (str): Anthropic API key
         parse_preferences (bool): Whether to parse investor preferences (default: True)
         parse_todos (bool): Whether to parse to-do items (default: True)
+        on_contact (callable): Optional callback; when given, the response is
+            streamed and the callback receives the parsed contact dict as soon as
+            Claude has emitted it, before the rest of the response arrives
 
     Returns:
         dict: {
@@ -112,199 +555,190 @@ def parse_meeting_notes(notes_text, api_key, parse_preferences=True, parse_todos
         # Calculate tomorrow's date for default due dates
         tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
 
-        # Construct the prompt dynamically based on what needs to be parsed
-        prompt_sections = []
+        # Call Anthropic API
+        headers = _anthropic_headers(api_key)
+        payload = _build_parse_params(notes_text, parse_preferences, parse_todos, tomorrow)
 
-        prompt_sections.append("""You are a structured CRM assistant. Parse these investor call notes and extract:
+        logger.info("Sending notes to Claude API for parsing")
+        result = _send_parse_request(payload, headers, on_contact)
+
+        if result['success'] and result['stop_reason'] == 'max_tokens':
+            # Cut off by the section-sized cap: the JSON is incomplete, so ask
+            # again with the full budget (without streaming; the contact callback
+            # is not repeated)
+            logger.warning(f"Claude response hit max_tokens={payload['max_tokens']}, "
+                           f"retrying with {MAX_PARSE_TOKENS}")
+            payload['max_tokens'] = MAX_PARSE_TOKENS
+            result = _send_parse_request(payload, headers)
+
+        if not result['success']:
+            return {
+                'success': False,
+                'error': result['error']
+            }
 
-1. CONTACT INFORMATION:
-   - Investor/Company name (use the FULL company name as mentioned - e.g., "Waypoint Capital Partners" not just "Waypoint", "Sequoia Capital" not just "Sequoia")
-   - Contact person name
-   - Email (if mentioned)
+        return _structure_response_text(result['text'], tomorrow)
 
-2. DEAL INFORMATION (if mentioned):
-   - Deal name or company name (e.g., "Acme Corp Acquisition", "TechCo Series A")
-   - Any keywords that would help identify the deal in a search
-   - Intelligently suggest a next step based on the call notes context (e.g., "Send pitch deck", "Schedule follow-up call", "Send financial projections")
-   - Suggest an appropriate deal stage based on the conversation (use one of: appointmentscheduled, qualifiedtobuy, presentationscheduled, decisionmakerboughtin, contractsent, 1110891580, closedwon, closedlost, 1173780286)
+    except Exception as e:
+        error_msg = f"Error parsing meeting notes: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            'success': False,
+            'error': error_msg
+        }
 
-3. CALL SUMMARY:
-   - Create bullet points (3-7 bullets) summarizing key discussion points
-   - Mark any action items inline with [TO-DO] prefix""")
 
-        # Only add investor preferences section if requested
-        if parse_preferences:
-            prompt_sections.append("""
+def parse_meeting_notes_many(notes_list, api_key, parse_preferences=True, parse_todos=True):
+    """
+    Parse several meeting notes concurrently
 
-4. INVESTOR PREFERENCES (only extract if explicitly mentioned):
-   Extract ONLY from these allowed values:
-   - Check Size: $50M+, $25M - $50M, $10M - $25M, $5M - $10M, $2M - $5M, $1M - $2M, $500 - $1M, <$500k
-   - Deal Structure: Flexible, Structured Equity, Debt, Non-Control Equity, Control Equity
-   - Style: Board Seat, Passive, Active, Anchor / Lead
-   - Industry: Software, Healthcare, Industrials, Business Services, Energy, Real Estate
-   - Company Stage: Special Situations, Buyout / Mature, Growth, Venture / Startup
-   - Key Investment Criteria: Low Leverage, Cash Burn OK, High Growth, Low EBITDA Multiple, Cash Flow Positive
-   - Capital Type: GP Sponsor, LP Sponsor, Fund of Funds, HNW Individual, Family Office
-   - When to Call: Post-LOI Signed, Pre-LOI OK, Pre-IOI / Early, Any time
+    Each parse is a separate Claude call, so the requests are overlapped on a
+    small thread pool instead of waiting on each one in turn.
 
-   Also extract free-form preference notes for any preferences that don't fit the dropdowns.""")
+    Args:
+        notes_list (list): Raw meeting notes texts
+        api_key (str): Anthropic API key
+        parse_preferences (bool): Whether to parse investor preferences (default: True)
+        parse_todos (bool): Whether to parse to-do items (default: True)
 
-        # Only add to-do items section if requested
-        if parse_todos:
-            prompt_sections.append(f"""
+    Returns:
+        list: One parse_meeting_notes() result per notes text, in input order
+    """
+    if len(notes_list) <= 1:
+        return [parse_meeting_notes(notes_text, api_key, parse_preferences, parse_todos)
+                for notes_text in notes_list]
 
-5. TO-DO ITEMS:
-   For each action item, create:
-   - Task Name: ≤25 words, clear and specific
-   - Due Date: {tomorrow} (YYYY-MM-DD format)
-   - Next Step: detailed description of what needs to be done""")
-
-        # Build JSON structure based on what's being parsed
-        json_structure = {
-            "contact": {"company_name": "", "person_name": "", "email": ""},
-            "deal": {
-                "deal_name": "",
-                "search_keywords": "",
-                "suggested_next_step": "",
-                "suggested_stage": ""
-            },
-            "summary": ["bullet 1", "bullet 2"]
-        }
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(notes_list))) as executor:
+        return list(executor.map(
+            lambda notes_text: parse_meeting_notes(notes_text, api_key, parse_preferences, parse_todos),
+            notes_list
+        ))
 
-        if parse_preferences:
-            json_structure["preferences"] = {
-                "Check Size": [],
-                "Deal Structure": [],
-                "Industry": [],
-                "Preference Notes": ""
-            }
 
-        if parse_todos:
-            json_structure["todos"] = [
-                {"task_name": "", "due_date": "YYYY-MM-DD", "next_step": ""}
-            ]
+def _batch_results_by_id(results_response):
+    """
+    Read a Message Batches results file (JSONL) into a dict keyed by custom_id
 
-        # Build the complete prompt
-        prompt_sections.append(f"""
+    Args:
+        results_response (requests.Response): Streaming response for results_url
 
-Return ONLY valid JSON with this structure:
-{json.dumps(json_structure, indent=2)}
+    Returns:
+        dict: custom_id -> batch result entry
+    """
+    results = {}
+    results_response.encoding = 'utf-8'
 
-MEETING NOTES:
-{notes_text}""")
+    for line in results_response.iter_lines(decode_unicode=True):
+        if not line:
+            continue
+        entry = orjson.loads(line)
+        results[entry.get('custom_id')] = entry.get('result', {})
 
-        prompt = ''.join(prompt_sections)
+    return results
 
-        # Call Anthropic API
-        url = "https://api.anthropic.com/v1/messages"
-        headers = {
-            "x-api-key": api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json"
-        }
 
-        payload = {
-            "model": "claude-sonnet-4-5-20250929",
-            "max_tokens": 4096,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        }
+def parse_meeting_notes_batch(notes_list, api_key, parse_preferences=True, parse_todos=True,
+                              poll_interval=BATCH_POLL_INTERVAL_SECONDS,
+                              max_wait=BATCH_MAX_WAIT_SECONDS):
+    """
+    Parse several meeting notes through the Anthropic Message Batches API
 
-        logger.info("Sending notes to Claude API for parsing")
-        response = requests.post(url, json=payload, headers=headers)
+    Batches cost half as much as individual calls but can take minutes to
+    complete, so this is meant for non-interactive ingestion (backfills,
+    nightly imports). A single note is parsed with a normal call.
+
+    Args:
+        notes_list (list): Raw meeting notes texts
+        api_key (str): Anthropic API key
+        parse_preferences (bool): Whether to parse investor preferences (default: True)
+        parse_todos (bool): Whether to parse to-do items (default: True)
+        poll_interval (float): Seconds between batch status checks
+        max_wait (float): Seconds to wait for the batch before giving up
+
+    Returns:
+        list: One result dict per notes text, in input order, each shaped like
+            parse_meeting_notes() output
+    """
+    if len(notes_list) <= 1:
+        return [parse_meeting_notes(notes_text, api_key, parse_preferences, parse_todos)
+                for notes_text in notes_list]
+
+    try:
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        headers = _anthropic_headers(api_key)
+
+        batch_requests = [
+            {
+                "custom_id": f"notes-{index}",
+                "params": _build_parse_params(notes_text, parse_preferences, parse_todos, tomorrow,
+                                              max_tokens=MAX_PARSE_TOKENS)
+            }
+            for index, notes_text in enumerate(notes_list)
+        ]
+
+        logger.info(f"Submitting {len(batch_requests)} notes to the Claude Message Batches API")
+        response = _session.post(
+            ANTHROPIC_BATCHES_URL,
+            data=orjson.dumps({"requests": batch_requests}),
+            headers=headers,
+            timeout=ANTHROPIC_TIMEOUT
+        )
 
         if response.status_code != 200:
             error_msg = f"Anthropic API error: {response.status_code} - {response.text}"
             logger.error(error_msg)
-            return {
-                'success': False,
-                'error': error_msg
-            }
+            return [{'success': False, 'error': error_msg} for _ in notes_list]
 
-        # Parse response
-        response_data = response.json()
+        batch = orjson.loads(response.content)
+        batch_url = f"{ANTHROPIC_BATCHES_URL}/{batch['id']}"
+        deadline = time.monotonic() + max_wait
 
-        # Extract the text content from Claude's response
-        content_blocks = response_data.get('content', [])
-        if not content_blocks:
-            return {
-                'success': False,
-                'error': 'No content in Claude response'
-            }
+        # Poll until Anthropic has finished every request in the batch
+        while batch.get('processing_status') != 'ended':
+            if time.monotonic() >= deadline:
+                error_msg = f"Claude batch {batch['id']} did not finish within {max_wait} seconds"
+                logger.error(error_msg)
+                return [{'success': False, 'error': error_msg} for _ in notes_list]
 
-        response_text = content_blocks[0].get('text', '')
+            time.sleep(poll_interval)
+            response = _session.get(batch_url, headers=headers, timeout=ANTHROPIC_TIMEOUT)
 
-        # Try to extract JSON from the response
-        # Claude might return JSON with or without markdown code blocks
-        json_text = response_text.strip()
+            if response.status_code != 200:
+                error_msg = f"Anthropic API error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return [{'success': False, 'error': error_msg} for _ in notes_list]
 
-        # Remove markdown code blocks if present
-        if json_text.startswith('```json'):
-            json_text = json_text[7:]
-        elif json_text.startswith('```'):
-            json_text = json_text[3:]
+            batch = orjson.loads(response.content)
 
-        if json_text.endswith('```'):
-            json_text = json_text[:-3]
+        with _session.get(batch['results_url'], headers=headers, stream=True,
+                          timeout=ANTHROPIC_TIMEOUT) as results_response:
+            if results_response.status_code != 200:
+                error_msg = f"Anthropic API error: {results_response.status_code} - {results_response.text}"
+                logger.error(error_msg)
+                return [{'success': False, 'error': error_msg} for _ in notes_list]
 
-        json_text = json_text.strip()
+            results = _batch_results_by_id(results_response)
 
-        # Parse JSON
-        try:
-            parsed_data = json.loads(json_text)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from Claude response: {e}")
-            logger.error(f"Response text: {response_text}")
-            return {
-                'success': False,
-                'error': f'Failed to parse JSON response: {str(e)}'
-            }
+        parsed = []
+        for request in batch_requests:
+            result = results.get(request['custom_id'], {})
+            result_type = result.get('type', 'missing')
 
-        # Validate and structure the data
-        structured_data = {
-            'contact': parsed_data.get('contact', {}),
-            'deal': parsed_data.get('deal', {}),
-            'summary': parsed_data.get('summary', []),
-            'preferences': {},
-            'todos': []
-        }
+            if result_type != 'succeeded':
+                error = result.get('error', {}).get('error', {}).get('message', result_type)
+                parsed.append({'success': False, 'error': f"Claude batch request failed: {error}"})
+                continue
 
-        # Validate preferences
-        raw_preferences = parsed_data.get('preferences', {})
-        structured_data['preferences'] = validate_preference_values(raw_preferences)
-
-        # Process todos
-        raw_todos = parsed_data.get('todos', [])
-        for todo in raw_todos:
-            # Ensure due_date is set (default to tomorrow if not provided)
-            if not todo.get('due_date'):
-                todo['due_date'] = tomorrow
-
-            # Validate todo has required fields
-            if todo.get('task_name'):
-                structured_data['todos'].append({
-                    'task_name': todo.get('task_name', ''),
-                    'due_date': todo.get('due_date', tomorrow),
-                    'next_step': todo.get('next_step', '')
-                })
-
-        logger.info("Successfully parsed meeting notes")
-        logger.info(f"Extracted: {len(structured_data['summary'])} summary points, "
-                   f"{len(structured_data['todos'])} todos")
+            content_blocks = result.get('message', {}).get('content', [])
+            if not content_blocks:
+                parsed.append({'success': False, 'error': 'No content in Claude response'})
+                continue
 
-        return {
-            'success': True,
-            'data': structured_data
-        }
+            parsed.append(_structure_response_text(content_blocks[0].get('text', ''), tomorrow))
+
+        return parsed
 
     except Exception as e:
-        error_msg = f"Error parsing meeting notes: {str(e)}"
+        error_msg = f"Error batch parsing meeting notes: {str(e)}"
         logger.error(error_msg, exc_info=True)
-        return {
-            'success': False,
-            'error': error_msg
-        }
+        return [{'success': False, 'error': error_msg} for _ in notes_list]
@@ -8,18 +8,22 @@ Sends daily email reminders for:
 
 import os
 import logging
-import requests
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone
 from typing import List, Dict
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
 HUBSPOT_API_BASE = "https://api.hubapi.com"
 NOTION_API_BASE = "https://api.notion.com/v1"
 
+# Shared pooled session so the reminder job's many HubSpot/Notion/Resend calls
+# reuse TCP+TLS connections
+_session = create_session()
+
 
 def get_all_deals_with_next_steps(api_key: str) -> List[Dict]:
     """
@@ -58,7 +62,7 @@ def get_all_deals_with_next_steps(api_key: str) -> List[Dict]:
         }
 
         logger.info("Fetching all deals with next steps from HubSpot")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -231,7 +235,7 @@ def get_deal_contacts(deal_id: str, api_key: str) -> List[Dict]:
         }
 
         logger.info(f"Fetching contact associations for deal ID: {deal_id}")
-        associations_response = requests.get(associations_url, headers=headers)
+        associations_response = _session.get(associations_url, headers=headers)
 
         if associations_response.status_code != 200:
             logger.warning(f"Failed to fetch associations: {associations_response.status_code}")
@@ -256,7 +260,7 @@ def get_deal_contacts(deal_id: str, api_key: str) -> List[Dict]:
                 'properties': 'firstname,lastname,email,company,jobtitle'
             }
 
-            contact_response = requests.get(contact_url, headers=headers, params=params)
+            contact_response = _session.get(contact_url, headers=headers, params=params)
 
             if contact_response.status_code == 200:
                 contact_data = contact_response.json()
@@ -298,7 +302,7 @@ def get_deal_stage_label(stage_id: str, pipeline: str, api_key: str) -> str:
         }
 
         pipeline_url = f"{HUBSPOT_API_BASE}/crm/v3/pipelines/deals/{pipeline}"
-        pipeline_response = requests.get(pipeline_url, headers=headers)
+        pipeline_response = _session.get(pipeline_url, headers=headers)
 
         if pipeline_response.status_code == 200:
             pipeline_data = pipeline_response.json()
@@ -408,7 +412,7 @@ def fetch_hubspot_object_names(api_key: str, object_type: str, object_ids: List[
             'inputs': [{'id': obj_id} for obj_id in object_ids]
         }
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -514,7 +518,7 @@ def get_hubspot_tasks_due_on_date(api_key: str, target_date: datetime, portal_id
         }
 
         logger.info(f"Fetching HubSpot tasks due on {target_date.strftime('%Y-%m-%d')}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -667,7 +671,7 @@ def get_overdue_hubspot_tasks(api_key: str, portal_id: str = None) -> List[Dict]
         }
 
         logger.info("Fetching overdue HubSpot tasks")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -820,7 +824,7 @@ def get_notion_todos_due_on_date(notion_api_key: str, notion_db_id: str, target_
         }
 
         logger.info(f"Fetching Notion to-dos due on {target_date_str}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -930,7 +934,7 @@ def get_overdue_notion_todos(notion_api_key: str, notion_db_id: str) -> List[Dic
         }
 
         logger.info(f"Fetching overdue Notion to-dos from database: {notion_db_id_formatted}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -1642,7 +1646,7 @@ def send_email_resend(
             "html": html_body
         }
 
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = _session.post(url, headers=headers, json=payload, timeout=30)
 
         if response.status_code == 200:
             logger.info(f"Email sent successfully via Resend to {to_email}")
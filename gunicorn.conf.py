@@ -0,0 +1,43 @@
+"""
+Gunicorn configuration for production
+
+Run with: gunicorn app:app  (this file is picked up automatically)
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Every endpoint spends nearly all its time waiting on HubSpot, Notion and
+# Claude, so threaded workers keep many requests in flight while the requests
+# sessions stay plain blocking code (no monkey-patching).
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '16'))
+
+# One worker by default: background jobs, idempotency keys and search caches
+# live in process memory, so a job must be polled from the worker that started
+# it. Raise via WEB_CONCURRENCY only behind sticky routing.
+workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+
+# Import the app once in the master so workers fork-share the loaded modules
+preload_app = True
+
+# Claude parsing and brief synthesis can take tens of seconds
+timeout = 60
+
+# Worker recycling is off by default: a recycled worker takes its in-memory
+# jobs and idempotency keys with it, so clients polling a running confirm job
+# (one request per second) would get "Unknown or expired job" and a retried
+# confirm would repeat its writes. Set GUNICORN_MAX_REQUESTS to bound memory
+# growth only once that state lives in shared storage; jitter keeps multiple
+# workers from restarting at the same moment.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '50'))
+
+
+def post_worker_init(worker):
+    """Restart the log listener after fork, then start the daily reminder scheduler
+    (only one worker per host acquires it)"""
+    from app import ensure_log_listener, start_reminder_scheduler
+    ensure_log_listener()
+    start_reminder_scheduler()
@@ -0,0 +1,115 @@
+"""
+HTTP Session Helper
+Builds pooled requests sessions shared by the API client modules
+"""
+
+import time
+import atexit
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient upstream failures worth retrying with backoff
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to an API's rate limit
+
+    Allows bursts of up to `capacity` calls, refilled at `rate` calls per
+    second; acquire() sleeps until a token is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class _RateLimitRetry(Retry):
+    """Retry policy that also retries 429s for POST/PATCH
+
+    A rate-limited request was rejected before it ran, so resending it can't
+    duplicate a write.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from a shared bucket before each send"""
+
+    def __init__(self, bucket, **kwargs):
+        self._bucket = bucket
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self._bucket.acquire()
+        return super().send(request, **kwargs)
+
+
+def create_session(pool_connections=20, pool_maxsize=50, total_retries=3, backoff_factor=0.3,
+                   requests_per_second=None):
+    """
+    Create a requests session that keeps TCP+TLS connections alive across calls
+
+    Retries use urllib3's default method list, so idempotent requests (GET,
+    PUT, DELETE, ...) are retried on transient status codes while POST/PATCH
+    are only retried on 429 or when the connection could not be established.
+    A Retry-After header on 429/503 responses is honoured.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache
+        pool_maxsize (int): Maximum connections kept per host
+        total_retries (int): Maximum retries per request
+        backoff_factor (float): Exponential backoff factor between retries
+        requests_per_second (float): Optional rate limit shared by every thread
+            using the session (retries are not counted against it)
+
+    Returns:
+        requests.Session: Session with a pooled HTTPS adapter mounted
+    """
+    retry = _RateLimitRetry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False  # Hand the final response back so callers can report it
+    )
+    adapter_kwargs = {
+        'pool_connections': pool_connections,
+        'pool_maxsize': pool_maxsize,
+        'max_retries': retry
+    }
+
+    if requests_per_second:
+        adapter = _RateLimitedAdapter(TokenBucket(requests_per_second), **adapter_kwargs)
+    else:
+        adapter = HTTPAdapter(**adapter_kwargs)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    atexit.register(session.close)
+    return session
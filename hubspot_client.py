@@ -3,30 +3,356 @@ HubSpot API Client
 Provides functions for interacting with HubSpot CRM API
 """
 
-import requests
+import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from cachetools import TTLCache
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
 HUBSPOT_API_BASE = "https://api.hubapi.com"
 
+# HubSpot private apps allow 100 requests per 10 seconds
+HUBSPOT_REQUESTS_PER_SECOND = 10
 
-def search_hubspot_contact(query, api_key):
+# Shared pooled session so repeated calls reuse TCP+TLS connections and are
+# paced to the API's rate limit
+_session = create_session(requests_per_second=HUBSPOT_REQUESTS_PER_SECOND)
+
+CONTACT_PROPERTIES = ["email", "firstname", "lastname", "company", "jobtitle"]
+
+# HubSpot's CRM search API accepts at most 5 filter groups per request
+MAX_FILTER_GROUPS = 5
+
+# Contacts returned per search query (combined searches cap each query's share)
+CONTACT_SEARCH_LIMIT = 10
+
+# Short-lived caches of contact and deal searches: the preview, the manual
+# search endpoints and the confirm flow tend to repeat the same lookups within
+# seconds. Cleared whenever a contact or deal is created or updated.
+SEARCH_CACHE_TTL_SECONDS = 60
+_contact_search_cache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL_SECONDS)
+_deal_search_cache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL_SECONDS)
+
+# The recent-contacts list is polled by the dashboard and changes on the order
+# of minutes, so it is served from memory for a short window
+RECENT_CONTACTS_CACHE_TTL_SECONDS = 30
+_recent_contacts_cache = TTLCache(maxsize=32, ttl=RECENT_CONTACTS_CACHE_TTL_SECONDS)
+
+# Fields get_recent_contacts() can return, mapped to the HubSpot properties
+# each one needs, and HubSpot's page size cap for the list endpoint
+RECENT_CONTACT_FIELDS = {
+    'name': ('firstname', 'lastname'),
+    'company': ('company',),
+    'email': ('email',)
+}
+MAX_RECENT_CONTACTS = 100
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_key(kind, query):
+    """Normalize a search term into a cache key"""
+    return (kind, query.strip().lower())
+
+
+def hubspot_request(method, path, **kwargs):
     """
-    Search for contacts in HubSpot by email or name
+    Send a request to the HubSpot API through the shared, rate-limited session
+
+    Lets other modules call HubSpot endpoints this client doesn't wrap while
+    still drawing from the same rate limiter and connection pool.
+
+    Args:
+        method (str): HTTP method, e.g. 'GET' or 'POST'
+        path (str): API path starting with '/', e.g. '/crm/v3/objects/notes/search'
+        **kwargs: Passed through to requests (headers, json, params, timeout, ...)
+
+    Returns:
+        requests.Response: The HubSpot response
+    """
+    return _session.request(method, f"{HUBSPOT_API_BASE}{path}", **kwargs)
+
+
+def format_contact_name(firstname, lastname, default="Unknown"):
+    """
+    Join a contact's first and last name for display
+
+    HubSpot returns null for unset properties, so either part may be None.
+
+    Args:
+        firstname (str): First name, possibly empty or None
+        lastname (str): Last name, possibly empty or None
+        default (str): Returned when both parts are empty
+
+    Returns:
+        str: Display name
+    """
+    if firstname and lastname:
+        return f"{firstname} {lastname}"
+    return firstname or lastname or default
+
+
+def clear_contact_search_cache():
+    """Drop all cached contact lookups (a new contact can match any search and tops the recent list)"""
+    with _search_cache_lock:
+        _contact_search_cache.clear()
+        _recent_contacts_cache.clear()
+
+
+def clear_deal_search_cache():
+    """Drop all cached deal searches (a deal write can change any of them)"""
+    with _search_cache_lock:
+        _deal_search_cache.clear()
+
+
+def _contact_filter_groups(query):
+    """
+    Build the search filter groups used to find a contact by email or name
 
     Args:
         query (str): Email address or name to search for
+
+    Returns:
+        list: HubSpot filterGroups (OR'ed together by the search API)
+    """
+    # Determine if query is email or name
+    is_email = '@' in query
+
+    if is_email:
+        # Search by email (exact match)
+        return [{
+            "filters": [{
+                "propertyName": "email",
+                "operator": "EQ",
+                "value": query
+            }]
+        }]
+
+    # Search by name - handle both full names and single names
+    query_parts = query.strip().split()
+
+    if len(query_parts) >= 2:
+        # Full name search: "Michael Kornman" -> firstname="Michael", lastname="Kornman"
+        firstname_part = query_parts[0]
+        lastname_part = ' '.join(query_parts[1:])
+
+        return [
+            # Strategy 1: Exact match - firstname="Michael" AND lastname="Kornman"
+            {
+                "filters": [
+                    {
+                        "propertyName": "firstname",
+                        "operator": "EQ",
+                        "value": firstname_part
+                    },
+                    {
+                        "propertyName": "lastname",
+                        "operator": "EQ",
+                        "value": lastname_part
+                    }
+                ]
+            },
+            # Strategy 2: Contains token - firstname contains "Michael" AND lastname contains "Kornman"
+            {
+                "filters": [
+                    {
+                        "propertyName": "firstname",
+                        "operator": "CONTAINS_TOKEN",
+                        "value": firstname_part
+                    },
+                    {
+                        "propertyName": "lastname",
+                        "operator": "CONTAINS_TOKEN",
+                        "value": lastname_part
+                    }
+                ]
+            },
+            # Strategy 3: Full name in firstname field
+            {
+                "filters": [{
+                    "propertyName": "firstname",
+                    "operator": "CONTAINS_TOKEN",
+                    "value": query
+                }]
+            },
+            # Strategy 4: Full name in lastname field
+            {
+                "filters": [{
+                    "propertyName": "lastname",
+                    "operator": "CONTAINS_TOKEN",
+                    "value": query
+                }]
+            },
+            # Strategy 5: Company name match
+            {
+                "filters": [{
+                    "propertyName": "company",
+                    "operator": "CONTAINS_TOKEN",
+                    "value": query
+                }]
+            }
+        ]
+
+    # Single name search: search both firstname and lastname
+    return [
+        {
+            "filters": [{
+                "propertyName": "firstname",
+                "operator": "CONTAINS_TOKEN",
+                "value": query
+            }]
+        },
+        {
+            "filters": [{
+                "propertyName": "lastname",
+                "operator": "CONTAINS_TOKEN",
+                "value": query
+            }]
+        }
+    ]
+
+
+def _format_contact(contact):
+    """Flatten a HubSpot contact object into the dict shape used by the app"""
+    props = contact.get('properties', {})
+    return {
+        'id': contact.get('id'),
+        'email': props.get('email', ''),
+        'firstname': props.get('firstname', ''),
+        'lastname': props.get('lastname', ''),
+        'company': props.get('company', ''),
+        'jobtitle': props.get('jobtitle', '')
+    }
+
+
+def _tokens(text):
+    return re.findall(r'\w+', (text or '').lower())
+
+
+def _filter_group_matches(props, filter_group):
+    """
+    Evaluate a search filter group against a contact's properties locally.
+
+    Mirrors HubSpot's semantics closely enough to tell which query of a
+    combined search produced a given hit: EQ is a case-insensitive equality
+    and CONTAINS_TOKEN requires every token of the value to be present.
+    """
+    for search_filter in filter_group['filters']:
+        actual = props.get(search_filter['propertyName']) or ''
+        expected = search_filter['value']
+
+        if search_filter['operator'] == 'EQ':
+            if actual.strip().lower() != expected.strip().lower():
+                return False
+        elif search_filter['operator'] == 'CONTAINS_TOKEN':
+            actual_tokens = set(_tokens(actual))
+            if not all(token in actual_tokens for token in _tokens(expected)):
+                return False
+        else:
+            return False
+
+    return True
+
+
+def _is_exact_query(groups):
+    """True if every filter of a query is an EQ match (e.g. an email lookup)"""
+    return all(
+        search_filter['operator'] == 'EQ'
+        for group in groups
+        for search_filter in group['filters']
+    )
+
+
+def _attribute_batch_results(batch, results):
+    """
+    Split the hits of one combined contact search between its queries
+
+    A batch holding a single query gets every hit. Otherwise each hit goes to
+    the queries whose filter groups it satisfies locally; hits no query
+    claims (e.g. tokens HubSpot splits differently than we do) go to the
+    token-matched queries that claimed nothing, so a real match is never
+    dropped. Exact (EQ-only) queries such as emails are checked precisely and
+    never receive those leftovers. Each query keeps at most
+    CONTACT_SEARCH_LIMIT contacts.
+
+    Args:
+        batch (dict): Query -> filter groups sent in the request
+        results (list): Raw HubSpot contact objects returned for the batch
+
+    Returns:
+        dict: Query -> list of formatted contacts
+    """
+    if len(batch) == 1:
+        contacts_dict = {}
+        for contact in results:
+            if contact.get('id') not in contacts_dict:
+                contacts_dict[contact.get('id')] = _format_contact(contact)
+        return {query: list(contacts_dict.values())[:CONTACT_SEARCH_LIMIT] for query in batch}
+
+    matches = {query: {} for query in batch}
+    unclaimed = {}
+    for contact in results:
+        contact_id = contact.get('id')
+        props = contact.get('properties', {})
+        claimed = False
+        for query, groups in batch.items():
+            if any(_filter_group_matches(props, group) for group in groups):
+                matches[query].setdefault(contact_id, _format_contact(contact))
+                claimed = True
+        if not claimed:
+            unclaimed.setdefault(contact_id, _format_contact(contact))
+
+    if unclaimed:
+        for query, contacts_dict in matches.items():
+            if not contacts_dict and not _is_exact_query(batch[query]):
+                contacts_dict.update(unclaimed)
+
+    return {query: list(contacts.values())[:CONTACT_SEARCH_LIMIT] for query, contacts in matches.items()}
+
+
+def search_hubspot_contacts_multi(queries, api_key):
+    """
+    Search for contacts matching several queries in as few HubSpot calls as possible
+
+    The filter groups of all queries are packed into combined search requests
+    (respecting HubSpot's per-request filter group limit) and each hit is then
+    attributed back to the queries whose filters it satisfies. A failed
+    request only fails the queries it carried.
+
+    Args:
+        queries (list): Email addresses and/or names to search for
         api_key (str): HubSpot API key
 
     Returns:
         dict: {
             'success': bool,
-            'data': list of contacts with id, email, firstname, lastname, company
-            'error': str (if success is False)
+            'data': dict mapping each query to its list of contacts
+                    (same shape as search_hubspot_contact results); queries
+                    whose request failed are left out
+            'errors': dict mapping each failed query to its error (only if some failed)
+            'error': str (if success is False, i.e. every query failed)
         }
     """
+    # Serve queries searched recently from the cache; only the rest hit HubSpot
+    unique_queries = list(dict.fromkeys(q for q in queries if q))
+    data = {}
+    with _search_cache_lock:
+        for query in unique_queries:
+            cached = _contact_search_cache.get(_search_cache_key('multi', query))
+            if cached is not None:
+                data[query] = cached
+    pending_queries = [q for q in unique_queries if q not in data]
+
+    if not pending_queries:
+        logger.info(f"Using cached HubSpot contact search for: {list(data)}")
+        return {
+            'success': True,
+            'data': data
+        }
+
     try:
         url = f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/search"
         headers = {
@@ -34,116 +360,124 @@ def search_hubspot_contact(query, api_key):
             'Content-Type': 'application/json'
         }
 
-        # Determine if query is email or name
-        is_email = '@' in query
-
-        if is_email:
-            # Search by email (exact match)
+        # Pack queries into batches without splitting a query's filter groups
+        batches = []
+        batch_groups = 0
+        for query in pending_queries:
+            groups = _contact_filter_groups(query)
+            if not batches or batch_groups + len(groups) > MAX_FILTER_GROUPS:
+                batches.append({})
+                batch_groups = 0
+            batches[-1][query] = groups
+            batch_groups += len(groups)
+
+        def run_batch(batch):
+            """Run one combined search; returns (results, error)"""
             payload = {
-                "filterGroups": [{
-                    "filters": [{
-                        "propertyName": "email",
-                        "operator": "EQ",
-                        "value": query
-                    }]
-                }],
-                "properties": ["email", "firstname", "lastname", "company", "jobtitle"],
-                "limit": 10
+                "filterGroups": [group for groups in batch.values() for group in groups],
+                "properties": CONTACT_PROPERTIES,
+                "limit": 100
             }
+            try:
+                response = _session.post(url, json=payload, headers=headers)
+            except Exception as e:
+                return None, f"Error searching HubSpot contacts: {str(e)}"
+
+            if response.status_code != 200:
+                return None, f"HubSpot API error: {response.status_code} - {response.text}"
+
+            return response.json().get('results', []), None
+
+        logger.info(f"Searching HubSpot for contacts: {list(q for batch in batches for q in batch)} "
+                    f"in {len(batches)} request(s)")
+
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                outcomes = list(executor.map(run_batch, batches))
         else:
-            # Search by name - handle both full names and single names
-            query_parts = query.strip().split()
+            outcomes = [run_batch(batch) for batch in batches]
+
+        found = {}
+        errors = {}
+        for batch, (results, error) in zip(batches, outcomes):
+            if error is not None:
+                # A failed batch only fails its own queries
+                logger.error(error)
+                for query in batch:
+                    errors[query] = error
+                continue
 
-            if len(query_parts) >= 2:
-                # Full name search: "Michael Kornman" -> firstname="Michael", lastname="Kornman"
-                firstname_part = query_parts[0]
-                lastname_part = ' '.join(query_parts[1:])
+            found.update(_attribute_batch_results(batch, results))
 
-                payload = {
-                    "filterGroups": [
-                        # Strategy 1: Exact match - firstname="Michael" AND lastname="Kornman"
-                        {
-                            "filters": [
-                                {
-                                    "propertyName": "firstname",
-                                    "operator": "EQ",
-                                    "value": firstname_part
-                                },
-                                {
-                                    "propertyName": "lastname",
-                                    "operator": "EQ",
-                                    "value": lastname_part
-                                }
-                            ]
-                        },
-                        # Strategy 2: Contains token - firstname contains "Michael" AND lastname contains "Kornman"
-                        {
-                            "filters": [
-                                {
-                                    "propertyName": "firstname",
-                                    "operator": "CONTAINS_TOKEN",
-                                    "value": firstname_part
-                                },
-                                {
-                                    "propertyName": "lastname",
-                                    "operator": "CONTAINS_TOKEN",
-                                    "value": lastname_part
-                                }
-                            ]
-                        },
-                        # Strategy 3: Full name in firstname field
-                        {
-                            "filters": [{
-                                "propertyName": "firstname",
-                                "operator": "CONTAINS_TOKEN",
-                                "value": query
-                            }]
-                        },
-                        # Strategy 4: Full name in lastname field
-                        {
-                            "filters": [{
-                                "propertyName": "lastname",
-                                "operator": "CONTAINS_TOKEN",
-                                "value": query
-                            }]
-                        },
-                        # Strategy 5: Company name match
-                        {
-                            "filters": [{
-                                "propertyName": "company",
-                                "operator": "CONTAINS_TOKEN",
-                                "value": query
-                            }]
-                        }
-                    ],
-                    "properties": ["email", "firstname", "lastname", "company", "jobtitle"],
-                    "limit": 10
-                }
-            else:
-                # Single name search: search both firstname and lastname
-                payload = {
-                    "filterGroups": [
-                        {
-                            "filters": [{
-                                "propertyName": "firstname",
-                                "operator": "CONTAINS_TOKEN",
-                                "value": query
-                            }]
-                        },
-                        {
-                            "filters": [{
-                                "propertyName": "lastname",
-                                "operator": "CONTAINS_TOKEN",
-                                "value": query
-                            }]
-                        }
-                    ],
-                    "properties": ["email", "firstname", "lastname", "company", "jobtitle"],
-                    "limit": 10
-                }
+        logger.info(f"Found contacts per query: { {q: len(c) for q, c in found.items()} }")
+        with _search_cache_lock:
+            for query, contacts in found.items():
+                _contact_search_cache[_search_cache_key('multi', query)] = contacts
+        data.update(found)
+
+        if errors and not data:
+            return {
+                'success': False,
+                'error': next(iter(errors.values()))
+            }
+
+        result = {
+            'success': True,
+            'data': data
+        }
+        if errors:
+            result['errors'] = errors
+        return result
+
+    except Exception as e:
+        error_msg = f"Error searching HubSpot contacts: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            'success': False,
+            'error': error_msg
+        }
+
+
+def search_hubspot_contact(query, api_key):
+    """
+    Search for contacts in HubSpot by email or name
+
+    Args:
+        query (str): Email address or name to search for
+        api_key (str): HubSpot API key
+
+    Returns:
+        dict: {
+            'success': bool,
+            'data': list of contacts with id, email, firstname, lastname, company
+            'error': str (if success is False)
+        }
+    """
+    cache_key = _search_cache_key('single', query)
+    with _search_cache_lock:
+        cached = _contact_search_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached HubSpot contact search for: {query}")
+        return {
+            'success': True,
+            'data': cached
+        }
+
+    try:
+        url = f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/search"
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+        payload = {
+            "filterGroups": _contact_filter_groups(query),
+            "properties": CONTACT_PROPERTIES,
+            "limit": CONTACT_SEARCH_LIMIT
+        }
 
         logger.info(f"Searching HubSpot for contact: {query}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -154,18 +488,12 @@ def search_hubspot_contact(query, api_key):
             for contact in results:
                 contact_id = contact.get('id')
                 if contact_id not in contacts_dict:
-                    props = contact.get('properties', {})
-                    contacts_dict[contact_id] = {
-                        'id': contact_id,
-                        'email': props.get('email', ''),
-                        'firstname': props.get('firstname', ''),
-                        'lastname': props.get('lastname', ''),
-                        'company': props.get('company', ''),
-                        'jobtitle': props.get('jobtitle', '')
-                    }
+                    contacts_dict[contact_id] = _format_contact(contact)
 
             contacts = list(contacts_dict.values())
             logger.info(f"Found {len(contacts)} unique contact(s)")
+            with _search_cache_lock:
+                _contact_search_cache[cache_key] = contacts
             return {
                 'success': True,
                 'data': contacts
@@ -187,6 +515,142 @@ def search_hubspot_contact(query, api_key):
         }
 
 
+def get_hubspot_contact_by_id(contact_id, api_key):
+    """
+    Fetch a single HubSpot contact by ID
+
+    Args:
+        contact_id (str): HubSpot contact ID
+        api_key (str): HubSpot API key
+
+    Returns:
+        dict: {
+            'success': bool,
+            'data': contact with id, email, firstname, lastname, company, jobtitle
+            'error': str (if success is False)
+        }
+    """
+    try:
+        url = f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/{contact_id}"
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+        params = {
+            'properties': ','.join(CONTACT_PROPERTIES)
+        }
+
+        logger.info(f"Fetching HubSpot contact: {contact_id}")
+        response = _session.get(url, headers=headers, params=params)
+
+        if response.status_code == 200:
+            return {
+                'success': True,
+                'data': _format_contact(response.json())
+            }
+        else:
+            error_msg = f"HubSpot API error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            return {
+                'success': False,
+                'error': error_msg
+            }
+
+    except Exception as e:
+        error_msg = f"Error fetching HubSpot contact: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            'success': False,
+            'error': error_msg
+        }
+
+
+def get_recent_contacts(api_key, limit=5, fields=None):
+    """
+    Get the most recently modified contacts
+
+    Args:
+        api_key (str): HubSpot API key
+        limit (int): Number of contacts to return (default: 5, max: MAX_RECENT_CONTACTS)
+        fields (tuple): RECENT_CONTACT_FIELDS keys to include (default: all).
+            Only the HubSpot properties those fields need are requested.
+
+    Returns:
+        dict: {
+            'success': bool,
+            'data': list of contacts with id and the requested fields
+            'error': str (if success is False)
+        }
+    """
+    limit = min(limit, MAX_RECENT_CONTACTS)
+    fields = tuple(fields) if fields else tuple(RECENT_CONTACT_FIELDS)
+    cache_key = (limit, fields)
+
+    with _search_cache_lock:
+        cached = _recent_contacts_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached recent contacts")
+        return {
+            'success': True,
+            'data': cached
+        }
+
+    try:
+        url = f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts"
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+        properties_param = [prop for field in fields for prop in RECENT_CONTACT_FIELDS[field]]
+        params = {
+            "limit": limit,
+            "properties": ",".join(properties_param),
+            "sorts": "hs_lastmodifieddate",
+            "archived": "false"
+        }
+
+        response = _session.get(url, headers=headers, params=params, timeout=10)
+
+        if response.status_code != 200:
+            error_msg = f"HubSpot API error: {response.status_code}"
+            logger.warning(error_msg)
+            return {
+                'success': False,
+                'error': error_msg
+            }
+
+        contacts = []
+        for result in response.json().get("results", []):
+            properties = result.get("properties", {})
+            contact = {"id": result.get("id")}
+
+            if 'name' in fields:
+                contact["name"] = format_contact_name(properties.get("firstname"), properties.get("lastname"))
+            if 'company' in fields:
+                contact["company"] = properties.get("company", "")
+            if 'email' in fields:
+                contact["email"] = properties.get("email", "")
+
+            contacts.append(contact)
+
+        logger.info(f"Retrieved {len(contacts)} recent contacts")
+        with _search_cache_lock:
+            _recent_contacts_cache[cache_key] = contacts
+        return {
+            'success': True,
+            'data': contacts
+        }
+
+    except Exception as e:
+        error_msg = f"Failed to fetch recent contacts: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            'success': False,
+            'error': error_msg
+        }
+
+
 def create_hubspot_contact(email, firstname, lastname, company, api_key):
     """
     Create a new contact in HubSpot
@@ -224,12 +688,13 @@ def create_hubspot_contact(email, firstname, lastname, company, api_key):
         }
 
         logger.info(f"Creating HubSpot contact: {email}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 201:
             data = response.json()
             contact_id = data.get('id')
             logger.info(f"Successfully created contact with ID: {contact_id}")
+            clear_contact_search_cache()
             return {
                 'success': True,
                 'data': {
@@ -239,7 +704,6 @@ def create_hubspot_contact(email, firstname, lastname, company, api_key):
         elif response.status_code == 409:
             # Contact already exists - parse the existing contact ID
             try:
-                import re
                 response_data = response.json()
                 error_message = response_data.get('message', '')
 
@@ -303,8 +767,6 @@ def convert_text_to_html(text):
     Returns:
         str: HTML formatted text
     """
-    import re
-
     if not text:
         return ''
 
@@ -474,7 +936,7 @@ def log_hubspot_note(contact_id, summary_html, full_notes_html, api_key, deal_id
             log_msg += f" and deal ID: {deal_id}"
         logger.info(log_msg)
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 201:
             data = response.json()
@@ -513,7 +975,9 @@ def get_contact_deals(contact_id, api_key):
 
     Returns:
         list: List of deal dicts with format:
-            [{"id": "123", "name": "Acme Series A", "amount": "5000000", "stage": "negotiation"}]
+            [{"id": "123", "name": "Acme Series A", "amount": "5000000", "stage": "Negotiation",
+              "dealstage": "negotiation", ...}] where stage is the pipeline label and
+            dealstage the internal stage ID
             Returns empty list if contact has no deals or if an error occurs
     """
     try:
@@ -525,7 +989,7 @@ def get_contact_deals(contact_id, api_key):
         }
 
         logger.info(f"Fetching deal associations for contact ID: {contact_id}")
-        associations_response = requests.get(associations_url, headers=headers)
+        associations_response = _session.get(associations_url, headers=headers)
 
         if associations_response.status_code == 404:
             logger.info(f"Contact {contact_id} not found")
@@ -555,7 +1019,7 @@ def get_contact_deals(contact_id, api_key):
             }
 
             logger.info(f"Fetching details for deal ID: {deal_id}")
-            deal_response = requests.get(deal_url, headers=headers, params=params)
+            deal_response = _session.get(deal_url, headers=headers, params=params)
 
             if deal_response.status_code == 200:
                 deal_data = deal_response.json()
@@ -571,7 +1035,7 @@ def get_contact_deals(contact_id, api_key):
                     try:
                         # Fetch pipeline stages to get the label
                         pipeline_url = f"{HUBSPOT_API_BASE}/crm/v3/pipelines/deals/{pipeline}"
-                        pipeline_response = requests.get(pipeline_url, headers=headers)
+                        pipeline_response = _session.get(pipeline_url, headers=headers)
                         if pipeline_response.status_code == 200:
                             pipeline_data = pipeline_response.json()
                             for stage in pipeline_data.get('stages', []):
@@ -586,6 +1050,7 @@ def get_contact_deals(contact_id, api_key):
                     'name': properties.get('dealname', ''),
                     'amount': properties.get('amount', ''),
                     'stage': stage_label,
+                    'dealstage': stage_internal,
                     'next_step': properties.get('hs_next_step', ''),
                     'next_step_date': properties.get('next_steps_date', '')
                 })
@@ -611,9 +1076,18 @@ def search_hubspot_deals(query, api_key):
 
     Returns:
         list: List of deal dicts with format:
-            [{"id": "123", "name": "Acme Series A", "amount": "5000000", "stage": "negotiation"}]
+            [{"id": "123", "name": "Acme Series A", "amount": "5000000", "stage": "Negotiation",
+              "dealstage": "negotiation", ...}] where stage is the pipeline label and
+            dealstage the internal stage ID
             Returns empty list if no deals found or if an error occurs
     """
+    cache_key = _search_cache_key('deals', query)
+    with _search_cache_lock:
+        cached = _deal_search_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached HubSpot deal search for: {query}")
+        return cached
+
     try:
         # Use HubSpot CRM search API
         search_url = f"{HUBSPOT_API_BASE}/crm/v3/objects/deals/search"
@@ -636,7 +1110,7 @@ def search_hubspot_deals(query, api_key):
         }
 
         logger.info(f"Searching HubSpot deals for query: {query}")
-        response = requests.post(search_url, headers=headers, json=payload)
+        response = _session.post(search_url, headers=headers, json=payload)
 
         if response.status_code != 200:
             logger.error(f"Error searching deals: {response.status_code} - {response.text}")
@@ -658,6 +1132,8 @@ def search_hubspot_deals(query, api_key):
             })
 
         logger.info(f"Found {len(deals)} deals matching '{query}'")
+        with _search_cache_lock:
+            _deal_search_cache[cache_key] = deals
         return deals
 
     except Exception as e:
@@ -689,11 +1165,12 @@ def update_hubspot_deal(deal_id, properties, api_key):
         }
 
         logger.info(f"Updating deal {deal_id} with properties: {properties}")
-        response = requests.patch(update_url, headers=headers, json=payload)
+        response = _session.patch(update_url, headers=headers, json=payload)
 
         if response.status_code == 200:
             deal_data = response.json()
             logger.info(f"Successfully updated deal {deal_id}")
+            clear_deal_search_cache()
             return {
                 'success': True,
                 'data': deal_data,
@@ -784,12 +1261,13 @@ def create_hubspot_deal(deal_name, stage, next_step, next_step_date, contact_id,
             ]
 
         logger.info(f"Creating deal: {deal_name} with stage: {stage}, next_step: {next_step}, contact: {contact_id}")
-        response = requests.post(create_url, headers=headers, json=payload)
+        response = _session.post(create_url, headers=headers, json=payload)
 
         if response.status_code == 201:
             deal_data = response.json()
             deal_id = deal_data.get('id')
             logger.info(f"Successfully created deal with ID: {deal_id}")
+            clear_deal_search_cache()
             return {
                 'success': True,
                 'data': {
@@ -874,7 +1352,7 @@ def create_hubspot_task(task_title, contact_id, due_days, api_key):
             ]
 
         logger.info(f"Creating task: {task_title} for contact: {contact_id}, due in {due_days} days")
-        response = requests.post(create_url, headers=headers, json=payload)
+        response = _session.post(create_url, headers=headers, json=payload)
 
         if response.status_code == 201:
             task_data = response.json()
@@ -3,15 +3,39 @@ Notion API Client
 Provides functions for interacting with Notion API v2025-09-03
 """
 
-import requests
+import time
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_BASE = "https://api.notion.com/v1"
 NOTION_VERSION = "2025-09-03"
 
+# Notion allows an average of 3 requests per second per integration
+NOTION_REQUESTS_PER_SECOND = 3
+
+# Shared pooled session so repeated calls reuse TCP+TLS connections and are
+# paced to the API's rate limit
+_session = create_session(requests_per_second=NOTION_REQUESTS_PER_SECOND)
+
+# Notion allows about 3 requests/second per integration, so concurrent to-do
+# creations are capped at 3 in flight instead of bursting the whole batch
+NOTION_MAX_CONCURRENT_TODOS = 3
+_todo_request_slots = threading.BoundedSemaphore(NOTION_MAX_CONCURRENT_TODOS)
+
+# Cache of investor searches, so the confirm flow can reuse the lookup made
+# while building the preview. Entries are served as-is while fresh; after that
+# they are revalidated with a titles-only query (same pages, none edited since)
+# until they expire.
+# Cleared whenever a page is written.
+INVESTOR_SEARCH_FRESH_SECONDS = 60
+_investor_search_cache = TTLCache(maxsize=1024, ttl=15 * 60)
+_investor_search_cache_lock = threading.Lock()
+
 # Allowed dropdown values for validation
 ALLOWED_VALUES = {
     'Check Size': [
@@ -47,6 +71,9 @@ ALLOWED_VALUES = {
     ]
 }
 
+# Frozen copies of ALLOWED_VALUES for constant-time membership checks
+ALLOWED_VALUE_SETS = {category: frozenset(values) for category, values in ALLOWED_VALUES.items()}
+
 
 def validate_dropdown_value(property_name, value):
     """
@@ -59,10 +86,11 @@ def validate_dropdown_value(property_name, value):
     Returns:
         bool: True if valid, False otherwise
     """
-    if property_name not in ALLOWED_VALUES:
+    allowed = ALLOWED_VALUE_SETS.get(property_name)
+    if allowed is None:
         return True  # Allow values for properties without validation rules
 
-    return value in ALLOWED_VALUES[property_name]
+    return value in allowed
 
 
 def search_investor_preferences(company_name, database_id, api_key):
@@ -81,6 +109,16 @@ def search_investor_preferences(company_name, database_id, api_key):
             'error': str (if success is False)
         }
     """
+    cache_key = (company_name.lower().strip(), database_id)
+    with _investor_search_cache_lock:
+        cached = _investor_search_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached['checked_at'] < INVESTOR_SEARCH_FRESH_SECONDS:
+        logger.info(f"Using cached Notion investor search for: {company_name}")
+        return {
+            'success': True,
+            'data': cached['results']
+        }
+
     try:
         url = f"{NOTION_API_BASE}/data_sources/{database_id}/query"
         headers = {
@@ -89,22 +127,44 @@ def search_investor_preferences(company_name, database_id, api_key):
             'Notion-Version': NOTION_VERSION
         }
 
-        payload = {
-            "filter": {
-                "property": "Investor Name",
-                "rich_text": {
-                    "contains": company_name
-                }
+        name_filter = {
+            "property": "Investor Name",
+            "rich_text": {
+                "contains": company_name
             }
         }
 
+        if cached is not None and _investor_search_unchanged(url, headers, name_filter, cached['results'],
+                                                             cached['edited_after']):
+            logger.info(f"Cached Notion investor search still current for: {company_name}")
+            with _investor_search_cache_lock:
+                cached['checked_at'] = time.monotonic()
+            return {
+                'success': True,
+                'data': cached['results']
+            }
+
+        payload = {
+            "filter": name_filter
+        }
+
+        # Notion timestamps are minute-granular, so anything edited from the
+        # minute before this query onwards counts as changed on revalidation
+        edited_after = (datetime.now(timezone.utc) - timedelta(minutes=1)).replace(second=0, microsecond=0)
+
         logger.info(f"Searching Notion for investor: {company_name}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
             results = data.get('results', [])
             logger.info(f"Found {len(results)} matching investor(s)")
+            with _investor_search_cache_lock:
+                _investor_search_cache[cache_key] = {
+                    'results': results,
+                    'edited_after': edited_after.isoformat(),
+                    'checked_at': time.monotonic()
+                }
             return {
                 'success': True,
                 'data': results
@@ -126,6 +186,70 @@ def search_investor_preferences(company_name, database_id, api_key):
         }
 
 
+def _parse_notion_time(timestamp):
+    """Parse a Notion ISO timestamp ("...T12:34:00.000Z") into an aware datetime"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _investor_search_unchanged(url, headers, name_filter, cached_results, edited_after):
+    """
+    Check whether an investor search would still return the cached pages unchanged
+
+    Notion has no conditional (ETag / 304) retrieval, so this re-runs the name
+    query returning only each page's title, then compares page ids and edit
+    times with the cached results. Pages renamed away, archived or newly
+    matching change the id set; edited pages have a newer last_edited_time.
+
+    Args:
+        url (str): Data source query URL
+        headers (dict): Notion request headers
+        name_filter (dict): The investor name filter of the cached search
+        cached_results (list): Pages returned by the cached search
+        edited_after (str): ISO timestamp the cached results are current as of
+
+    Returns:
+        bool: True if nothing matching has changed, False if it has or the check failed
+    """
+    payload = {
+        "filter": name_filter,
+        "page_size": 100
+    }
+
+    try:
+        response = _session.post(url, params={'filter_properties': 'title'}, json=payload, headers=headers)
+        if response.status_code != 200:
+            logger.warning(f"Notion revalidation query failed: {response.status_code}")
+            return False
+
+        data = response.json()
+        if data.get('has_more'):
+            return False
+
+        pages = data.get('results', [])
+        if {page.get('id') for page in pages} != {page.get('id') for page in cached_results}:
+            return False
+
+        current_as_of = datetime.fromisoformat(edited_after)
+        return all(
+            _parse_notion_time(page['last_edited_time']) <= current_as_of
+            for page in pages
+        )
+    except Exception as e:
+        logger.warning(f"Notion revalidation query failed: {str(e)}")
+    return False
+
+
+def clear_investor_search_cache():
+    """
+    Drop all cached investor searches
+
+    Any page write can change which investors a cached query would match
+    (or their properties), so the whole cache is cleared rather than one key.
+    """
+    with _investor_search_cache_lock:
+        _investor_search_cache.clear()
+
+
 def get_page_properties(page_id, api_key):
     """
     Get full properties of a Notion page
@@ -149,7 +273,7 @@ def get_page_properties(page_id, api_key):
         }
 
         logger.info(f"Getting properties for page: {page_id}")
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -220,8 +344,8 @@ def update_page_properties(page_id, properties, api_key):
                 existing_values = [opt['name'] for opt in existing_prop.get('multi_select', [])]
                 new_values = [opt['name'] for opt in new_value.get('multi_select', [])]
 
-                # Combine and deduplicate
-                combined_values = list(set(existing_values + new_values))
+                # Combine and deduplicate, keeping existing values first
+                combined_values = list(dict.fromkeys(existing_values + new_values))
 
                 # Validate values
                 validated_values = []
@@ -281,11 +405,12 @@ def update_page_properties(page_id, properties, api_key):
         }
 
         logger.info(f"Updating page: {page_id}")
-        response = requests.patch(url, json=payload, headers=headers)
+        response = _session.patch(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
             logger.info(f"Successfully updated page properties")
+            clear_investor_search_cache()
             return {
                 'success': True,
                 'data': data
@@ -388,12 +513,13 @@ def create_investor_page(company_name, properties, database_id, api_key):
         else:
             logger.warning("Hubspot Link NOT in page_properties!")
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
             page_id = data.get('id')
             logger.info(f"Successfully created investor page with ID: {page_id}")
+            clear_investor_search_cache()
             return {
                 'success': True,
                 'data': data
@@ -478,7 +604,8 @@ def create_todo_item(task_name, due_date, next_step, database_id, api_key):
         }
 
         logger.info(f"Creating todo item: {task_name}")
-        response = requests.post(url, json=payload, headers=headers)
+        with _todo_request_slots:
+            response = _session.post(url, json=payload, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -0,0 +1,115 @@
+"""
+Parse Cache
+SQLite-backed cache of Claude parse results, keyed by a hash of the notes
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_PATH = os.getenv('PARSE_CACHE_PATH', 'parse_cache.db')
+PARSE_CACHE_TTL_SECONDS = int(os.getenv('PARSE_CACHE_TTL_SECONDS', str(7 * 24 * 60 * 60)))  # Default: 7 days
+
+_connection = None
+_lock = threading.Lock()
+
+
+def _get_connection():
+    """Open the cache database on first use (caller must hold _lock)"""
+    global _connection
+
+    if _connection is None:
+        _connection = sqlite3.connect(PARSE_CACHE_PATH, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS parse_cache ("
+            "key TEXT PRIMARY KEY, "
+            "result TEXT NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        _connection.commit()
+
+    return _connection
+
+
+def make_parse_cache_key(notes_text, parse_preferences, parse_todos, prompt_version='', model=''):
+    """
+    Build the cache key for a parse request
+
+    To-do due dates default to tomorrow inside the prompt, so when to-dos are
+    parsed the key also includes today's date.
+
+    Args:
+        notes_text (str): Raw meeting notes text
+        parse_preferences (bool): Whether investor preferences are parsed
+        parse_todos (bool): Whether to-do items are parsed
+        prompt_version (str): Parser prompt version, so prompt changes miss the cache
+        model (str): Parser model, so switching models misses the cache
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    key_parts = [notes_text, parse_preferences, parse_todos, prompt_version, model]
+    if parse_todos:
+        key_parts.append(date.today().isoformat())
+
+    return hashlib.sha256(json.dumps(key_parts).encode('utf-8')).hexdigest()
+
+
+def get_cached_parse(key):
+    """
+    Look up a cached parse result
+
+    Args:
+        key (str): Key from make_parse_cache_key()
+
+    Returns:
+        dict: The cached parse result, or None on a miss/expired entry/error
+    """
+    try:
+        with _lock:
+            connection = _get_connection()
+            row = connection.execute(
+                "SELECT result, expires_at FROM parse_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            if row[1] < time.time():
+                connection.execute("DELETE FROM parse_cache WHERE key = ?", (key,))
+                connection.commit()
+                return None
+
+        return json.loads(row[0])
+
+    except Exception as e:
+        logger.warning(f"Parse cache lookup failed: {str(e)}")
+        return None
+
+
+def store_parse(key, result):
+    """
+    Store a successful parse result
+
+    Args:
+        key (str): Key from make_parse_cache_key()
+        result (dict): Parse result to cache
+    """
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO parse_cache (key, result, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(result), time.time() + PARSE_CACHE_TTL_SECONDS)
+            )
+            connection.commit()
+
+    except Exception as e:
+        logger.warning(f"Parse cache write failed: {str(e)}")
@@ -9,6 +9,7 @@ let selectedInvestorId = null;
 let selectedInvestorName = null;
 let selectedDeals = []; // Array of selected deals with their data and updates
 let hubspotAction = 'log_only'; // 'log_only', 'log_with_deal', or 'skip'
+let confirmIdempotencyKey = null; // One per preview, so a repeated confirm is never executed twice
 
 // Store submission page action selections
 let submissionPageActions = {
@@ -293,6 +294,7 @@ async function handleProcessNotes() {
 
         // Store the processed data
         processedData = data.preview;
+        confirmIdempotencyKey = newIdempotencyKey();
 
         // Display preview
         displayPreview(data.preview);
@@ -2357,6 +2359,8 @@ async function handleConfirmAndExecute() {
                 update_investor_prefs: shouldUpdateInvestorPrefs && !skipInvestorPrefs,
                 create_todos: shouldCreateTodos,
                 company_name: companyName,
+                // Lets the server update the chosen page without searching Notion again
+                investor_page_id: (investorPageId && investorPageId !== 'CREATE_NEW') ? investorPageId : null,
                 preferences: selectedPreferences,
                 todos: todosToSend
             },
@@ -2368,20 +2372,30 @@ async function handleConfirmAndExecute() {
         if (shouldUpdateInvestorPrefs && !skipInvestorPrefs) updateProgressStep('investor', 'in-progress');
         if (shouldCreateTodos) updateProgressStep('todos', 'in-progress');
 
+        if (!confirmIdempotencyKey) {
+            confirmIdempotencyKey = newIdempotencyKey();
+        }
+
         const response = await fetch('/api/confirm-and-execute', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
+                'Idempotency-Key': confirmIdempotencyKey,
             },
             body: JSON.stringify(payload),
         });
 
-        const data = await response.json();
+        let data = await response.json();
 
         if (!response.ok) {
             throw new Error(data.error || 'Failed to execute updates');
         }
 
+        // Updates run as a background job - poll until it finishes
+        if (response.status === 202 && data.job_id) {
+            data = await waitForJob(data.job_id);
+        }
+
         // Update progress steps based on results
         const results = data.results || {};
         const hubspot = results.hubspot || {};
@@ -2407,12 +2421,49 @@ async function handleConfirmAndExecute() {
         console.error('Error executing updates:', error);
         showPreviewError(error.message || 'Failed to execute updates');
 
+        // The server forgets keys of failed runs; a fresh key makes the retry explicit
+        confirmIdempotencyKey = null;
+
         confirmBtn.disabled = false;
         cancelBtn.disabled = false;
         confirmBtn.textContent = 'Confirm & Execute';
     }
 }
 
+/**
+ * Generate a unique key for the Idempotency-Key header
+ */
+function newIdempotencyKey() {
+    if (window.crypto && typeof window.crypto.randomUUID === 'function') {
+        return window.crypto.randomUUID();
+    }
+    // randomUUID needs a secure context; fall back for plain-HTTP deployments
+    return `${Date.now().toString(16)}-${Math.random().toString(16).slice(2)}`;
+}
+
+/**
+ * Poll a background job until it finishes and return its result
+ */
+async function waitForJob(jobId, intervalMs = 1000) {
+    while (true) {
+        const response = await fetch(`/api/job/${jobId}`);
+        const job = await response.json();
+
+        if (!response.ok) {
+            throw new Error(job.error || 'Failed to get job status');
+        }
+
+        if (job.status === 'done') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Failed to execute updates');
+        }
+
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}
+
 /**
  * Display success message with details (supports both old and new response formats)
  */
@@ -2530,6 +2581,7 @@ function displaySuccess(data) {
  */
 function handleCancel() {
     processedData = null;
+    confirmIdempotencyKey = null;
     selectedContactId = null;
     selectedContactName = null;
     skipHubspot = false;
@@ -2545,6 +2597,7 @@ function handleCancel() {
 function handleNewNotes() {
     // Reset all data state
     processedData = null;
+    confirmIdempotencyKey = null;
     selectedContactId = null;
     selectedContactName = null;
     selectedDeals = [];